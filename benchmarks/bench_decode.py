@@ -0,0 +1,58 @@
+"""Compare decoding throughput of the object and the columnar paths.
+
+python -m benchmarks.bench_decode --rows 200000
+"""
+
+import argparse
+import json
+import time
+from typing import Callable
+
+from seats_aero import decode
+from seats_aero.api import Availability, Route, RouteCatalog
+from seats_aero.jsonstream import iter_json_array
+from seats_aero.synthetic import generate_availabilities, generate_routes
+from seats_aero.table import AvailabilityTable
+
+
+def measure(name: str, rows: int, fn: Callable[[], object]) -> None:
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"{name:<40} {elapsed:8.3f}s {rows / elapsed:12,.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--routes", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"JSON backend: {decode.backend}")
+    raw_routes = generate_routes(args.routes)
+    catalog = RouteCatalog.from_routes([Route.from_dict(r) for r in raw_routes])
+    records = list(generate_availabilities(raw_routes, args.rows))
+    payload = json.dumps(records).encode()
+    chunks = [payload[i : i + (1 << 16)] for i in range(0, len(payload), 1 << 16)]
+
+    measure(
+        "from_dict -> from_availabilities",
+        args.rows,
+        lambda: AvailabilityTable.from_availabilities(
+            Availability.from_dict(r, catalog) for r in records
+        ),
+    )
+    measure(
+        "from_dicts",
+        args.rows,
+        lambda: AvailabilityTable.from_dicts(records, catalog),
+    )
+    measure(
+        "stream -> from_dicts",
+        args.rows,
+        lambda: AvailabilityTable.from_dicts(iter_json_array(chunks), catalog),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Time and peak memory of every stage from raw payload to chart frame.
+
+python -m benchmarks.bench_pipeline --rows 10000 100000 1000000
+python -m benchmarks.bench_pipeline --rows 5000000 --stages parse index --json new.json
+python -m benchmarks.bench_pipeline --compare old.json
+
+Payloads come from seats_aero.synthetic, so nothing touches the network. The
+encoded payload is kept in memory, about 0.7GB per million rows. Each stage is
+timed ``--repeat`` times (best time reported) and then run once more under
+tracemalloc for its peak memory, since tracing slows allocations down.
+"""
+
+import argparse
+import functools
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from seats_aero import decode
+from seats_aero.airport import city_expansion_dict, country_expansion_dict
+from seats_aero.api import Availability, Route, RouteCatalog
+from seats_aero.jsonstream import iter_json_array
+from seats_aero.plot import downsample_route_df, get_route_df
+from seats_aero.query import expand_code, parse_route
+from seats_aero.synthetic import (
+    encode_payload,
+    generate_availabilities,
+    generate_routes,
+)
+from seats_aero.table import AirlineVocabulary, AvailabilityTable, LegIndex
+
+
+@dataclass
+class Fixture:
+    rows: int
+    route: str
+    routes_body: bytes
+    availability_chunks: List[bytes]
+    catalog: RouteCatalog
+    table: AvailabilityTable
+    legs: List[Tuple[str, str]]
+
+
+def make_fixture(rows: int, routes: int, route: str) -> Fixture:
+    raw_routes = generate_routes(routes)
+    catalog = RouteCatalog.from_routes([Route.from_dict(r) for r in raw_routes])
+    chunks = list(encode_payload(generate_availabilities(raw_routes, rows)))
+    table = AvailabilityTable.from_dicts(iter_json_array(chunks), catalog)
+    legs = parse_route(route, True, True).match(table.leg_index.destinations)
+    table.airline_vocabulary
+    return Fixture(
+        rows=rows,
+        route=route,
+        routes_body=b"".join(encode_payload(raw_routes)),
+        availability_chunks=chunks,
+        catalog=catalog,
+        table=table,
+        legs=legs,
+    )
+
+
+def parse_routes(f: Fixture) -> object:
+    return RouteCatalog.from_routes(
+        [Route.from_dict(r) for r in decode.loads(f.routes_body)]
+    )
+
+
+def parse_objects(f: Fixture) -> object:
+    return [
+        Availability.from_dict(r, f.catalog)
+        for r in iter_json_array(f.availability_chunks)
+    ]
+
+
+def parse(f: Fixture) -> object:
+    return AvailabilityTable.from_dicts(
+        iter_json_array(f.availability_chunks), f.catalog
+    )
+
+
+def index(f: Fixture) -> object:
+    leg_index = LegIndex.build(f.table)
+    leg_index.destinations
+    return leg_index, AirlineVocabulary.build(f.table.airline_strings.tolist())
+
+
+def expand(f: Fixture) -> object:
+    # cold caches, including the airport data behind country codes
+    for cached in [
+        parse_route,
+        expand_code,
+        country_expansion_dict,
+        city_expansion_dict,
+    ]:
+        cached.cache_clear()
+    return parse_route(f.route, True, True).match(f.table.leg_index.destinations)
+
+
+def query(f: Fixture) -> object:
+    return get_route_df(f.table, f.legs)
+
+
+def cheapest(f: Fixture) -> object:
+    return get_route_df(f.table, f.legs, cheapest=True)
+
+
+def chart(f: Fixture) -> object:
+    route_df = get_route_df(f.table, f.legs)
+    return downsample_route_df(route_df)
+
+
+STAGES: Dict[str, Callable[[Fixture], object]] = {
+    "parse-routes": parse_routes,
+    "parse-objects": parse_objects,
+    "parse": parse,
+    "index": index,
+    "expand": expand,
+    "query": query,
+    "cheapest": cheapest,
+    "chart": chart,
+}
+
+
+def measure(fn: Callable[[], object], repeat: int) -> Tuple[float, int]:
+    """Best wall time over ``repeat`` runs and peak traced memory in bytes."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--routes", type=int, default=2_000)
+    parser.add_argument("--route", default="US - GB - US, CA - JP, DE - US")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="results file to show relative times to")
+    args = parser.parse_args()
+
+    baseline: Dict[Tuple[int, str], float] = {}
+    if args.compare:
+        with open(args.compare) as f:
+            for result in json.load(f)["results"]:
+                baseline[(result["rows"], result["stage"])] = result["seconds"]
+
+    print(f"JSON backend: {decode.backend}")
+    results = []
+    for rows in args.rows:
+        fixture = make_fixture(rows, args.routes, args.route)
+        for stage in args.stages or list(STAGES):
+            seconds, peak = measure(
+                functools.partial(STAGES[stage], fixture), args.repeat
+            )
+            results.append(
+                {"rows": rows, "stage": stage, "seconds": seconds, "peak_bytes": peak}
+            )
+            before: Optional[float] = baseline.get((rows, stage))
+            relative = f" {seconds / before:6.2f}x" if before else ""
+            print(
+                f"{rows:>10,} {stage:<14} {seconds:9.4f}s"
+                f" {peak / (1 << 20):9.1f}MB peak{relative}"
+            )
+        del fixture
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "numpy": np.__version__,
+                    "json_backend": decode.backend,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,26 @@
-from datetime import datetime, timedelta
+import inspect
+import os
+from datetime import date, datetime, timedelta
 from datetime import datetime as time
-from itertools import product
-from typing import List, Set, Tuple
+from typing import List, Optional, Set, Tuple
 
 import altair as alt
 import humanize
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-from seats_aero.airport import city_expansion_dict, country_expansion_dict
-from seats_aero.api import Availability, Route, partners, partners_mapping
-from seats_aero.plot import get_route_df
+from seats_aero import metrics
+from seats_aero.airport import city_expansion_dict
+from seats_aero.api import RouteCache, partners, partners_mapping
+from seats_aero.engine import ALL_PARTNERS, AvailabilitySource, query_routes
+from seats_aero.itinerary import get_itinerary_df
+from seats_aero.plot import downsample_route_df
+from seats_aero.prefetch import PrefetchScheduler
+from seats_aero.query import RouteQuery
+from seats_aero.shared import SharedAvailabilityStore
+from seats_aero.snapshot import SnapshotStore
+from seats_aero.table import AvailabilityTable
 
 st.set_page_config(
     page_title="Seats.aero Availability Visualizer",
@@ -25,188 +35,407 @@ with st.sidebar:
     partner = (
         st.radio(
             "Partners",
-            partners,
-            format_func=partners_mapping.get,
+            [*partners, ALL_PARTNERS],
+            format_func=lambda p: partners_mapping.get(p, "All partners"),
             label_visibility="hidden",
         )
         or default_partner
     )
 
-
 default_route = "US - LHR - NYC, CA - HKG"
-route = st.text_input("Route", default_route, max_chars=300, key="route").upper()
 
 
-@st.cache_data(ttl=timedelta(minutes=15))
-def load_availabilities(partner: str) -> Tuple[List[Availability], datetime]:
-    routes = Route.fetch()
-    route_map = {r.id: r for r in routes}
-    return Availability.fetch(route_map, partner), time.now()
+cache_ttl = timedelta(minutes=15)
+max_chart_points = int(os.environ.get("SEATS_AERO_MAX_CHART_POINTS", "5000"))
+snapshot_dir = os.environ.get("SEATS_AERO_SNAPSHOT_DIR")
+snapshots = SnapshotStore(snapshot_dir) if snapshot_dir else None
 
 
-availabilities, cache_freshness = load_availabilities(partner)
+@st.cache_resource
+def route_cache() -> RouteCache:
+    # routes are shared by all partners and change rarely
+    return RouteCache(ttl=timedelta(hours=6))
 
-all_possible_routes = set(
-    (a.route.origin_airport, a.route.destination_airport) for a in availabilities
-)
 
-all_fares = ["Y", "W", "F", "J"]
-all_airlines: Set[str] = set()
-for a in availabilities:
-    for fare in all_fares:
-        all_airlines.update(
-            f.strip() for f in a.airlines(fare).split(",") if f.strip() != ""
-        )
+@st.cache_resource
+def availability_source() -> AvailabilitySource:
+    return AvailabilitySource(route_cache(), cache_ttl, snapshots)
 
-col1, col2, col3 = st.columns([3, 3, 2])
 
-with col1:
-    airlines = st.multiselect(
-        "Airlines to include (e.g. UA)",
-        all_airlines,
-    )
+@st.cache_resource
+def shared_store() -> Optional[SharedAvailabilityStore]:
+    if snapshots is None or os.environ.get("SEATS_AERO_SHARED_STORE") != "1":
+        return None
+    store = SharedAvailabilityStore(snapshots, availability_source().fetch, cache_ttl)
+    store.start_refresher()
+    return store
 
-with col2:
-    fares = st.multiselect(
-        "Fares to include (e.g. J)",
-        all_fares,
-    )
 
-with col3:
-    expand_country = st.checkbox(
-        "Expand country",
-        value=True,
-        help="ISO 3166-1 alpha-2 codes. See https://en.wikipedia.org/wiki/ISO_3166-1#Current_codes.",
+@st.cache_resource
+def prefetcher() -> PrefetchScheduler:
+    prefetch_all = os.environ.get("SEATS_AERO_PREFETCH", "1") == "1"
+    scheduler = PrefetchScheduler(
+        availability_source().load, cache_ttl, partners if prefetch_all else []
     )
-    expand_city = st.checkbox(
-        "Expand city",
-        value=True,
-        help=f"Currently only supports {', '.join(city_expansion_dict().keys())}",
+    scheduler.start()
+    return scheduler
+
+
+store = shared_store()
+if store is not None and partner == ALL_PARTNERS:
+    availabilities, cache_freshness = store.get_all(partners)
+elif store is not None:
+    availabilities, cache_freshness = store.get(partner)
+elif partner == ALL_PARTNERS:
+    availabilities, cache_freshness = prefetcher().get_all(partners)
+else:
+    availabilities, cache_freshness = prefetcher().get(partner)
+
+all_fares = ["Y", "W", "F", "J"]
+
+# widget changes rerun a fragment only, so the script above runs once per partner
+# switch; st.fragment is missing from older Streamlit releases
+fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda f: f)
+)
+# itineraries are only searched while their expander is open; releases whose
+# expanders do not report that get a checkbox instead
+expander_state = "on_change" in inspect.signature(st.expander).parameters
+
+
+@st.cache_resource(max_entries=4 * (len(partners) + 1))
+def dataset_summary(
+    partner: str, fetched_at: datetime, _table: AvailabilityTable
+) -> Tuple[List[str], date, date]:
+    """Filter options of one dataset generation: airlines and date span."""
+    # warm the origin index every query goes through
+    _table.leg_index.destinations
+    if len(_table) == 0:
+        today = time.now().date()
+        return [], today, today
+    return (
+        _table.airline_vocabulary.airlines,
+        _table.date.min().item(),
+        _table.date.max().item(),
     )
 
 
-def canonicalize_route(
-    route: str, expand_country: bool = False, expand_city: bool = False
-) -> List[Tuple[str, str]]:
-    route = route.replace(" ", "").replace("->", "-")
-    segs = route.split(",")
-    res = []
-    for seg in segs:
-        stops = seg.split("-")
-        res.extend([(org, dest) for org, dest in zip(stops[:-1], stops[1:])])
-    return expand_route(res, expand_country, expand_city)
-
-
-def expand_route(
-    route: List[Tuple[str, str]], expand_country: bool, expand_city: bool
-) -> List[Tuple[str, str]]:
-    res: List[Tuple[str, str]] = []
-    for org, dest in route:
-        res.extend(
-            product(
-                expand_code(org, expand_country, expand_city),
-                expand_code(dest, expand_country, expand_city),
+def page_bounds(total: int, key: str, page_size: int = 1000) -> Tuple[int, int]:
+    """Render a page picker for ``total`` rows; returns the rows to show."""
+    pages = max((total + page_size - 1) // page_size, 1)
+    page = 1
+    if pages > 1:
+        page = int(
+            st.number_input(
+                f"Page (of {pages})", min_value=1, max_value=pages, value=1, key=key
+            )
+        )
+    start = (page - 1) * page_size
+    return start, min(start + page_size, total)
+
+
+@fragment
+def itinerary_view(
+    availabilities: AvailabilityTable,
+    route_query: RouteQuery,
+    airlines: List[str],
+    fares: List[str],
+    start_date: Optional[np.datetime64],
+    end_date: Optional[np.datetime64],
+    min_seats: int,
+) -> None:
+    if expander_state:
+        expander = st.expander("Itineraries", key="itineraries", on_change="rerun")
+        searching = bool(expander.open)
+    else:
+        expander = st.expander("Itineraries")
+        searching = expander.checkbox("Search itineraries")
+    with expander:
+        col1, col2 = st.columns(2)
+        with col1:
+            min_connection_days = st.number_input(
+                "Min connection days", min_value=0, max_value=14, value=0
+            )
+        with col2:
+            max_connection_days = st.number_input(
+                "Max connection days", min_value=0, max_value=14, value=3
             )
+        if not searching:
+            return
+        itinerary_df, truncated = get_itinerary_df(
+            availabilities,
+            route_query,
+            airlines,
+            fares,
+            int(min_connection_days),
+            int(max_connection_days),
+            start_date=start_date,
+            end_date=end_date,
+            min_seats=min_seats,
         )
-    return res
+        st.write(itinerary_df)
+        if truncated:
+            st.caption(
+                "Only the best itineraries found are shown, narrow the dates or"
+                " connection days to search them all"
+            )
 
 
-def expand_code(code: str, expand_country: bool, expand_city: bool) -> List[str]:
-    if expand_country and code in country_expansion_dict():
-        return country_expansion_dict()[code]
-    if expand_city and code in city_expansion_dict():
-        return city_expansion_dict()[code]
-    return [code]
+@fragment
+def raw_data_view(route_df: pd.DataFrame) -> None:
+    with st.expander("Raw data"):
+        start, stop = page_bounds(len(route_df), "raw_data_page")
+        st.write(route_df.iloc[start:stop])
+        st.caption(f"Rows {start + 1}-{stop} of {len(route_df)}")
+
+
+@fragment
+def missing_route_view(
+    route_query: RouteQuery, displayed_legs: Set[Tuple[str, str]]
+) -> None:
+    with st.expander("Route without availability"):
+        missing_count = route_query.missing_count(displayed_legs)
+        start, stop = page_bounds(missing_count, "missing_route_page")
+        missing = route_query.missing(displayed_legs, start, stop)
+        st.write(
+            pd.DataFrame(
+                [f"{org} -> {dest}" for org, dest in missing], columns=["Route"]
+            )
+        )
+        if missing_count > 0:
+            st.caption(f"Routes {start + 1}-{stop} of {missing_count}")
 
 
-time_since_cache = time.now() - cache_freshness
+@fragment
+def query_view(
+    availabilities: AvailabilityTable,
+    all_airlines: List[str],
+    first_date: date,
+    last_date: date,
+) -> None:
+    route = st.text_input("Route", default_route, max_chars=300, key="route").upper()
 
-canonicalized_route = canonicalize_route(route, expand_city, expand_country)
-filtered_route = [
-    route for route in canonicalized_route if route in all_possible_routes
-]
+    col1, col2, col3 = st.columns([3, 3, 2])
 
-route_df = get_route_df(availabilities, filtered_route, airlines, fares)
+    with col1:
+        airlines = st.multiselect(
+            "Airlines to include (e.g. UA)",
+            all_airlines,
+        )
 
-st.caption(
-    f"Fetched {humanize.intword(len(availabilities))} availabilities {humanize.naturaldelta(time_since_cache)} ago"
-)
+    with col2:
+        fares = st.multiselect(
+            "Fares to include (e.g. J)",
+            all_fares,
+        )
 
-if len(route_df) == 0:
-    st.error("No route found")
-    st.stop()
-
-chart = (
-    alt.Chart(route_df)
-    .mark_point(size=100, filled=True)
-    .encode(
-        y=alt.Y(
-            "fare",
-            axis=alt.Axis(
-                title=None,
-                labels=False,
-                ticks=False,
-                domain=False,
-                domainWidth=0,
+    with col3:
+        expand_country = st.checkbox(
+            "Expand country",
+            value=True,
+            help="ISO 3166-1 alpha-2 codes. See https://en.wikipedia.org/wiki/ISO_3166-1#Current_codes.",
+        )
+        expand_city = st.checkbox(
+            "Expand city",
+            value=True,
+            help=f"Currently only supports {', '.join(city_expansion_dict().keys())}",
+        )
+
+    date_range = st.date_input(
+        "Dates",
+        (first_date, last_date),
+        min_value=first_date,
+        max_value=last_date,
+    )
+    # a range that is still being picked only has its start
+    if not isinstance(date_range, tuple):
+        date_range = (date_range,)
+    start_date = np.datetime64(date_range[0]) if len(date_range) > 0 else None
+    end_date = np.datetime64(date_range[1]) if len(date_range) > 1 else None
+
+    col1, col2 = st.columns([3, 5])
+    with col1:
+        min_seats = int(
+            st.number_input("Min remaining seats", min_value=0, max_value=9, value=0)
+        )
+    with col2:
+        cheapest = st.checkbox(
+            "Cheapest only",
+            value=False,
+            help="Keep only the lowest mileage cost of every route, date and fare.",
+        )
+
+    route_query, filtered_route, route_df = query_routes(
+        availabilities,
+        route,
+        airlines,
+        fares,
+        expand_country,
+        expand_city,
+        start_date,
+        end_date,
+        min_seats,
+        cheapest,
+    )
+
+    if len(route_df) == 0:
+        st.error("No route found")
+        return
+
+    chart_df, bucket_days, dropped_routes = downsample_route_df(
+        route_df, max_chart_points
+    )
+    if bucket_days > 1 or dropped_routes > 0:
+        st.caption(
+            f"Showing {humanize.intcomma(len(route_df))} availabilities as"
+            f" {bucket_days}-day buckets"
+            + (f", {dropped_routes} more routes not shown" if dropped_routes else "")
+        )
+
+    chart = (
+        alt.Chart(chart_df)
+        .mark_point(size=100, filled=True)
+        .encode(
+            y=alt.Y(
+                "fare",
+                axis=alt.Axis(
+                    title=None,
+                    labels=False,
+                    ticks=False,
+                    domain=False,
+                    domainWidth=0,
+                ),
             ),
-        ),
-        x=alt.X(
-            "date:T",
-            axis=alt.Axis(format="%Y-%m-%d"),
-            scale=alt.Scale(zero=False, clamp=True, nice=True),
-        ),
-        color=alt.Color(
-            "fare",
-            legend=alt.Legend(
-                orient="top",
+            x=alt.X(
+                "date:T",
+                axis=alt.Axis(format="%Y-%m-%d"),
+                scale=alt.Scale(zero=False, clamp=True, nice=True),
             ),
-            title="Fare",
-            scale=alt.Scale(
-                domain=["Y", "W", "J", "F"],
-                range=["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728"],
+            color=alt.Color(
+                "fare",
+                legend=alt.Legend(
+                    orient="top",
+                ),
+                title="Fare",
+                scale=alt.Scale(
+                    domain=["Y", "W", "J", "F"],
+                    range=["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728"],
+                ),
             ),
-        ),
-        tooltip=["airlines", "fare", "date", "freshness", "direct"],
-        row=alt.Row(
-            "route",
-            sort=[f"{org} -> {dest}" for org, dest in filtered_route],
-            header=alt.Header(
-                labelAngle=0, labelAlign="left", labelFontSize=14, labelFont="monospace"
+            tooltip=[
+                "airlines",
+                "fare",
+                "date",
+                "freshness",
+                "direct",
+                "partner",
+                "mileage_cost",
+                "remaining_seats",
+                "points",
+            ],
+            row=alt.Row(
+                "route",
+                sort=[f"{org} -> {dest}" for org, dest in filtered_route],
+                header=alt.Header(
+                    labelAngle=0,
+                    labelAlign="left",
+                    labelFontSize=14,
+                    labelFont="monospace",
+                ),
+                title=None,
+                spacing=-10,
             ),
-            title=None,
-            spacing=-10,
-        ),
-        opacity=alt.condition(
-            alt.datum.direct,
-            alt.value(1),
-            alt.value(0.5),
-        ),  # type: ignore
+            opacity=alt.condition(
+                alt.datum.direct,
+                alt.value(1),
+                alt.value(0.5),
+            ),  # type: ignore
+        )
+        .properties(height=alt.Step(12))
+        .interactive()
     )
-    .properties(height=alt.Step(12))
-    .interactive()
-)
 
-st.altair_chart(
-    chart,
-    use_container_width=True,
-    theme=None,
-)
+    # serialising the chart to Vega-Lite is most of the rendering cost
+    with metrics.span("chart"):
+        st.altair_chart(
+            chart,
+            use_container_width=True,
+            theme=None,
+        )
+
+    if any(len(segment) > 1 for segment in route_query.segments):
+        itinerary_view(
+            availabilities,
+            route_query,
+            airlines,
+            fares,
+            start_date,
+            end_date,
+            min_seats,
+        )
+
+    raw_data_view(route_df)
 
-displayed_route = set(route_df["route"].unique())
+    displayed_route = set(route_df["route"].unique())
+    missing_route_view(
+        route_query,
+        {
+            (org, dest)
+            for org, dest in filtered_route
+            if f"{org} -> {dest}" in displayed_route
+        },
+    )
 
-with st.expander("Raw data"):
-    st.write(route_df)
 
-with st.expander("Route without availability"):
+def debug_view() -> None:
+    st.title("Debug")
+    # fragment reruns cannot redraw the sidebar, this reruns the whole script
+    st.button("Refresh")
+    st.write(
+        pd.DataFrame(
+            [
+                {
+                    "span": name,
+                    "last ms": stats.last * 1e3,
+                    "max ms": stats.max * 1e3,
+                    "calls": stats.count,
+                    "total s": stats.total,
+                }
+                for name, stats in sorted(metrics.spans().items())
+            ],
+            columns=["span", "last ms", "max ms", "calls", "total s"],
+        )
+    )
     st.write(
         pd.DataFrame(
             [
-                f"{org} -> {dest}"
-                for i, (org, dest) in enumerate(canonicalized_route)
-                if (org, dest) not in displayed_route and i < 1000
+                {
+                    "counter": name + "".join(f" {k}={v}" for k, v in labels),
+                    "value": value,
+                }
+                for (name, labels), value in sorted(metrics.counters().items())
             ],
-            columns=["Route"],
+            columns=["counter", "value"],
         )
     )
-    if len(canonicalized_route) > 1000:
-        st.write(f"and {len(canonicalized_route) - 1000} more...")
+    st.download_button(
+        "Download metrics", metrics.to_prometheus(), file_name="metrics.txt"
+    )
+
+
+all_airlines, first_date, last_date = dataset_summary(
+    partner, cache_freshness, availabilities
+)
+
+time_since_cache = time.now() - cache_freshness
+st.caption(
+    f"Fetched {humanize.intword(len(availabilities))} availabilities {humanize.naturaldelta(time_since_cache)} ago"
+)
+
+query_view(availabilities, all_airlines, first_date, last_date)
+
+if metrics.enabled:
+    with st.sidebar:
+        debug_view()
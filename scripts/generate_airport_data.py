@@ -0,0 +1,35 @@
+"""Regenerate seats_aero/_airport_data.py from the airportsdata package.
+
+python -m scripts.generate_airport_data
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+import airportsdata
+
+TARGET = Path(__file__).parent.parent / "seats_aero" / "_airport_data.py"
+
+
+def country_to_iata() -> Dict[str, List[str]]:
+    res: Dict[str, List[str]] = {}
+    for code, airport in airportsdata.load("IATA").items():
+        res.setdefault(airport["country"], []).append(code)
+    return res
+
+
+def main() -> None:
+    lines = [
+        "# Generated by scripts/generate_airport_data.py from airportsdata "
+        f"{airportsdata.__version__}, do not edit.",
+        "# IATA codes of each country, space separated, in airportsdata order.",
+        "COUNTRY_TO_IATA = {",
+    ]
+    for country, codes in country_to_iata().items():
+        lines.append(f'    "{country}": "{" ".join(codes)}",')
+    lines.append("}")
+    TARGET.write_text("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# Generated by scripts/generate_airport_data.py from airportsdata 20230323, do not edit.
+# IATA codes of each country, space separated, in airportsdata order.
+COUNTRY_TO_IATA = {
+    "US": "ICY HGZ BYW BDF RFK BCS DUF FOB CEX HED TWE LNI CDL BSW AMK BDX FID GCW ROF GNF GTP GCD FMU ATE AAF ABE ABI ABQ ABR ABY ACB ACK ACT ACV ACY ADG ADT ADM ADS ADW AEL AEX AFF WSG AFN AFO AFW AGC AGO AGS AHC AHH AHN AIA AID AIK AIO AIV AIZ AKO AKC ALB ALI ALM ALN ALO ALS ALW ALX AMA AMN AMW ANB AND ANP ANQ ANW ANY AOH AOO APA APC APF APG APH APN APT APV ARA ARB ARG AUZ ART ARV BFT ASE ASH ASL ASN AST ASX ASY ATL ATS ATW ATY AUG AUM AUN AUO AUS AUW AVL AVO AVP AVW AWM AXG AXN AXS AXV AXX AYS AZO BAB BAD BAF BBB BBD BKG BTN BBW BCB BCE BCT BDE BDL BDR BEC BED BEH BFD BFF BFI BFL BFM BFR BGD BGE BGM BGR BHB BHM BID BIE BIF BIH BIL BIS BIX BJC BJI BKD BKE BFK BKL BWL BKT BKW BKX BLF BLH BLI BLU BLV BMC BMG BMI BML BMT BNA BNG BNL BNO BNW BOI BOS BOW BPI WMH BPT BQK BRD BRL BRO BRY BTF BTL BTM BTR BTV BTY BUB BUF BUM BUR BFP BVO BLD BVX BVY BWC BWD BWG BWI WAH BXA BXK NHZ BYS BBC BZN CAD CAE CAK CAO CBE CBF CBK CBM CCB CCR CCY LLX CDC CDH CDK CDN CDR CDS CDW CEC CEF CEZ CGI CHA CHO CHS CID CIN CIU CKB CLE CLL CLM CLT CMH CMI CMX CNM COD COS COU CPR CRP CRW CSG CVG CVN CWA KIP CWF CYS DAA DAB DAG DAL DAN DAY DBN DBQ DCA DCU DDC DEC DEH DEN DET DFI DFW DGL DGW DHN DHT DIK DLH DNL DPA DPG DRO DRT DSM DSV DTA DTL DTN DSI DTW DUA DUC DUG DUJ DVL DVN DVT DWH DXR DYL DYS CCG BGQ BGT EAR EAT EAU EBS ECG ECP EEN EFK EGE EKO ELD ELM ELP END ENV ERI EUG EVV EVW EWB EWK EWN EWR EYW FAR FAT FAY FBG FCS FFO FRD FHU FKN FLG FLL FLO FNT FOD FOE FIL FPR FPY FRH FRI FRM FSD FSI FSM FMS FTW FUL FWA FYV GAB GAG GBD GCC GCK GCN GDV GEG GFK GGG GGW IDH GJT GLH GLS GNV GON FCA GPT GRB GRI GRK GRR GSO GSP GTF GTR GUC GUP GVT HDN HGR HIB HIO HKY HLN HON HOT HOU HPN HRL HRO HNC HSV HTS HUF HVN HVR HHH HYA HYS IAB IAD IAG IAH ICT IDA XPR IFP IGM ILG ILM IMT IND INL INT IPL IPT IRK ISP ITH AZA IYK JAC JAN JAX JBR JFK JLN JMS USA JST BXS LAF LAN LAR LAS LAW LAX LBB LBE LBF LBL LCH LEB LEX LFT LGA LGB LIT LMT LNK LNS BBX LRD LRU LSE LUK LWB LWS LWT LYH MAF MBS MCE MCI MCN MCO MCW MDD MDH MDT MDW MEI MEM MFE MFR MGM MGW MHK MHT MHV MIA MIE MKC MKE MKG MKL MLB MLI MLS MLU MMH MMU MOB MOD MOT RMY MPV MRY MSL MSN MSO MSP MSS MSY MTJ MVL MVY MYR DGN NEL NJK YUM NVN ODC EYR OAJ OAK OAR OGD OGS OKC OLD OLM OMA ONT ORD ORF ORH ORL ESD MPS OSH OTH OTM OWB BSQ HBK CWX PAE PAH PBG PBI PDK PDX PFC PGA PGV PHF ADR PHL PHX PIA PIB PIE PIH PIR PIT PKB PLN PMD PNS POU PQI PRC PSC PSM PSP PTK PUB PUW PVD PVU PWM PWT RAP RCT RDD RDG RDM RDU RFD RHI RIC RKD RKS RNO ROA ROC ROW RST RSW RUT RWI RXE AHM BDY SUO SAC SAF SAN SAS SAT SAV MQT SBA SBN SBP SBY SDF SDY SEA SFB SFO SGF UST SGU SHD SHR SHV SJC SJT SLC SLK SLN SMF SMX SNA SOW SPI SPS SRQ STC STL STP STS SUN SUX SVC SWF SWO SYN SYR SZP TAD TBN TCL TEX THM TLH TMB OTK ASQ TOL TOR TPA TPL PTA TRI TTN TUL TUP TUS TVC TVL TWF TXK TYR TYS BFG RVR ICS UIN ATO SCE VAD VCT VLD VPS VRB VSF WAL WAY WRI WRL XNA XWA YIP YKM YNG ZPH ZZV AKB PML PAQ BTI BET BVU BIG BKC BMX BRW BTT CDB CEM CHU CIK SCM IRC CDV CZF DRG RDB ADK DLG MLL ADQ DUT EDF EEK EHM EIL EMK ENA FAI FBK ABL GAL GKN GLV GAM GST SGY GMT HCR HNS HOM HPB SHX IGG EGX IAN ILI UTO WAA JNU KFP AKK KKA AKN IKO AKP KTN UUK KAL AKW KYK KLG LUR KMO MCG MLY MOU MRI MYU WNA ANC ANI ENN ANN ANV KNW OBU PCA HNH OME OOK ORT OTZ PBV KPC PSG PTH PKA PTU PIP PHO NUI ARC RBY SVA SCC SDP SHH SIT SQL KSM SNP SMU UMM SVW SXQ SYA TAL TNC TOG TLJ ATK AUK UMT UNK VAK KVC VDZ VEE KVL WBQ SWD WRG AIN WTK WWA YAK AKI AET NCN CLP ELI KNK KOT KYU KWT ORV SKK TKJ WSN FYU BKH HDH HHI HNM JHM JRF KOA LIH LUP MKK MUE HNL LNY OGG PAK BSF ITO UPP PIZ STT STX ARE BQN CPX SIG MAZ PSE SJU VQS DTR",
+    "SB": "AFT RNA ATD VEV BPF GEF AKS BNY CHY BAS FRE HIR MBU AVU IRA SCZ MUA GZO MNY PRS RNL EGM NNB RUS VAO XYA KGE KWS GTA RIN RBV",
+    "NR": "INU",
+    "PG": "ATP AMU ADC AIE KPM AUJ AWB AYU VMU BDZ BUA OPU BUL CMU DER DAU XYR FNE FIN FAQ GKA GRL GAR GUR GAP PNP GMI GVI HKN KIE LSA KBM KDR UNG KRI KMA KKD KZF KUQ KVG KWO LNV LMY LWI LMI MYX MAG HGU MXK GUV MDU MAS MXH MIS GBF MFO UKU LAE OGE OSE PDI POM KRJ RMN KMR SBE NIS SIL SIM SKC TIZ TBG TFM TPI TAJ RAB TKW TFI VAI WAO WBM AGL WWK WOA WSU WTP WUG",
+    "GL": "JEG UAK CNP GOH JAV KUS JSU JFR NAQ SFJ JHS THU JUV JQA",
+    "IS": "AEY BIU BGJ BJD BLO BXV DJU EGS FAS FAG GUU GJR GRY HVK HFN FLI HZK IFJ KEF OPA SAK NOR OFJ PFJ RHA OLI RFN RKV MVA SIJ SYK TEY THO VEY VPN ETM",
+    "CA": "YZZ YAA DGF JHL DUQ YWM YFX YHA YRG DVK YCK YLE NML DAS YFI SUR YAX WNN YNO XBE KIF YOG YEB YHP YNX YKU ZTB YAU ZLT YAC YAR YAG YAH YAL YAM XKS YKG YAT YAY YAZ YBA YBB YBC QBC YBE YBY YBG YBK YBL XTL YBR YBT YBV YBX YRF YCB YCC YCD YCE YCG YCH XCM YCL YCN YCO YCQ YCR YCS YCY YCZ YDA YDB YDF XRR YDN YDO YDP YDQ YEG YEK YEL YEM YEN YER YET YEU YEV YEY YFA YFB YFC YFE YFH YTM YFO YFR YFS YMN YGB YGH YGK YGL YGM YGO YGP YGQ YGR YGT YGV YGW YGX YGZ YQC YHD YHE YHF YNS YHI YHK YHM YHN YHO YHR YHT YHU YHY YHZ YIB YDG YIF YIK YIO YIV YJF YJN YJT YKA LAK YKF YKJ YKL AKV YKQ YKX YKY YKZ YPJ YLC YLD YLH YLJ YSG YLL YLR YLK YLT XGR YLW YMA YME YMG YMH YMJ YML YMM YMO YMT YUD YMX YNA YNC YND YNE YNL YNM YNN HZP YOA YOC YOD YOH YOJ YOO YOP YOS YOW YPA YPC YPS YPE YPG YPH YPL YPM YPN YPO YPQ YPR YPW YPX YPY YQA YQB YQD YQF YQG YQH YQI YQK YQL YQM YQN YQQ YQR YQS YQT YQU YQV YQW YQX YQY YQZ YRA YRB YRI YRJ YRL YRO YRQ YRS YRT YRV YSB YSC YSF YSH YSJ YSK YSL YSM YCM YSP YST YSU YSY YTA YTE YTF YTH YTL YTQ YTR YTS YTZ YUB YUL YUT YUX YUY YVB YVC YVE YVM YVO YVP YVQ YVR YVT YVV YVZ YWA YWG YWJ YWK YWL YWP YWY YXC YXD YXE YXH YXJ YXK YXL YXN YXP YXQ YXR YXS YXT YXU YXX YXY YXZ YYB YYC YYD YYE YYF YYG YYH YYJ YYL YYN YYQ YYR YYT YYU YYW YYY YYZ YZE YZF YZG YZH YZP YZR YZS YZT YZU YZV YZW YZX YZY ZAC YSN YDT ILF ZBF ZBM KES ZEM ZFA ZFD XPK ZFM ZFN ZGF ZGI ZGR ZJG ZJN ZKE YTD MSA ZMH PIW ZMT XPP ZPB ZPO ZRJ ZSJ XSI ZST ZTM ZUC ZUM XLB ZWL",
+    "DZ": "BUJ BJA ALG DJG VVZ QSF TMR GJL MZW AAE CZL TEE BLJ HRM TID TIN CFK TAF TLM ORN CBH BFW MUW EBH INF BMW AZR BSK ELG GHA HME INZ TGR LOO ELU TMX OGX IAM",
+    "BJ": "COO DJA KDC NAE PKO SVF",
+    "BF": "XKY OUG XDJ XLU PUP XBO XBG DIP DOR FNG XGG XKA TMQ XPA ARL XSE TEG XZA OUA BNR DGU XGA XNU BOY TUQ XDE XAR",
+    "GH": "ACC TML KMS NYI TKD",
+    "CI": "ABJ OGO BXI BYK BQO BDK DIM DJO FEK GGN GGO BBV HGO MJC KEO OFI SEO SPY ZSS TXU ASK",
+    "NG": "ABV AKR ABB BNI CBQ ENU GMO IBA ILR QOW JOS KAD KAN MIU MDI LOS MXJ PHC SKO YOL ZAR",
+    "TN": "NBE TBJ MIR TUN GAF GAE DJE EBM SFA TOE",
+    "NE": "MFQ NIM THZ AJY ZND",
+    "TG": "LRL LFW",
+    "BE": "ANR BRU CRL KJK LGG OST OBL",
+    "DE": "AOC HDF REB CSO BBH CBU GTI PEF BER DRS ERF FRA FMO HAM CGN DUS MUC NUE LEJ SCN STR TXL HAJ BRE HHN MHG SGE XFW KEL LBC EUM FMM AAH BNJ ESS BFE MGL PAD NRN DTM AGB OBF RBM FDH SZW BYU HOQ BBJ ZQW FKB LHA BWE KSF BRV XLW EME AGE WVN JUI LGO BMK NOD VAC NRD BMR HEI FLF HGL PSH GWT OHR SPM RMS FRZ GKE RLG WBG FNB WIE FEL IGS GUT BGN",
+    "EE": "KDL URE EPU TLL TAY",
+    "FI": "ENF KEV HEM HEL HYV KTQ IVL JOE JYV KAU KEM KAJ KHJ KOK KAO KTT KUO LPP MHQ MIK OUL POR RVN SVL SJY SOT TMP TKU UTI VAA VRK YLI",
+    "GB": "BFS ENK BHD LDY BHX CVT GLO ORM NQT MAN DSA UPV LYE YEO CAL EOI FIE WHS COL NRL OBN PPW SOY NDY LWK WRY CSA HAW CWL SWS BRS LPL LTN LEQ PLH ISC BOH SOU BBP NQY QUG ESH BQH LGW LCY FAB BBS LHR SEN LYX MSE CAX BLK HUY BWF LBA CEG NCL MME EMA KOI LSI WIC ABZ INV GLA EDI ILY PIK BEB SCS DND SYY BRR PSL TRE UNT BOL FSS ADX LMO CBG NWI STN HYC EXT FZO OXF RCS BEX LKZ MHZ QUY FFD BZZ ODH NHT QCY BEQ OKH SQZ HRT WTN MRH SKL",
+    "GG": "ACI GCI",
+    "JE": "JER",
+    "IM": "IOM",
+    "FK": "MPN PSY",
+    "NL": "AMS MST EIN GRQ GLZ DHR LEY LWR RTM ENS UDE WOE",
+    "IE": "BYT BLY NNR ORK GWY CFN DUB IOR INQ KKY NOC KIR LTR IIA SNN SXL WAT",
+    "DK": "AAR BLL CPH EBJ KRP BYR MRW ODE RKE RNN SGD CNL SKS SQW TED STA AAL",
+    "FO": "FAE",
+    "LU": "LUX",
+    "NO": "AES ANX ALF FDE BNN BOO BGO BJF BVG KRS BDU EVE VDB FRO OSL HMR HAU HFT HAA HVG KSU GLL KKN LKN MEH MOL MJF LKL OSY NTB OLA HOV MQN RVK RRS RET RYG LYR SDN SOG SVJ SKN SKE SRP SOJ VAW SSJ TOS TRF TRD VDS SVG",
+    "PL": "BXP BZG GDN KRK KTW OSZ LUZ LCJ WMI POZ CZW RZE SZZ WAW WRO IEG",
+    "SE": "RNB GOT JKG LDK GSE KVB THN KSK MXX NYO KID OSK KLR MMX HAD VXO EVG GEV KRF LYC SDL OER KRN SFT UME VHM AJR SOO OSD ORB HFS KSD VST LLA ARN BMA BLE HLF GVX LPI NRK TYF EKT VBY VVK AGH SQO IDB PJA HMV",
+    "LV": "DGP LPX RIX VNT",
+    "LT": "KUN PLQ PNV SQQ HLJ VNO",
+    "ZA": "ALJ AGZ ADY BIY BFN CDO CPT DUK PZL ELS EMG ELL FCB GCJ GRJ GIY QRA HLW HRS HDS KXE KIM MQP KOF KMH KLZ HLA LMR LDZ DUR LCD SDB LAY AAM MGH MEZ MBD LLE MZY MZQ NCS NGL NLP OVG OUH JNB AFD PLZ PBZ PHW JOH PRK PZB NTY PTG PCF UTW RCB RVO ROD SBU ZEC GSS SIS SZK TDT THY TCU LTA ULD UTN ULX UTT VRU VIR VRE VYD PRY WKF WEL",
+    "BW": "FRW GNZ JWA BBK KHW MUB ORP GBE SXN PKW SWX TLD TBY",
+    "CG": "BZV DJM KNJ LCO MUY SIB NKY ANJ MSX BOE EWO GMM ION KEE MKJ FTX SOE BTB OUE KMK DIS PNR",
+    "SZ": "MTS",
+    "CF": "CRF BGF BGU IRO BEM BBY NDL BOP BIV BSN BBT ODA AIG IMO MKI BTG GDI BMF ODJ RFA BCF BOZ",
+    "GQ": "BSG SSG",
+    "SH": "ASI",
+    "MU": "MRU RRG",
+    "CM": "NKS KBI TKC DLA MMF BLC KLE OUR GXX MVR FOM NGE BTA GOU DSC BFX BPC EBW YAO NSI",
+    "ZM": "MMQ CIP JEK ZKP LUN KLB KMZ KAA ZKB LVI LXU MNS MFU MNR ZGM NLA SXG KIW SJQ SLI BBZ",
+    "KM": "HAH NWA YVA AJN",
+    "YT": "DZA",
+    "RE": "RUN ZSE",
+    "MG": "WML ATJ WAQ VVB TNR JVA BMD ZVA MXT ILK TVA SMS TMM WTA MOQ WTS VAT WAM DIE WMR ZWA AMB WBD WPB ANM IVA HVA MJN NOS DWB WMP BPY WMN SVB TTS VOH WAI WMA WBO WMD FTU WFI RVA IHO MJA WVK OVA MNJ TDV MXM TLE VND BKU AMP WAK",
+    "AO": "AZZ SSY BUG CAB CFF PGI CBT CTI CAV DUE VPE NOV SVP LAD MEG SPP MSZ GXG PBN VHC SZA NDD UAL SDD LUO UGO CEO XGN ARZ",
+    "GA": "BGB KDN FOU MBC MGX KDJ KOU MJL OYE OKN LBQ MVX BMM MFF MKB POG OMB MKU LBV MZC MVB LTL TCH MYB",
+    "ST": "PCP TMS",
+    "MZ": "ANO BEW FXO VPY IHC INH VXC LFB MPM MUD MZB MNC APL POL UEL TET VNX VJB",
+    "SC": "DES SEZ PRI BDI DEI FRK",
+    "TD": "SRH OGR AEH MQQ LTC ATV NDJ BKR OTC MVO AMC PLF OUT AMO FYT",
+    "ZW": "BUQ CHJ BFO VFA HRE KAB UTA MVZ GWE HWN WKI",
+    "MW": "CEH BLZ CMK DWA KGJ KBQ LLW LIX MAI MYZ LMB ZZU",
+    "LS": "LEF LRB LES MFC MKH MSU NKU PEL UTG UNE SHK SKQ SOK SHZ THB TKO",
+    "NA": "ADI GOG GFY MPA KMP LUD OKU NNI OND OMG OMD OKF NDU SWP TSB WVB ERS WDH",
+    "CD": "FIH NLO MNB BOA LZI MAT NKL INO NIO FDU KRZ KKW IDF LUS MSM MDK BSU LIE BDT GMA KLI BMB LIQ BNB IKL FKI YAN IRP BUX BZU BKY RUE GOM BNC KND KLY PUN FBM PWO KEC KWZ MNO BDV FMI KBO KOO KMN KAP KNM KGA LZA TSH LJA LBO MEW BAN PFR MJM GDJ KBN",
+    "ML": "BKO GUD GAQ KNZ KTX KYS MZI NRM NIX KSS TOM EYL",
+    "GM": "BJL",
+    "ES": "FUE GMZ VDE SPC LPA ACE TFS TFN MLN ABC ALC LEI OVD ODB BIO RGS BCN BJZ CDT LCG ILD GRO GRX IBZ XRY MJV LEN RJL MAD AGP MAH RMU OZP PMI PNA REU ROZ SLM EAS SCQ LEU TOJ VLC VLL VIT VGO SDR ZAZ SVQ",
+    "SL": "BTE KBS GBK HGS KBA KEN FNA WYE",
+    "GW": "BQE OXB",
+    "LR": "UCN CPA SNI MLW NIA ROB SAZ THC VOI",
+    "MA": "AGA TTA OZG UAR FEZ ERH MEK OUD GMD RBA SII ESU CMN NDR RAK NNA OZZ AHU TTU TNG",
+    "EH": "SMW VIL EUN",
+    "SN": "DSS KDA ZIG CSK KLC DKR MAX POD RDT XLS BXE KGG SMY TUD",
+    "MR": "AEO OTL THI TIY BGH KFA TMD EMN AJJ KED MOM NKC SEY THT ATR FGD NDB OUZ",
+    "GN": "CKY FIG FAA KSI LEK MCA NZE BKJ SBI GII KNN",
+    "CV": "SID NTO BVC BVR MMO MTI RAI SFL SNE VXE",
+    "ET": "ADD AMH AXU BCO BJR BEI DSE DEM DBM DIR DBT FNH GOB GNN GMB GDQ GDE GOR HUE JIJ JIM ABK LFO AWA LLI MQX NDM MTF NEJ NEK SXU ASO TIE WAC",
+    "BI": "BJM GID KRE",
+    "SO": "ALU BIB CXN BSY HCM BSA GSR HGA BBO KMU MGQ CMO GLK CMS ERA BUO",
+    "DJ": "JIB AII MHI OBC TDJ",
+    "EG": "SEW DBB AAC ATZ ALY HBE ABS CAI DAK HRG UVL LXR RMF HMB MUH GSQ PSD SKV SSH ASW SPX TCP ELT",
+    "ER": "ASM MSW ASA TES",
+    "KE": "ASV EDL EYS KLK GAS HOA NBO GGM KIS ILU KEY KTL LKG LOK LAU LOY NDE RBT JJM MYD MBA MRE OYL NYE NUU WIL NYK UAS UKA WJR",
+    "LY": "SRX TOB GHT AKF BEN MJI LAQ SEB TIP LMQ HUQ LTD WAX",
+    "RW": "GYI BTQ KGL RHG KME",
+    "SD": "ATB EDB DOG RSS ELF GSU DNX EGN KSL GBU KST KDX MWE NUD UYL NHF EBD PZU KRT WHF",
+    "SS": "RBX JUB MAK WUU",
+    "TZ": "ARK BKZ DAR DOD IRI TKQ KIY JRO LDI LKY MFA MBI MWN XMI MYW MUZ MWZ NCH JOM PMA SEU SGX SUT SHY TBO TGT ZNZ",
+    "UG": "RUA EBB ULU JIN KBG KSE MBQ KCU PAF SRT TRY",
+    "MH": "MIJ MAJ KWA",
+    "AL": "TIA",
+    "BG": "BOJ GOZ JAM PDV SOF SLS SZR VAR",
+    "CY": "ECN LCA PFO AKT",
+    "HR": "DBV LSZ OSI PUY RJK BWK SPU ZAG ZAD",
+    "FR": "DPE CQF BYF LTQ AGF BOD EGC CNG LRH PIS MCU LIG NIT TLS PUF LDE ANG BVE PGX BIQ ZAO LBI DCM RDZ RYN RCO IDY CMR DLE MVV OBS LPY AHZ ETZ ANE BIA CLY FSC AJA PRP SOZ MFX AUF CMF CFE BOU CVF LYS SYT RNE NCY GNB VAF VHY AUR CHR LYN CEQ EBU CCF MRS NCE PGF CTT BAE MPL BZR AVN GAT MEN SCP BVA EVX LEH ORE XCR LSO URO TUF CET LVA LBG CSF CDG TNF ORY POX VIY NVS LIL HZB BES CER DNR LBY GFR DOL LRT EDM LDV CFR LME RNS LAI UIP NTE SBK MXN VNE SNR BSL DIJ MZM EPL ENC RHE SXB VTL TLN FNI LTT",
+    "PM": "MQC FSP",
+    "GR": "PYR AGQ AXD HEW ATH VOL JKH PKH JIK IOA HER KSO KIT EFL KZS KLX KGS AOK CFU KSJ KVA KZI LRS LXS LRA JMK MLO MJT JNX PAS JTY PVK RHO GPA CHQ JSI SMI JSY SPJ JTR JSH SKU SKG ZTH",
+    "HU": "BUD DEB MCQ PEV QGY SOB TZR QZD",
+    "IT": "CRV BRI FOG TAR LCC PSR BDS SUF CIY CTA LMP PNL PMO REG TPS NSY BLX RAN ZIA AHO DCI CAG OLB FNU TTB MXP BGY TRN ALL GOA LIN PMF AOT CUF AVB BZO UDN BLQ TSF FRL VBS TRS RMI VIC VRN AOI VCE LCV SAY CIA FCO QSR EBA NAP PSA FLR GRS PEG",
+    "SI": "LJU MBX POW",
+    "CZ": "GTW UHE KLV MKA OSR PED PRV PRG BRQ ZBE",
+    "IL": "TLV BEV ETH EIY HFA RPN KSW MTZ VTM VDA MIP SDV YOT",
+    "MT": "MLA",
+    "AT": "HOH GRZ INN KLU LNZ SZG VIE",
+    "PT": "SMA BGC BYJ BGZ CHV CBP CVU COV FLW FAO GRW HOR TER FNC PDL PIX PRM OPO PXO LIS SIE SJZ VRL VSE",
+    "BA": "BNX OMO SJJ TZL",
+    "RO": "ARW BCM BAY BBU CND CLJ CSB CRA IAS OMR OTP SBZ SUJ SCV TCE TGM TSR",
+    "CH": "GVA QLS QNC SIR ZIN LUG BRN BXO ZHI ZRH ZJI MLH ACH SMV",
+    "TR": "ESB ANK ADA UAB AFY AYT GZT KFS KYA MZH SSX VAS ONQ MLX ASR TJK DNZ NAV ISL CII BTZ BZI BDM CKZ ESK ADB IGL USQ KCO YEI DLM TEQ BXN AOE KZR EZS OGU DIY ERC ERZ KSY TZX SFQ VAN BAL MSR SXZ NOP KCM AJI ADF MQM GNY IGD YKO HTY ISE EDO BJV GZP SZF SAW GKD IST",
+    "MD": "BZY KIV",
+    "MK": "OHD SKP",
+    "GI": "GIB",
+    "RS": "BEG BJY INI QND UZC QWV ZRE",
+    "ME": "IVG TGD TIV",
+    "XK": "PRN",
+    "SK": "BTS KSC LUE PZY POV SLD TAT ILZ",
+    "TC": "GDT MDS NCA PIC PLS XSC SLX",
+    "DO": "BRX CBJ AZS COZ JBQ LRM PUJ EPS POP SNX SDQ STI",
+    "GT": "CBV CIQ CMM CTF DON GUA HUG MCR PBR PCG PKJ PON AQB AAZ RUV LCF RER GSJ FRS UAX",
+    "HN": "AHS BHG CAA CDD JUT LCE LEZ SAP GJA PEU XPL RTB SDH RUY TEA TGU TJI SCD UII",
+    "JM": "OCJ KIN MBJ POT NEG KTP",
+    "MX": "ACA NTR AGU HUX CNA CVJ ACN CME NCG CUL CTM CEN CJT CPE CJS CZA CUU CVM CYW CZM CUA MMC DGO TPQ ESE GDL GYM GUB TCN HMO CLQ ISJ SLW IZT JAL AZP LZC LMM BJX LAP LTO MAM MID MUG MXL MLM MTT LOV MEX MTY MZT NOG NLD OAX PAZ PBC PPE PDS PCO UPN PQM PVR PXM QRO REX SZT SJD SFH NLU SLP TRC TGZ TIJ TAM TSL TLC TAP WIX CUN VSA VER ZCL ZIH ZMM ZLO",
+    "NI": "BEF BZA RNI MGA NVG PUZ RFS NCR SIU WSP",
+    "PA": "BOC CTD CHX DAV ONX JQE PLP PAC BLB SYP RIH PTY NBL",
+    "CR": "FON TTQ BAI BCL CSC OTR RIK DRK FMG GLF GPL PBP LIR LSL LIO NCT NOB SJO PJM PMZ SYQ XQP RFR PLD TOO TNO TMU UPL",
+    "SV": "SAL",
+    "HT": "CYA CAP JAK JEE PAP PAX",
+    "CU": "BCA BWW BYM AVI CCC CFG CYO CMW QCO SCU NBW GAO HAV HOG VRO LCL UMA MJG MOA MZO QSN ICR GER UPB QPD SNU SNJ SZJ USS TND VRA VTU",
+    "KY": "CYB LYB GCM",
+    "BS": "MAY ASD COX MHH SAQ AXP TCB WKR CCZ GHC BIM ATC CAT CXY CRI PWN GGT ELH GHB NMC RSD TYM FPO WTD IGA LGI SML MYG NAS PID DCT RCY ZSA",
+    "BZ": "BZE",
+    "CK": "AIT AIU MGS MHX MUK MOI PYE RAR",
+    "FJ": "ICI BFJ NAN PTF KDV MNF MFJ SUV LEV NGI LUC LKB LBS TVU KXF RTA SVU VAU KAY ONU YAS VBV VTF",
+    "TO": "EUA TBU HPA NIU NTT VAV",
+    "KI": "ABF BEZ KUC MNK MZK MTK NIG OOT TRW AEA TBF TMN NON AIS TSU BBG AAK CIS CXI TNV",
+    "TV": "FUN",
+    "NU": "IUE",
+    "WF": "FUT WLS",
+    "WS": "AAU APW FGI MXS",
+    "AS": "FTI PPG",
+    "PF": "PPT RUR TUB RVV AAA FGU TIH APK REA FAV HHZ XMH GMR KKR MKP NAU TKV PKP PUK TKP AXR MVT NUK ZTA AHE KHZ FAC FHZ RKA RRR TKX NHV AUQ UAP UAH BOB TTI RGI HUH MOZ HOI MAU RFP VHZ",
+    "VU": "MTV SLH TOH EAE CCV LOD SSR PBJ LPM LNB MWF LNE NUS ZGU RCL SON TGH ULB VLS WLH SWJ OLJ AUY AWD DLY FTA IPA UIQ VLI TAH",
+    "NC": "TGJ BMY KNQ ILP HLU KOC LIF GEA IOU PUV PDC MEE TOU UVE NOU",
+    "NZ": "AKL TUO AMZ ASG CHC CHT CMV DGR DUD WHO GBZ GMN GIS GTN HKK HLZ WIK KBZ KKE KKO KAT ALR MTA MON MFN MZP TEU MRO NPL NPE NSN IVC OHA OAM PMR PCN PPQ ZQN RAG SZS ROT TRG TMZ KTF TKZ THH TIU TWZ BHE WKA WHK WLG WIR WRE WSZ WTZ WAG",
+    "AF": "BIN BST CCN DAZ FAH FBD KWH HEA OAI JAA KBL KDH KHT MMZ MZR LQN OAS OAH SGA TII UND OAZ ZAJ",
+    "BH": "BAH",
+    "SA": "AHB HOF ABT BHH DMM DHA DWD GIZ ELQ URY HAS QJB JED HBT KMX MED EAM NUM AQI AKH RAH RUH RAE XXN SHW AJF SLF TUU TIF TUI WAE EJH YNB ZUL",
+    "IR": "ABD DEF OMI MRX AWZ AEU BUZ AOY KNR KIH BDH YEH KHK SXI LVP KSH IIL KHD SDG IFH IFN CQD RAS HDM AJK IKA THR BND KER BXR HDR RJN SYJ XBJ CKT RUD MHD BJB AFZ TCX BBL GBT BSM NSH RZR SRY FAZ LRR SYZ KHY ADU ACP PFQ OMH TBZ AZD ACZ ZBR ZAH",
+    "JO": "AMM ADJ AQJ OMF",
+    "KW": "KWI",
+    "LB": "BEY KYE",
+    "AE": "AUH AZI AAN DHF DXB NHD DWC FJR RKT SHJ AYM",
+    "OM": "RMB DQM FAU RNM KHS LKW MSH MCT OMM SLL OHS SUH TTH",
+    "PK": "AAW BHW BNP WGB BHV CJL CHB DBA DDU DEA DSK LYP GWD GIL ISB JAG JIW KHI HDD KDD KBH OHT LHE LRG XJM MFG MWD MJD MPD MUX WNS NHS ORW PAJ PJG PSI PEW UET RYK RAZ SBQ KDU SKZ SYW SGI SDT SKT SUL SWN TLB BDN TFT TUK WAF PZH",
+    "IQ": "IQA BMN BGW OSB EBL KIK BSR NJF RQW ISU",
+    "SY": "ALP DAM DEZ KAC LTK PMS",
+    "QA": "DIA IUD DOH",
+    "YE": "ADE AXK BHN AAY HOD MYN IHN RIY SYE SAH SCT GXF TAI",
+    "MP": "ROP SPN TIQ",
+    "GU": "UAM GUM",
+    "GY": "KIA AHL NAI BCG BMJ GFO GEO OGL IMB KAR KRM KRG KTO LUB LTM USI MHA MYM MWJ QSX ORJ PRR",
+    "UM": "MDY AWK",
+    "FM": "TKK PNI KSA YAP",
+    "PW": "ROR",
+    "TW": "KNH LZN TTT GNI KHH CYI HCN TXG KYD RMQ MFK TNN MZG PIF TSA TPE WOT HUN",
+    "JP": "NRT MMJ IBR MUS IHA IWO KIX SHM UKB HIW TJH OBO CTS HKD KUH MMB SHB OKD RBJ WKJ IKI UBJ TSJ MBE AKJ OIR RIS KUM FUJ FUK TNE KOJ KMI OIT KKJ HSG KMJ NGS NGO ASJ OKE KKX TKN NKM FKJ QGU KMQ OKI TOY NTQ HIJ OKJ IZO YGJ IWK KCZ MYJ ITM TTJ TKS TAK IWJ AOJ GAJ SDS FKS HHE HNA AXT MSJ KIJ ONJ SDJ SYO NJA HAC OIM MYE HND QUT OKO OKA DNA ISG UEO KJP MMD MMY AGJ IEJ HTR KTD SHI TRA RNJ OGN",
+    "KR": "MWX KWJ KUV CHN RSU QUN SHO KAG WJU YNY CJU CHF PUS HIN USN ICN SSN OSN GMP SWU KPO TAE CJJ YEC",
+    "PH": "ENI SFS CRK LAO MNL CYU LGP NSP LBX AAV GES CBO DVO BXU BPH DPL CGM IGN JOL CGY MLP SGS OZC PAG MXI SUG CDY IPE TDG ZAM IAO RZP BAG DTE SJI MBO WNP BSO BQA SFE TUG VRC MRQ CYZ TAC BCD CYP DGT MPH CRM ILO MBT KLO CEB OMC PPS RXS EUQ TAG TBH USU BPR",
+    "AR": "CCT COC GHU JNI PRA ROS SFN AEP LCM COR FDO LPG EPA MJR EZE NCJ HOS CVH GNR RDS APZ MDZ LGS AFA CTC SDE RHD IRJ TUC UAQ CRR RCU VDR VME RLO LUQ CNQ RES FMA IGR AOL MCS PSS PRQ SLA JUJ ORA TTG CLX ELO OYA LLS MDX RCQ UZU EHL CRD EMX EQS LHS IGB OES MQD ARR SGV REL VDM PMY ING FTE PUD RGA RGL USH ULA ROY PMQ GGS JSM RYO RZA BHI CSZ OVR GPO OYO SST MDQ NQN NEC PEH RSA BRC TDL VLG CUT CPC",
+    "BR": "CDJ AQA AJU AIF AFL ARU AAX BEL BGX PLU BFH BJP QAK BSB BAT BAU BVB BPG BZC CAC CFB CNF CGR XAP CLN CKS CCM CLV QNS CAW CMG CWB CRQ CXJ CGB CZS PPB MAO JCR ESI IGU FLN FEN FOR GIG GJM GYN GRU GPB GVR GUJ ATM ITA ITB IOS IPN IMP JJD JDF JPA JDO JOI CPV VCP LEC LAJ LIP LDB LAZ MAB MQH MEU MEA MGF MOC MII PLL MCZ MCP MVF SAO MNX NVT GEL NAT OYK POA PHB POO PFB PMW PET PNZ PNB PMG BPS PVH VDC RBR REC SDU RAO BRB SNZ SJK SLZ RIA STM CGH SJP SSZ SSA QHP TMT UNA TOW THE TFF TJL TRQ TEC TBT TUR SJL PAV URG UDI UBA VAG BVH VIX QPS IZA CPQ QCJ OLC SOD QDC JLS QOA QGC QNV OUS QHB QIQ QVP QRZ QSC UBT QGS VOT ALT QGB LVR FRC CFO RIG APY APQ AMJ BDC BVM BRA BSS BMS BQQ CTP CPU QCH RDC LEP DTI DIQ CNV SXX GUZ GDP GNM GMS QGP IRE QIG QIT IPU JCM FEC JEQ JNA JDR CMP QDF CDI QCP LVB SSO MTE MVS SBJ PTQ NNU QBX PSW ORX PCS POJ PIV FLB PDF CAU SFK OBI TFL VAL QID BVS CMC QXC PHI ITI PPY APU BGV BNU CCI QCN CKO DOU ERM FBE QGA IJU ITQ JCB CBW QDB QCR ALQ QMF QGF QHV SQX APX PTO PNG PVI PBB QAC SQY QOJ CSU UMU QVB VIA CTQ AXE AAG SRA PGZ BAZ RBB CAF CQS DMT DNO ERN CQA FEJ SXO GRP AUX IPG IDO JPR JIA JRN CCX CIZ TLZ LBR RVD MBZ NVP AQM BCR NQL APS FBA PIN PBQ AAI ROO AIR OPS STZ IRZ TGQ AZL QHN SQM VLP MBK NOK",
+    "CL": "ZUD LOB WAP ARI WPA CPO BBA TOQ CCH CJC YAI PUQ COW GXQ IQQ SCL ESR FRT ANF WPR FFU LSQ WPU LGR CCP IPC ZOS VLR ZLR PNT OVL ZPC MHC PUX CNR VAP QRC SMB LSC SSD WCA ZCO PMC TLX WCH ZIC TTC ZAL KNA",
+    "AQ": "UGL TNM",
+    "EC": "ATF OCC CUE GPS GYE IBB JIP LTX MRR XMS MCH MEC LGQ PYO PVO UIO ETR SNC SUQ PTZ SCY BHA TSC TPN LOH ESM TPC TUA",
+    "PY": "ASU AYO BFA CIO ENO AGT FLM ESG OLK PIL PJC",
+    "CO": "ACR ACD AFI ADN API AXM PUU ELB BGA BOG BAQ BSC BUN CPB CUC COG CTG CCO CLO CIM RAV TCO CUO CAQ CVE CZU EBG EJA FLA FDA GIR CRC GPI GLJ CPL HTZ IBE IGO MMP IPI LQM MCJ LPD LET EOH MFS MGN MTB MTR MVP MZL NCI NQU NVA OCV ORC PCR PDA PEI PTX PLT NAR PPN PQE PBE PSO PVA PZA MQU MDE RCH RVE SJE SMR SOX ADZ SVI TAU TIB TDA TLU TME TQS TRB AUC UIB ULQ URR VGZ VUP VVC AYG EYP",
+    "BO": "MHW SRE APB ASC BVL BJO CAM CBB CIJ CEP SRZ GYA BVK SJS SJB SJV LPB MGD ORU POI PUR PSZ SRD RBO RIB RBQ REY SBL SRJ SNG SNM SRB MQK TJA TDD UYU VAH VLM VVI BYC",
+    "SR": "ABN BTO AAJ TOT DRJ DOE LDO PBM MOJ ICK OEM SMZ KCB AGI WSO ORG",
+    "GF": "CAY MPY OXP LDX REI XAU",
+    "PE": "APE ALD AOP ATG MBP BLP IBP PCL CHM TGI CIX AYP ANS ATA UMI UCZ RIJ LIM JJI JAU JUL SJA CJA RIM ILQ TBP SMG YMS HUU SQU CHH REQ IQT AQP TRU SQD PIO TPP SYC TCQ PEM PIU TYL NZA CUZ",
+    "UY": "ATI CYR CAR DZO PDP MER MLZ MVD MDO PDU RVY STY TAW TYT VCH",
+    "VE": "AGV AAO LPJ BLA BNS BRM MYC CBL CXA CUV CLZ CAJ VCR CUP CZE CUM EOR EOZ GDO GUI GUQ ICA LSP KAV LFR MAR MRD PMV CCS MUN CBS PYH PBL PDZ PPH SCI PZO PTM LRV SVZ SBB SNV STD SNF SFD SOM STB TUV TMO URM VLN VIG VLV VDP",
+    "AG": "ANU BBQ",
+    "BB": "BGI",
+    "DM": "DCF DOM",
+    "GP": "DSD BBR SFC GBJ PTP LSS",
+    "MQ": "FDF",
+    "MF": "SFG",
+    "BL": "SBH",
+    "GD": "GND CRU",
+    "KN": "SKB NEV",
+    "LC": "SLU UVF",
+    "AW": "AUA",
+    "BQ": "BON EUX SAB",
+    "CW": "CUR",
+    "SX": "SXM",
+    "AI": "AXA",
+    "MS": "MNI",
+    "TT": "TAB POS",
+    "VG": "NGD EIS VIJ",
+    "VC": "BQU CIW MQS UNI SVD",
+    "BM": "BDA",
+    "KZ": "ALA BXH USJ BXJ TDK NQZ KOV PPK DMB CIT HSA DZN KGF KZO URA EKB UKK PWQ PLX SCO GUW AKX AYK KSN",
+    "AZ": "GYD KVD LLK NAJ GBB ZTU ZXT",
+    "KG": "IKU FRU OSS",
+    "AM": "LWN EVN",
+    "RU": "TLK ADH YKS CNN ULK PYJ MJZ CKH CYX IKS BQS GDG TYD KHV KXK GVN DYR PVS GDX PWE BQG OHO PKC OHH EKS DEE ZZO UUS VVO HTA BTK UIK IKT ODO ERG UKX UUD ARH NNM CSH AMV KSZ LED KVK MMK VLU PKV PES CEE VUS VGD KGD ABA BAX RGK KEJ EIE KJA ACS KYZ OVB OMS TOF NOZ DKS HTG IAA NSK SIP AAQ EIK GDZ KRR GRV MCX MRV NAL OGZ IGT STW ROV RVI AER ASF ESL VOG CEK MQF SLY YMK TQL UEN EZV HMA IRM NYA OVS URJ IJK KVX NYM NUX NJC PEE KGP NFG NOJ SGC SVX TOX TJM KRO KMW BKA IWA RYB BZK LNX DME IAR SVO KLD EGO URS LPK VOZ OEL TBW RZN VKO UCT INA PEX USK VKT UTS SCW GOJ UUA KZN NBC JOK CSY ULV ULY REN OSW PEZ SKX BWO GSV RTW BCX NEF OKT UFA KUF",
+    "GE": "KUT BUS SUI TBS",
+    "UA": "KBP DOK KRQ MPW SEV VSG ERD DNK OZH KWG KHC HRK PLV UMY CKC KGO IEV GML ZTR UCK HMJ IFO LWO CWC RWN TNL UDJ KHE NLV ODS VIN UKS",
+    "BY": "BQT GME VTB GNA MHP MSQ MVQ",
+    "TM": "ASB KRW MYP TAZ CRZ",
+    "TJ": "DYU TJU LBD KQT",
+    "UZ": "AZN FEG NMA NCU UGC NVI BHK KSQ AFS SKD TMJ TAS",
+    "IN": "DIU AMD AKD IXU BOM PAB BHJ IXG BDQ BHO BHU NMB GUX HBX IDR JLR JGA IXY HJR KLH IXK LTU NDC NAG ISK PNQ PBD RTC RAJ RPR SSE STV UDR IXV IXA IXB RGH SHL VNS BBI CCU COH DBD DBR DGH DAE GOP GAU GAY IMF JRG PYB IXW JRH KBK IXQ IXH IXS IXN AJL IXI LDA DIB DMU MZU IXT PAT IXR RRK RUP TEI TEZ VTZ ZER AGR IXD ATQ BKB KUU BUP IXC DED DEL DHM GWL HSS JDH JAI JSA IXJ KNU KQH KTU LUH IXL LKO IXP PGH SLV SXR TNI AGX BEP BLR VGA CJB COK CCJ CDP CBD GOI HYD BPM VDY IXM IXE MAA MYQ IXZ PNY RJA SXV TJV TCR TIR TRZ TRV WGC",
+    "LK": "CMB ACJ BTC RML GOY MNH JAF KCT GIU TRR WRZ",
+    "KH": "BBM KZC KKZ KTI PNH RBE REP TNX KOS",
+    "BD": "BZL CXB CLA CGP DAC IRD JSR LLJ RJH SPD TKR ZHM ZYL",
+    "HK": "HKG",
+    "LA": "AOU OUI LPQ LXG ODY PKZ ZBY ZVK NEU VNA THK VTE XKH",
+    "MO": "MFM",
+    "NP": "BJH BHP BGL BHR BJU BIT BWA BDP DNP DHI DAP DOP SIH GKH JIR JUM JKR JMO KTM LDN LUA LTG NGX MEY XMG KEP PKR PPL RJB RHP RUK RPA RUM SIF SKH FEB IMK TPJ TMI BIR",
+    "BT": "PBH",
+    "MV": "IFU FVM GAN HAQ KDO MLE KDM VAM",
+    "TH": "DMK KKM KDT TDX BKK UTP CNX HGN PYY LPT NNT PRH CEI BAO PHY HHQ TKH MAQ THS PHS TKT UTR URT NAW CJM NST KBV SGZ PAN USM HKT UNN HDY TST UTH SNO KKC LOE BFV NAK UBP ROI KOP",
+    "VN": "BMV VCL HPH CAH CXR VCS VCA DIN VDH DLI DAD HAN SQH NHA HUI UIH PXU PQC PHA PHH VKG TBB SGN THD VDO VII VTG",
+    "MM": "NYU BMO TVY NYT GAW GWA HEH HOX TIO KET KHM KMV KYP KAW KYT LIW LSH MDL MGZ MYT MNU MGU MOE MOG MGK MWQ NMS NMT PAA PAU BSX PPU PBU PKK PRU AKY SNW THL XYE RGN",
+    "ID": "UPG BIK ONI FOO WET NBX ILA KOX ZRI TIM EWI AMI BMU DPS LOP SWQ TMC WGP YIA ARJ BUI ZRM DJJ LHI LII OKL WAR SEH UBR WMX MDP BXD MKQ OKQ KEI TMH TJS DTD BEJ BPN TRK SRI TSX BYQ GLX GTO NAH TLI GEB KAZ PLW MDC MNA PSJ OTI TTE LUW UOL BTW PKN KBU MTW TJG BDJ PKY SMQ AHI DOB MAL NRE LAH SXK BJK LUV SQN AMQ NAM TAX MLG CPF JOG SOC SUB SRG SUP NTI RSK KEQ FKQ INX KNG RDE BXB MKW SOQ TXM WSR BJW MOF ENE RTG ARD LBJ KOE BUW MJU MXB KXB SQR TTR KDI PKU DUM RKO SEQ TJB KJT BDO CBN TSY TKG BTH PPR TNJ SIQ PDG HLP CXP PCB PPJ CGK GNS AEG MES KNO DTB FLZ TJQ NPO KTG MWK NTX PNK PSU SQG DJB PGK BKS PLM PDO RGT MPC KLQ TPK MEQ LSX LSW SBG BTJ ABU LKA SAU SGQ LBW BXT NNX TNB LPU",
+    "MY": "BTU BLG LSM LGL KCH ODN LMN MKM LKH MUR BSE KPI BKM MYY SBW TGC LSU LWY SGG BBN SMM LDU TEL KGU SXS BKI LBU TMG GSA SPE PAY RNU SDK KUD TWU MZV SXT MEP SWY TPG TOD AOR BWH KBR KUA KTE IPH JHB KUL LGK MKZ TGG PEN PKG RDN SZB",
+    "BN": "BWN",
+    "TL": "AUT UAI DIL BCH MPT OEC VIQ",
+    "SG": "QPG TGA XSP SIN",
+    "AU": "ALH ABG AWN AUD MRP AXL AXC ADO AMX AMT AYL ABH ARY GYL ARM AAB AUU AWP AVG AYQ AYR ACF ABM BCI ASP BDD BKP BNE OOL BKQ CNS CTL BDW BXG BVI BTX OCM BQW BHQ HTI BEU BIW BZP BRK BUC BLN LCN BLS BQB ISA MCY MKY BNK BSJ GIC OKY BQL BMP PPP ROK BOX BME BZD BTD BWQ BHS BRT TSV BLT BDB BUY BIP ZBO WEI WTB BWB BVZ CGV CLH CVQ CSI CAZ COJ CBY CBI CPD CRB CCL CNC CNJ CBX CUD CED CVC CFI LLG CKW CXT DCN CKI CTN CMQ CMA CML NIF CES CNB ODL CUQ OOM CDA CWW CYG CDQ KCE CMD CUG CUY CJF CWR CCW CWT DBY DRN DNB DRB DFP DGD DXD DLK DDN DLV DYW DMD DVR NLF DRD DVP DPO DOX DRY DHD DRR DKV DYA ECH EUC ETD ENB EIH ELC EMD ERB EPR EVD EVH EXM KFE FLY FLS FVL FIK FOS FOT FIZ GAH GBL GUH GOO GDD GGD GTS GET GFN GBW GBV GLT GUL GLG GEX GLI GLM GVP GPN GTE GFF GTT GEE GYP HWK HXX HVB HUB HIP HID HCQ HMG HLT HOK MHU HTU HSM HGD IDK IFL IFF IGH IKP INJ INM IVW ISI IVR JAB JUN JCK JUR UBU KAX KBY KCS KRA KNS KBB KFG KKP KRB KML KPS KNI KWM KGY KGC KUG LWH LGH LNO LEL LDH IRG LTP LIB LDC LSY LOC LOA LTV LUU LHG LRE LUT LER LVO TGN LZR UBB AVV ABX MRG MBB XMC MFP MLR DGE MQA MKR MEB MIM SXE MGT MNG GSN MGV MQZ HBA MHO MCV MQL XML MIH MTQ MJP LST MBW MEL MMM MTL WME ONR OXY MMG OOR MRZ MET MIN MQE MOV RRE MWB MYA MTD UTB MGB ONG MNQ MUQ MNE MYI MVK MXU MXD MBH RTY NMR NRA NAA RPM NBH NLS NAC RVT NSV NSM NTN NUR NLL NUB ZNE NYN OPI XCO OLP ONS ODD MOO RBS OAG ODR OSO OYN ADL PUG PMK PBO PDE DRW PRD BEO GOV PPI JAD KTA KGI PKE PKT KNX PLO LEA EDR PQQ PTJ PHE PER PEA KTR UMR UIR ULP UEE RMK RCM RAM ROH RBU RBC RMA RSB RTS RTP RHL NDS BWU CBR CFS CDU NSO SQC DBO SGO SIX ZGL SGP MJK SHT SBR SIO SHU STH SNB NOA SLJ SNH SCG SHQ KSV SRN SYD HLS TMW WGA SWH SWC XTR TBL XTO TAQ TBK TDR TEF TEM TAN XTG TYG TYB TKY TPR TUM TYP THG TCA TCW TRO TWB UDA CZY USL VCD VNR WLA WAV WMB SYU WIO WLC WAZ WND WNR WGT WYA WIT WKB WGE NTL WUN WPK WDI WOL WLO WIN WUD WEW WRW WWI WYN BWT YLG OKR KYF XMY YUE NGA ORR KYI",
+    "CC": "CCK",
+    "CX": "XCH",
+    "NF": "NLK",
+    "CN": "PEK PKX CIF CIH DSN DAT AEB HDG HET HLD NAY BAV SJW TSN TGO HLH XIL YCU TYN BHY CGD HJJ DYG FUO CAN CSX HNY HUZ KWL LLF MXZ NNG SWA ZUH SZX WUZ XIN LZH ZHA AYN CGO ENH LHK WUH LYA NNY SHS XFN YIH HAK SYX AKA DNH GOQ GYU HZG INC JIC JNG JGN LHW IQN SIA THQ XNN XIY ENY UYN ZHY BSD DLU DIG JHG LNJ LJG LUM KMG SYM ZAT XMN AQG BFU CZX KHN DOY FUG FOC JGS KOW HGH JDZ JIU TNA JUZ LCX LYG HYN LYI NGB NKG NTG HFE PVG TAO JJN RUG HIA SQJ SHA SZV TXN WEF WEH WHU WUX WUS WNZ XUZ YNZ YNT YIW HSN NGQ AVA BPX CKG DAX GYS KWE JZH LIA LXA LZO MIG NAO LZY JIQ TCZ TFU TEN CTU WXN XIC YBP ACX ZYI AKU AAT BPL IQM HMI KCA KRL KRY KHG SXJ TCG HTN URC YIN AOG CGQ CNI CHG DDG DQA HRB HEK JIL JMU JNZ LDS YUS MDG OHE NDG DLC TNH SHE XEN YNJ",
+    "KP": "RGO FNJ DSO YJS",
+    "MN": "AVK LTI BYN UGA UGT HBU UUN COQ UBN DLZ KHR HVD MXV ULN ULO ULG",
+}
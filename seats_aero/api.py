@@ -1,10 +1,14 @@
-import json
+import functools
+import sys
+import threading
+from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, List, Set
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set
 
-import requests
-from streamlit import secrets
+from seats_aero import decode, metrics
+from seats_aero.client import SeatsAeroClient, default_client
+from seats_aero.jsonstream import iter_json_array
 
 partners_mapping = {
     "aeromexico": "Aeromexico",
@@ -28,8 +32,18 @@ partners_mapping = {
 
 partners = sorted(partners_mapping.keys())
 
+fares = ["Y", "W", "J", "F"]
 
-@dataclass
+
+@functools.lru_cache(maxsize=1 << 14)
+def split_airlines(airlines: str) -> FrozenSet[str]:
+    """Parse an airline list such as "UA, AC" into its airline codes."""
+    return frozenset(
+        airline.strip() for airline in airlines.split(",") if airline.strip() != ""
+    )
+
+
+@dataclass(slots=True)
 class Route:
     id: str
     origin_airport: str
@@ -45,32 +59,135 @@ class Route:
         raw = d
         return Route(
             id=raw["ID"],
-            origin_airport=raw["OriginAirport"],
-            origin_region=raw["OriginRegion"],
-            destination_airport=raw["DestinationAirport"],
-            destination_region=raw["DestinationRegion"],
+            origin_airport=sys.intern(raw["OriginAirport"]),
+            origin_region=sys.intern(raw["OriginRegion"]),
+            destination_airport=sys.intern(raw["DestinationAirport"]),
+            destination_region=sys.intern(raw["DestinationRegion"]),
             num_days_out=raw["NumDaysOut"],
             distance=raw["Distance"],
-            source=raw["Source"],
+            source=sys.intern(raw["Source"]),
         )
 
     @staticmethod
     def from_json(json_str: str) -> "Route":
-        return Route.from_dict(json.loads(json_str))
+        return Route.from_dict(decode.loads(json_str))
 
     @staticmethod
-    def fetch() -> List["Route"]:
-        url = "https://seats.aero/api/routes"
-        response = requests.get(
-            url, headers={"Partner-Authorization": secrets["api_key"]}
-        )
-        if response.status_code != 200:
-            raise ValueError(f"Failed to fetch routes: {response.text}")
-        all_routes = json.loads(response.text)
+    def fetch(client: Optional[SeatsAeroClient] = None) -> List["Route"]:
+        with (client or default_client()).get("/api/routes") as response:
+            if response.status_code != 200:
+                raise ValueError(f"Failed to fetch routes: {response.text}")
+            all_routes = decode.loads(response.content)
         return [Route.from_dict(route) for route in all_routes]
 
 
 @dataclass
+class RouteCatalog(Mapping):
+    """All routes with an ID -> index map, usable wherever a route map is."""
+
+    routes: List[Route]
+    index: Dict[str, int]
+    fetched_at: datetime
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def __getitem__(self, route_id: str) -> Route:
+        return self.routes[self.index[route_id]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.routes)
+
+    @staticmethod
+    def from_routes(
+        routes: List[Route],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> "RouteCatalog":
+        return RouteCatalog(
+            routes=routes,
+            index={route.id: i for i, route in enumerate(routes)},
+            fetched_at=datetime.now(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    @staticmethod
+    def fetch(
+        previous: Optional["RouteCatalog"] = None,
+        client: Optional[SeatsAeroClient] = None,
+    ) -> "RouteCatalog":
+        """Fetch the route catalog, revalidating ``previous`` if the server
+        supports conditional requests."""
+        headers = {}
+        if previous is not None and previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous is not None and previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+        with (
+            metrics.span("fetch_routes"),
+            (client or default_client()).get(
+                "/api/routes", headers=headers
+            ) as response,
+        ):
+            if previous is not None and response.status_code == 304:
+                previous.fetched_at = datetime.now()
+                return previous
+            if response.status_code != 200:
+                raise ValueError(f"Failed to fetch routes: {response.text}")
+            metrics.count("bytes_decoded", len(response.content), endpoint="routes")
+            all_routes = decode.loads(response.content)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+        return RouteCatalog.from_routes(
+            [Route.from_dict(route) for route in all_routes],
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+
+class RouteCache:
+    """Process-wide route catalog that is revalidated once it is ``ttl`` old."""
+
+    def __init__(self, ttl: timedelta = timedelta(hours=6)):
+        self.ttl = ttl
+        self.catalog: Optional[RouteCatalog] = None
+        self._lock = threading.Lock()
+
+    def get(
+        self, client: Optional[SeatsAeroClient] = None, force: bool = False
+    ) -> RouteCatalog:
+        """Return the catalog, revalidating it first if it is stale or ``force``
+        is set, e.g. because an availability refers to an unknown route."""
+        with self._lock:
+            if (
+                force
+                or self.catalog is None
+                or datetime.now() - self.catalog.fetched_at >= self.ttl
+            ):
+                metrics.count("cache_misses", cache="routes")
+                self.catalog = RouteCatalog.fetch(self.catalog, client)
+            else:
+                metrics.count("cache_hits", cache="routes")
+            return self.catalog
+
+
+def _count_bytes(chunks: Iterable[bytes], endpoint: str) -> Iterator[bytes]:
+    # bytes after decompression, the client counts the bytes on the wire
+    for chunk in chunks:
+        metrics.count("bytes_decoded", len(chunk), endpoint=endpoint)
+        yield chunk
+
+
+@functools.lru_cache(maxsize=1 << 12)
+def _parse_datetime(value: str) -> datetime:
+    # few distinct dates per payload, so parse each one once
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass(slots=True)
 class Availability:
     """From following go struct:
         type Availability struct {
@@ -167,16 +284,12 @@ class Availability:
 
     def all_airlines(self) -> Set[str]:
         res = set()
-        for code in ["Y", "W", "J", "F"]:
-            res.update(
-                airline.strip()
-                for airline in self.airlines(code).split(",")
-                if airline.strip() != ""
-            )
+        for code in fares:
+            res.update(split_airlines(self.airlines(code)))
         return res
 
     @staticmethod
-    def from_dict(d: Dict, route_map: dict[str, Route]) -> "Availability":
+    def from_dict(d: Dict, route_map: Mapping[str, Route]) -> "Availability":
         raw = d
         return Availability(
             id=raw["ID"],
@@ -184,7 +297,7 @@ class Availability:
             route=route_map[raw["RouteID"]],
             date=raw["Date"],
             # parse from 2023-05-24T00:00:00Z to datetime
-            parsed_date=datetime.strptime(raw["ParsedDate"], "%Y-%m-%dT%H:%M:%SZ"),
+            parsed_date=_parse_datetime(raw["ParsedDate"]),
             y_available=raw["YAvailable"],
             w_available=raw["WAvailable"],
             j_available=raw["JAvailable"],
@@ -209,19 +322,56 @@ class Availability:
             computed_last_seen=raw["ComputedLastSeen"],
         )
 
+    @staticmethod
+    def iter_fetch_raw(
+        partner: str = "aeroplan",
+        chunk_size: int = 1 << 16,
+        client: Optional[SeatsAeroClient] = None,
+    ) -> Iterator[Dict]:
+        with (client or default_client()).get(
+            "/api/availability", params={"source": partner}, stream=True
+        ) as response:
+            if response.status_code != 200:
+                raise ValueError(f"Failed to fetch availabilities: {response.text}")
+            yield from iter_json_array(
+                _count_bytes(response.iter_content(chunk_size), "availability")
+            )
+
+    @staticmethod
+    def iter_fetch(
+        route_map: Mapping[str, Route],
+        partner: str = "aeroplan",
+        chunk_size: int = 1 << 16,
+        client: Optional[SeatsAeroClient] = None,
+    ) -> Iterator["Availability"]:
+        for availability in Availability.iter_fetch_raw(partner, chunk_size, client):
+            yield Availability.from_dict(availability, route_map)
+
     @staticmethod
     def fetch(
-        route_map: dict[str, Route], partner: str = "aeroplan"
+        route_map: Mapping[str, Route],
+        partner: str = "aeroplan",
+        stream: bool = False,
+        client: Optional[SeatsAeroClient] = None,
     ) -> List["Availability"]:
-        url = f"https://seats.aero/api/availability?source={partner}"
-        response = requests.get(
-            url, headers={"Partner-Authorization": secrets["api_key"]}
-        )
-        all_availabilities = json.loads(response.text)
-        return [
-            Availability.from_dict(availability, route_map)
-            for availability in all_availabilities
-        ]
+        if stream:
+            return list(Availability.iter_fetch(route_map, partner, client=client))
+        with (client or default_client()).get(
+            "/api/availability", params={"source": partner}
+        ) as response:
+            if response.status_code != 200:
+                raise ValueError(f"Failed to fetch availabilities: {response.text}")
+            metrics.count(
+                "bytes_decoded", len(response.content), endpoint="availability"
+            )
+            all_availabilities = decode.loads(response.content)
+        with metrics.span("from_dict"):
+            res = [
+                Availability.from_dict(availability, route_map)
+                for availability in all_availabilities
+            ]
+        metrics.count("rows_parsed", len(res))
+        return res
 
     def airline_str(self) -> str:
         return "\n".join(
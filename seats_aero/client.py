@@ -0,0 +1,160 @@
+import contextlib
+import functools
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+from seats_aero import metrics
+
+
+def default_base_url() -> str:
+    return os.environ.get("SEATS_AERO_BASE_URL", "https://seats.aero")
+
+
+def default_api_key() -> str:
+    """``SEATS_AERO_API_KEY``, falling back to the Streamlit secret ``api_key``."""
+    api_key = os.environ.get("SEATS_AERO_API_KEY")
+    if api_key is not None:
+        return api_key
+    from streamlit import secrets
+
+    return secrets["api_key"]
+
+
+def _count_chunked_bytes(response: requests.Response, **kwargs) -> requests.Response:
+    # urllib3 only counts length-delimited bodies in tell(), so count the chunks
+    # of chunked bodies as they come off the wire, before decompression. Runs as
+    # a response hook, i.e. before requests reads the body. This goes through
+    # urllib3 internals, so leave the count at 0 if they are not there.
+    raw = response.raw
+    if (
+        getattr(raw, "chunked", False)
+        and hasattr(raw, "_handle_chunk")
+        and isinstance(getattr(raw, "_fp_bytes_read", None), int)
+    ):
+        handle_chunk = raw._handle_chunk
+
+        def counted(amt: Optional[int]) -> bytes:
+            chunk = handle_chunk(amt)
+            raw._fp_bytes_read += len(chunk)
+            return chunk
+
+        raw._handle_chunk = counted
+    return response
+
+
+@dataclass
+class ClientMetrics:
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    # bytes as received on the wire, i.e. before decompression
+    bytes_received: int = 0
+    seconds: float = 0.0
+
+
+class SeatsAeroClient:
+    """HTTP client for the seats.aero partner API.
+
+    One pooled session is shared by all requests, so connections and TLS sessions
+    are reused. The base URL and API key default to ``SEATS_AERO_BASE_URL`` and
+    ``SEATS_AERO_API_KEY`` (or the Streamlit secret). Responses are negotiated
+    compressed (gzip, and brotli when it is installed), idempotent requests are
+    retried with exponential backoff on connection errors and 429/5xx responses,
+    and every request has a connect and read timeout.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[Callable[[], str]] = None,
+        timeout: Union[float, Tuple[float, float]] = (10, 120),
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        pool_maxsize: int = 8,
+    ):
+        self.base_url = (base_url or default_base_url()).rstrip("/")
+        # called per request, so rotated keys are picked up without a restart
+        self.api_key = api_key or default_api_key
+        self.timeout = timeout
+        self.metrics = ClientMetrics()
+        self._metrics_lock = threading.Lock()
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=["GET"],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(make_headers(accept_encoding=True))
+        self.session.hooks["response"].append(_count_chunked_bytes)
+
+    def _record(
+        self, path: str, response: Optional[requests.Response], started: float
+    ) -> None:
+        received = retries = 0
+        if response is not None and response.raw is not None:
+            received = response.raw.tell()
+            if response.raw.retries is not None:
+                retries = len(response.raw.retries.history)
+        failed = response is None or response.status_code >= 400
+        endpoint = path.rsplit("/", 1)[-1]
+        with self._metrics_lock:
+            self.metrics.requests += 1
+            self.metrics.retries += retries
+            self.metrics.errors += failed
+            self.metrics.bytes_received += received
+            self.metrics.seconds += time.perf_counter() - started
+        metrics.count("requests", endpoint=endpoint)
+        metrics.count("retries", retries, endpoint=endpoint)
+        metrics.count("request_errors", failed, endpoint=endpoint)
+        metrics.count("bytes_received", received, endpoint=endpoint)
+
+    @contextlib.contextmanager
+    def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> Iterator[requests.Response]:
+        """GET ``path`` relative to the base URL.
+
+        The response is yielded rather than returned so that streamed bodies are
+        released to the pool, and counted in the metrics, once consumed.
+        """
+        started = time.perf_counter()
+        response = None
+        try:
+            # until the headers, or the whole body unless ``stream`` is set
+            with metrics.span("request"):
+                response = self.session.get(
+                    f"{self.base_url}{path}",
+                    params=params,
+                    headers={
+                        "Partner-Authorization": self.api_key(),
+                        **(headers or {}),
+                    },
+                    timeout=self.timeout,
+                    stream=stream,
+                )
+            yield response
+        finally:
+            if response is not None:
+                response.close()
+            self._record(path, response, started)
+
+
+@functools.cache
+def default_client() -> SeatsAeroClient:
+    return SeatsAeroClient()
@@ -0,0 +1,46 @@
+"""JSON decoding backends.
+
+msgspec or orjson is used when installed, falling back to the standard library
+otherwise. The ``SEATS_AERO_JSON`` environment variable forces a backend by name.
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, Tuple, Type, Union
+
+Loads = Callable[[Union[bytes, str]], Any]
+
+_BACKENDS: Dict[str, Loads] = {"json": json.loads}
+# raised by ``loads`` on malformed input, whichever backend is in use
+decode_errors: Tuple[Type[Exception], ...] = (ValueError,)
+
+try:
+    import orjson
+
+    _BACKENDS["orjson"] = orjson.loads
+except ImportError:
+    pass
+
+try:
+    import msgspec  # type: ignore
+
+    _BACKENDS["msgspec"] = msgspec.json.decode
+    decode_errors += (msgspec.DecodeError,)
+except ImportError:
+    pass
+
+
+def _select_backend() -> str:
+    requested = os.environ.get("SEATS_AERO_JSON")
+    if requested:
+        if requested not in _BACKENDS:
+            raise ValueError(
+                f"JSON backend {requested!r} is not installed, "
+                f"available: {', '.join(sorted(_BACKENDS))}"
+            )
+        return requested
+    return next(name for name in ["msgspec", "orjson", "json"] if name in _BACKENDS)
+
+
+backend = _select_backend()
+loads: Loads = _BACKENDS[backend]
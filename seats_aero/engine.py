@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from seats_aero import metrics
+from seats_aero.api import Availability, RouteCache
+from seats_aero.client import SeatsAeroClient
+from seats_aero.plot import get_route_df
+from seats_aero.query import RouteQuery, parse_route
+from seats_aero.snapshot import SnapshotStore
+from seats_aero.table import AvailabilityTable
+
+# pseudo partner whose dataset holds the availabilities of every partner; it is
+# combined from the loaded partners (see PrefetchScheduler.get_all) rather than
+# fetched
+ALL_PARTNERS = "all"
+
+
+class AvailabilitySource:
+    """Fetches partner availabilities, going through the snapshot store when one
+    is configured. Shared by the Streamlit app and the headless API."""
+
+    def __init__(
+        self,
+        routes: RouteCache,
+        ttl: timedelta,
+        snapshots: Optional[SnapshotStore] = None,
+        client: Optional[SeatsAeroClient] = None,
+    ):
+        self.routes = routes
+        self.ttl = ttl
+        self.snapshots = snapshots
+        self.client = client
+
+    def fetch(self, partner: str) -> AvailabilityTable:
+        if partner == ALL_PARTNERS:
+            raise ValueError("All partners are combined from the loaded partners")
+        # downloading and parsing are interleaved, "parse" covers the latter
+        with metrics.span("fetch"):
+            return AvailabilityTable.from_dicts(
+                Availability.iter_fetch_raw(partner, client=self.client),
+                self.routes.get(self.client),
+                refresh_routes=lambda: self.routes.get(self.client, force=True),
+            )
+
+    def load(
+        self,
+        partner: str,
+        previous: Optional[AvailabilityTable],
+        max_age: Optional[timedelta] = None,
+    ) -> Tuple[AvailabilityTable, datetime]:
+        """Return ``partner`` from a snapshot younger than ``max_age`` (the TTL by
+        default), or fetch it and merge it into ``previous``."""
+        snapshots = self.snapshots
+        if max_age is None:
+            max_age = self.ttl
+        cached = snapshots.latest(partner, max_age) if snapshots is not None else None
+        if cached is not None:
+            metrics.count("cache_hits", cache="snapshot")
+            table, fetched_at = cached
+        else:
+            metrics.count("cache_misses", cache="snapshot")
+            table = self.fetch(partner)
+            if previous is not None:
+                # keep unchanged rows and the indexes already built on them
+                table = previous.merge(table, remove_missing=True)
+            fetched_at = datetime.now()
+            if snapshots is not None:
+                snapshots.save(partner, table, fetched_at)
+        # build the indexes once per dataset instead of once per query
+        table.leg_index.destinations
+        table.airline_vocabulary
+        return table, fetched_at
+
+
+def query_routes(
+    table: AvailabilityTable,
+    route: str,
+    airlines: List[str] = [],
+    class_code: List[str] = [],
+    expand_country: bool = True,
+    expand_city: bool = True,
+    start_date: Optional[np.datetime64] = None,
+    end_date: Optional[np.datetime64] = None,
+    min_seats: int = 0,
+    cheapest: bool = False,
+) -> Tuple[RouteQuery, List[Tuple[str, str]], pd.DataFrame]:
+    """Resolve a route string such as ``"US - LHR, CA - HKG"`` against ``table``.
+
+    Returns the parsed query, the legs of it that have data, in query order, and
+    one row per matching availability and fare.
+    """
+    with metrics.span("expand"):
+        hits = parse_route.cache_info().hits
+        route_query = parse_route(route, expand_country, expand_city)
+        legs = route_query.match(table.leg_index.destinations)
+    cached = parse_route.cache_info().hits > hits
+    metrics.count("cache_hits" if cached else "cache_misses", cache="route_query")
+    metrics.count("legs_expanded", route_query.candidate_count())
+    metrics.count("legs_matched", len(legs))
+    route_df = get_route_df(
+        table,
+        legs,
+        airlines,
+        class_code,
+        start_date,
+        end_date,
+        min_seats,
+        cheapest,
+    )
+    return route_query, legs, route_df
@@ -0,0 +1,197 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from seats_aero.api import fares
+from seats_aero.query import QueryLeg, RouteQuery
+from seats_aero.table import _DAY_BITS, AvailabilityTable
+
+_COLUMNS = [
+    "itinerary",
+    "departure",
+    "arrival",
+    "days",
+    "fare",
+    "fares",
+    "airlines",
+    "direct",
+    "mileage_cost",
+]
+# partial itineraries extended per leg, as a multiple of ``limit``
+_PRUNE_FACTOR = 16
+
+
+def _leg_rows(
+    table: AvailabilityTable,
+    leg: QueryLeg,
+    airlines: List[str],
+    class_code: List[str],
+    start_date: Optional[np.datetime64] = None,
+    end_date: Optional[np.datetime64] = None,
+    min_seats: int = 0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the rows of ``leg`` with a matching fare and the best such fare of
+    each row, sorted by (origin, date)."""
+    index = table.leg_index
+    legs, _ = index.lookup(leg.match(index.destinations))
+    rows, _ = index.take(legs, start_date, end_date)
+    mask = table.fare_mask(rows, airlines, class_code, min_seats)
+    keep = mask.any(axis=1)
+    rows, mask = rows[keep], mask[keep]
+    best = len(fares) - 1 - np.argmax(mask[:, ::-1], axis=1)
+    order = np.argsort(
+        _airport_day(table.origin[rows], table.date[rows]), kind="stable"
+    )
+    return rows[order], best[order]
+
+
+def _airport_day(airports: np.ndarray, dates: np.ndarray) -> np.ndarray:
+    # (airport, day) packed into one sortable integer
+    return (airports.astype(np.int64) << _DAY_BITS) + dates.astype(np.int64)
+
+
+def _rank(
+    table: AvailabilityTable, paths: np.ndarray, path_fares: np.ndarray
+) -> np.ndarray:
+    departure = table.date[paths[:, 0]]
+    duration = table.date[paths[:, -1]] - departure
+    direct = table.direct[paths, path_fares].all(axis=1)
+    return np.lexsort((departure, duration, ~direct, -path_fares.min(axis=1)))
+
+
+def find_itineraries(
+    table: AvailabilityTable,
+    legs: Sequence[QueryLeg],
+    airlines: List[str] = [],
+    class_code: List[str] = [],
+    min_connection_days: int = 0,
+    max_connection_days: int = 3,
+    limit: int = 1000,
+    start_date: Optional[np.datetime64] = None,
+    end_date: Optional[np.datetime64] = None,
+    min_seats: int = 0,
+) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """Join the availabilities of consecutive legs into complete itineraries.
+
+    Each leg departs from the airport the previous one arrived at, between
+    ``min_connection_days`` and ``max_connection_days`` after it. The rows of
+    every leg are sorted by (origin, date) so the connections of all partial
+    itineraries are found with two binary searches. ``start_date`` and
+    ``end_date`` only limit the departure of the first leg, ``min_seats`` applies
+    to every leg.
+
+    The number of itineraries grows with every leg, so once extending all
+    partial itineraries would make more than ``limit * _PRUNE_FACTOR`` of them,
+    only the best so far are extended.
+
+    Returns the rows and the best matching fare of each leg as two
+    (itineraries, legs) arrays, best itineraries first: by the cabin of the
+    lowest leg, then all legs direct, then shortest trip, then earliest
+    departure; and whether any itineraries were left out.
+    """
+    if len(legs) == 0:
+        empty = np.zeros((0, 0), dtype=np.int64)
+        return empty, empty, False
+    max_paths = limit * _PRUNE_FACTOR
+    truncated = False
+    paths, path_fares = _leg_rows(
+        table, legs[0], airlines, class_code, start_date, end_date, min_seats
+    )
+    paths, path_fares = paths[:, None], path_fares[:, None]
+    for leg in legs[1:]:
+        rows, best = _leg_rows(table, leg, airlines, class_code, min_seats=min_seats)
+        keys = _airport_day(table.origin[rows], table.date[rows])
+        last = paths[:, -1]
+        arrival = _airport_day(table.destination[last], table.date[last])
+        lo = np.searchsorted(keys, arrival + min_connection_days, side="left")
+        hi = np.searchsorted(keys, arrival + max_connection_days, side="right")
+        counts = hi - lo
+        if counts.sum() > max_paths:
+            # extend the best partial itineraries, as many as fit
+            order = _rank(table, paths, path_fares)
+            fits = np.cumsum(counts[order]) <= max_paths
+            fits[0] = True
+            # in their original order, so ties rank as without pruning
+            keep = np.sort(order[fits])
+            paths, path_fares = paths[keep], path_fares[keep]
+            lo, counts = lo[keep], counts[keep]
+            truncated = True
+        owner = np.repeat(np.arange(len(paths)), counts)
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        connection = np.repeat(lo, counts) + within
+        paths = np.column_stack([paths[owner], rows[connection]])
+        path_fares = np.column_stack([path_fares[owner], best[connection]])
+
+    order = _rank(table, paths, path_fares)
+    truncated = truncated or len(order) > limit
+    order = order[:limit]
+    return paths[order], path_fares[order], truncated
+
+
+def get_itinerary_df(
+    table: AvailabilityTable,
+    query: RouteQuery,
+    airlines: List[str] = [],
+    class_code: List[str] = [],
+    min_connection_days: int = 0,
+    max_connection_days: int = 3,
+    limit: int = 1000,
+    start_date: Optional[np.datetime64] = None,
+    end_date: Optional[np.datetime64] = None,
+    min_seats: int = 0,
+) -> Tuple[pd.DataFrame, bool]:
+    """Ranked itineraries of every multi-leg segment of ``query``, and whether
+    any were left out (see ``find_itineraries``).
+
+    ``mileage_cost`` sums the legs and is 0 when the cost of any leg is unknown.
+    """
+    fare_names = np.array(fares)
+    frames = []
+    truncated = False
+    for segment in query.segments:
+        if len(segment) < 2:
+            continue
+        paths, path_fares, segment_truncated = find_itineraries(
+            table,
+            segment,
+            airlines,
+            class_code,
+            min_connection_days,
+            max_connection_days,
+            limit,
+            start_date,
+            end_date,
+            min_seats,
+        )
+        truncated = truncated or segment_truncated
+        if len(paths) == 0:
+            continue
+        airports = table.airports
+        stops = np.column_stack(
+            [airports[table.origin[paths[:, 0]]], airports[table.destination[paths]]]
+        )
+        leg_airlines = table.airline_strings[table.airlines[paths, path_fares]]
+        departure = table.date[paths[:, 0]]
+        arrival = table.date[paths[:, -1]]
+        leg_costs = table.mileage_cost[paths, path_fares].astype(np.int64)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "itinerary": [" -> ".join(s) for s in stops.tolist()],
+                    "departure": departure.astype("datetime64[ns]"),
+                    "arrival": arrival.astype("datetime64[ns]"),
+                    "days": (arrival - departure).astype(np.int64),
+                    "fare": fare_names[path_fares.min(axis=1)],
+                    "fares": [" / ".join(f) for f in fare_names[path_fares].tolist()],
+                    "airlines": [" / ".join(a) for a in leg_airlines.tolist()],
+                    "direct": table.direct[paths, path_fares].all(axis=1),
+                    "mileage_cost": np.where(
+                        (leg_costs == 0).any(axis=1), 0, leg_costs.sum(axis=1)
+                    ),
+                }
+            )
+        )
+    if len(frames) == 0:
+        return pd.DataFrame(columns=_COLUMNS), truncated
+    return pd.concat(frames, ignore_index=True), truncated
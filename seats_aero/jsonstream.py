@@ -0,0 +1,76 @@
+import codecs
+import itertools
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+from seats_aero import decode
+
+_SEPARATOR = re.compile(r"[\s,]*")
+_TERMINATORS = ",] \t\r\n"
+
+
+def _skip_separators(buf: str, pos: int = 0) -> int:
+    match = _SEPARATOR.match(buf, pos)
+    return match.end() if match else pos
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Incrementally decode a top-level JSON array, yielding one element at a time.
+
+    Only the bytes of the element currently being decoded are buffered, so memory
+    use is bounded by the largest element rather than by the whole payload. The
+    complete objects of each chunk are decoded with a single call to the
+    configured JSON backend where possible.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    started = False
+    for chunk in itertools.chain(chunks, [None]):
+        final = chunk is None
+        buf = buf[pos:] + text_decoder.decode(chunk or b"", final=final)
+        pos = _skip_separators(buf)
+        if not started:
+            if pos == len(buf):
+                continue
+            if buf[pos] != "[":
+                raise ValueError(f"Expected a JSON array, got {buf[pos : pos + 20]!r}")
+            pos += 1
+            started = True
+        pos = _skip_separators(buf, pos)
+        cut = buf.rfind("}") + 1
+        if cut > pos:
+            # a "}" inside a string or a nested value leaves unterminated input
+            # that fails to decode, the elements are then decoded one by one
+            try:
+                elements = decode.loads(f"[{buf[pos:cut]}]")
+            except decode.decode_errors:
+                pass
+            else:
+                yield from elements
+                pos = cut
+        while True:
+            pos = _skip_separators(buf, pos)
+            if pos == len(buf):
+                break
+            if buf[pos] == "]":
+                return
+            try:
+                element, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                # the element is split across chunks, wait for more data
+                break
+            if (
+                not final
+                and not isinstance(element, (dict, list))
+                and (end == len(buf) or buf[end] not in _TERMINATORS)
+            ):
+                # a scalar cut by a chunk boundary may still be incomplete
+                break
+            yield element
+            pos = end
+    raise ValueError("Truncated JSON array")
@@ -0,0 +1,113 @@
+"""Spans and counters for the stages of loading and querying availabilities.
+
+Collection is off unless ``SEATS_AERO_METRICS=1`` or ``enable()`` is called;
+while off, ``span`` hands out one shared no-op context manager and ``count``
+returns straight away, so instrumented hot paths pay one global lookup.
+"""
+
+import contextlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import ContextManager, Dict, Iterator, List, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+enabled = os.environ.get("SEATS_AERO_METRICS") == "1"
+
+_NOOP: ContextManager[None] = contextlib.nullcontext()
+_lock = threading.Lock()
+
+
+@dataclass
+class SpanStats:
+    count: int = 0
+    total: float = 0.0  # seconds
+    last: float = 0.0  # seconds
+    max: float = 0.0  # seconds
+
+
+_spans: Dict[str, SpanStats] = {}
+_counters: Dict[Tuple[str, Labels], float] = {}
+
+
+def enable(on: bool = True) -> None:
+    global enabled
+    enabled = on
+
+
+def reset() -> None:
+    with _lock:
+        _spans.clear()
+        _counters.clear()
+
+
+def count(name: str, value: float = 1, **labels: str) -> None:
+    """Add ``value`` to counter ``name``."""
+    if not enabled:
+        return
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+@contextlib.contextmanager
+def _timed(name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        with _lock:
+            stats = _spans.setdefault(name, SpanStats())
+            stats.count += 1
+            stats.total += elapsed
+            stats.last = elapsed
+            stats.max = max(stats.max, elapsed)
+
+
+def span(name: str) -> ContextManager[None]:
+    """Time the enclosed block as span ``name``."""
+    return _timed(name) if enabled else _NOOP
+
+
+def spans() -> Dict[str, SpanStats]:
+    with _lock:
+        return {name: SpanStats(**vars(stats)) for name, stats in _spans.items()}
+
+
+def counters() -> Dict[Tuple[str, Labels], float]:
+    with _lock:
+        return dict(_counters)
+
+
+def _format_labels(labels: Labels) -> str:
+    if len(labels) == 0:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def to_prometheus(prefix: str = "seats_aero") -> str:
+    """Render all metrics in the Prometheus text exposition format."""
+    lines: List[str] = []
+    by_name: Dict[str, List[Tuple[Labels, float]]] = {}
+    for (name, labels), value in sorted(counters().items()):
+        by_name.setdefault(name, []).append((labels, value))
+    for name, samples in by_name.items():
+        lines.append(f"# TYPE {prefix}_{name}_total counter")
+        for labels, value in samples:
+            lines.append(f"{prefix}_{name}_total{_format_labels(labels)} {value}")
+    span_stats = sorted(spans().items())
+    if span_stats:
+        metric = f"{prefix}_span_seconds"
+        lines.append(f"# TYPE {metric} summary")
+        for name, stats in span_stats:
+            labels = _format_labels((("span", name),))
+            lines.append(f"{metric}_count{labels} {stats.count}")
+            lines.append(f"{metric}_sum{labels} {stats.total:.6f}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,257 @@
+"""Local stand-in for the seats.aero partner API, for running without network.
+
+python -m seats_aero.mockserver serve --rows 200000 --latency 0.3 --bandwidth 2e6
+python -m seats_aero.mockserver record fixtures/ --partners aeroplan united
+python -m seats_aero.mockserver serve --fixtures fixtures/ --error-rate 0.2
+
+Point the app or the API server at it with
+``SEATS_AERO_BASE_URL=http://127.0.0.1:8900``. Any API key is accepted unless
+``--api-key`` is given.
+"""
+
+import argparse
+import gzip
+import hashlib
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from seats_aero.api import partners
+from seats_aero.client import SeatsAeroClient
+from seats_aero.synthetic import (
+    encode_payload,
+    generate_availabilities,
+    generate_routes,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class NetworkProfile:
+    """How responses are delivered."""
+
+    latency: float = 0.0  # seconds before the response starts
+    bandwidth: Optional[float] = None  # bytes per second, unlimited if None
+    chunk_size: int = 1 << 16  # bytes per write
+    chunked: bool = False  # chunked transfer encoding instead of Content-Length
+    error_rate: float = 0.0  # share of requests answered with 503
+    gzip: bool = False  # compress for clients that accept it
+
+
+class Payloads:
+    """Response bodies, read from recorded fixtures or generated once per
+    partner on first use.
+
+    Fixtures are laid out as ``routes.json`` and ``availability/<partner>.json``,
+    as written by ``record``.
+    """
+
+    def __init__(
+        self,
+        fixtures: Optional[Path] = None,
+        rows: int = 100_000,
+        routes: int = 2_000,
+    ):
+        self.fixtures = fixtures
+        self.rows = rows
+        self.routes = routes
+        self._bodies: Dict[Tuple[str, bool], Tuple[bytes, str]] = {}
+        self._lock = threading.Lock()
+
+    def _generate(self, partner: Optional[str]) -> Optional[bytes]:
+        if self.fixtures is not None:
+            path = (
+                self.fixtures / "routes.json"
+                if partner is None
+                else self.fixtures / "availability" / f"{partner}.json"
+            )
+            return path.read_bytes() if path.is_file() else None
+        raw_routes = generate_routes(self.routes)
+        if partner is None:
+            return b"".join(encode_payload(raw_routes))
+        if partner not in partners:
+            return None
+        records = generate_availabilities(
+            raw_routes, self.rows, seed=partners.index(partner), source=partner
+        )
+        return b"".join(encode_payload(records))
+
+    def get(
+        self, partner: Optional[str], compressed: bool
+    ) -> Optional[Tuple[bytes, str]]:
+        """Return the body of the routes (``partner`` None) or availability
+        endpoint and its ETag, or None when there is no such payload."""
+        key = (partner or "", compressed)
+        with self._lock:
+            cached = self._bodies.get(key)
+            if cached is None:
+                body = self._generate(partner)
+                if body is None:
+                    return None
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if compressed:
+                    body = gzip.compress(body, compresslevel=6)
+                cached = self._bodies[key] = (body, etag)
+        return cached
+
+
+def make_handler(
+    payloads: Payloads, network: NetworkProfile, api_key: Optional[str] = None
+) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_status(self, status: HTTPStatus) -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def _write_body(self, body: bytes) -> None:
+            started = time.perf_counter()
+            for pos in range(0, len(body), network.chunk_size):
+                piece = body[pos : pos + network.chunk_size]
+                if network.chunked:
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(piece), piece))
+                else:
+                    self.wfile.write(piece)
+                if network.bandwidth:
+                    sent = pos + len(piece)
+                    ahead = sent / network.bandwidth - (time.perf_counter() - started)
+                    if ahead > 0:
+                        time.sleep(ahead)
+            if network.chunked:
+                self.wfile.write(b"0\r\n\r\n")
+
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            if (
+                api_key is not None
+                and self.headers.get("Partner-Authorization") != api_key
+            ):
+                self._send_status(HTTPStatus.UNAUTHORIZED)
+                return
+            if network.latency > 0:
+                time.sleep(network.latency)
+            if random.random() < network.error_rate:
+                self._send_status(HTTPStatus.SERVICE_UNAVAILABLE)
+                return
+            if url.path == "/api/routes":
+                partner = None
+            elif url.path == "/api/availability":
+                partner = parse_qs(url.query).get("source", ["aeroplan"])[0]
+            else:
+                self._send_status(HTTPStatus.NOT_FOUND)
+                return
+            compressed = network.gzip and "gzip" in self.headers.get(
+                "Accept-Encoding", ""
+            )
+            payload = payloads.get(partner, compressed)
+            if payload is None:
+                self._send_status(HTTPStatus.NOT_FOUND)
+                return
+            body, etag = payload
+            if self.headers.get("If-None-Match") == etag:
+                self._send_status(HTTPStatus.NOT_MODIFIED)
+                return
+
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", etag)
+            if compressed:
+                self.send_header("Content-Encoding", "gzip")
+            if network.chunked:
+                self.send_header("Transfer-Encoding", "chunked")
+            else:
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self._write_body(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.info(format, *args)
+
+    return Handler
+
+
+def _download(
+    client: SeatsAeroClient, path: str, params: Dict[str, str], target: Path
+) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(f".{target.name}.tmp")
+    with client.get(path, params=params, stream=True) as response:
+        if response.status_code != 200:
+            raise ValueError(f"Failed to fetch {path}: {response.text}")
+        with open(staging, "wb") as f:
+            for chunk in response.iter_content(1 << 16):
+                f.write(chunk)
+    os.replace(staging, target)
+
+
+def record(client: SeatsAeroClient, root: Path, partner_names: Iterable[str]) -> None:
+    """Save live responses as fixtures that ``Payloads`` replays."""
+    _download(client, "/api/routes", {}, root / "routes.json")
+    for partner in partner_names:
+        _download(
+            client,
+            "/api/availability",
+            {"source": partner},
+            root / "availability" / f"{partner}.json",
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="serve fixtures or synthetic payloads")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8900)
+    serve.add_argument("--fixtures", type=Path, help="replay recorded payloads")
+    serve.add_argument("--rows", type=int, default=100_000, help="synthetic rows")
+    serve.add_argument("--routes", type=int, default=2_000, help="synthetic routes")
+    serve.add_argument("--latency", type=float, default=0.0, help="seconds")
+    serve.add_argument("--bandwidth", type=float, help="bytes per second")
+    serve.add_argument("--chunk-size", type=int, default=1 << 16)
+    serve.add_argument("--chunked", action="store_true")
+    serve.add_argument("--error-rate", type=float, default=0.0)
+    serve.add_argument("--gzip", action="store_true")
+    serve.add_argument("--api-key", help="reject requests without this key")
+
+    rec = commands.add_parser("record", help="record live payloads as fixtures")
+    rec.add_argument("root", type=Path)
+    rec.add_argument("--partners", nargs="+", default=partners)
+    rec.add_argument("--base-url", help="defaults to SEATS_AERO_BASE_URL")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "record":
+        record(SeatsAeroClient(base_url=args.base_url), args.root, args.partners)
+        return
+
+    payloads = Payloads(args.fixtures, args.rows, args.routes)
+    network = NetworkProfile(
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+        chunk_size=args.chunk_size,
+        chunked=args.chunked,
+        error_rate=args.error_rate,
+        gzip=args.gzip,
+    )
+    server = ThreadingHTTPServer(
+        (args.host, args.port), make_handler(payloads, network, args.api_key)
+    )
+    logger.info("Serving on http://%s:%d", args.host, args.port)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
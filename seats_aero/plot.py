@@ -1,55 +1,184 @@
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
-from seats_aero.api import Availability
+from seats_aero import metrics
+from seats_aero.api import fares, split_airlines
+from seats_aero.table import _DAY_BITS, AvailabilityTable
 
 
 def get_route_df(
-    availabilities: List[Availability],
+    table: AvailabilityTable,
     canonical_route: List[Tuple[str, str]],
     airlines: List[str] = [],
     class_code: List[str] = [],
+    start_date: Optional[np.datetime64] = None,
+    end_date: Optional[np.datetime64] = None,
+    min_seats: int = 0,
+    cheapest: bool = False,
 ) -> pd.DataFrame:
-    airlines_set = set(airlines)
-    class_code_set = set(class_code)
-    avail_dict: Dict[Tuple[str, str], List[Availability]] = defaultdict(list)
-    for availability in availabilities:
-        leg = (
-            availability.route.origin_airport,
-            availability.route.destination_airport,
+    """One row per matching availability and fare of the given legs.
+
+    With ``cheapest``, only the lowest mileage cost of every (leg, date, fare) and
+    partner is kept; availabilities without a known cost are only kept when
+    nothing else is.
+    """
+    with metrics.span("route_df"):
+        route_df = _get_route_df(
+            table,
+            canonical_route,
+            airlines,
+            class_code,
+            start_date,
+            end_date,
+            min_seats,
+            cheapest,
         )
-        if leg not in avail_dict:
-            avail_dict[leg] = []
-        avail_dict[leg].append(availability)
-    res = []
-    for org, dest in canonical_route:
-        for availability in avail_dict[(org, dest)]:
-            for fare in ["Y", "W", "F", "J"]:
-                if not availability.available(fare):
-                    continue
-                res.append(
-                    {
-                        "date": availability.parsed_date,
-                        "route": availability.route_str(),
-                        "airlines": availability.airlines(fare),
-                        "fare": fare,
-                        "freshness": availability.computed_last_seen,
-                        "direct": availability.direct(fare),
-                    }
-                )
-    if len(airlines_set) > 0:
-        res = [
-            r
-            for r in res
-            if len(
-                set(airline.strip() for airline in r["airlines"].split(","))
-                & airlines_set
-            )
-            > 0
-        ]
-    if len(class_code_set) > 0:
-        res = [r for r in res if len(set(r["fare"].split(" ")) & class_code_set) > 0]
-    df = pd.DataFrame(res)
-    return df
+    metrics.count("rows_emitted", len(route_df))
+    return route_df
+
+
+def _get_route_df(
+    table: AvailabilityTable,
+    canonical_route: List[Tuple[str, str]],
+    airlines: List[str],
+    class_code: List[str],
+    start_date: Optional[np.datetime64],
+    end_date: Optional[np.datetime64],
+    min_seats: int,
+    cheapest: bool,
+) -> pd.DataFrame:
+    index = table.leg_index
+    legs, requested_at = index.lookup(canonical_route)
+    rows, owner = index.take(legs, start_date, end_date)
+
+    mask = table.fare_mask(rows, airlines, class_code, min_seats)
+    hits, hit_fares = np.nonzero(mask)
+    hit_rows = rows[hits]
+    if cheapest:
+        day = table.date[hit_rows].astype(np.int64)
+        series = owner[hits] * len(fares) + hit_fares
+        series = series * len(table.sources) + table.source[hit_rows]
+        group = (series << _DAY_BITS) + day
+        order = np.lexsort((_cost_rank(table.mileage_cost[hit_rows, hit_fares]), group))
+        first = np.sort(order[np.flatnonzero(np.diff(group[order], prepend=-1))])
+        hits, hit_fares, hit_rows = hits[first], hit_fares[first], hit_rows[first]
+
+    labels = np.array(
+        [
+            f"{org} -> {dest}"
+            for org, dest in (canonical_route[i] for i in requested_at)
+        ],
+        dtype=np.str_,
+    )
+    return pd.DataFrame(
+        {
+            "date": table.date[hit_rows].astype("datetime64[ns]"),
+            "route": labels[owner[hits]],
+            "airlines": table.airline_strings[table.airlines[hit_rows, hit_fares]],
+            "fare": np.array(fares)[hit_fares],
+            "freshness": table.computed_last_seen[hit_rows].astype("datetime64[ns]"),
+            "direct": table.direct[hit_rows, hit_fares],
+            "partner": table.sources[table.source[hit_rows]],
+            "mileage_cost": table.mileage_cost[hit_rows, hit_fares],
+            "remaining_seats": table.remaining_seats[hit_rows, hit_fares],
+        }
+    )
+
+
+def _cost_rank(costs: np.ndarray) -> np.ndarray:
+    # unknown costs are stored as 0 but rank after every known one
+    return np.where(costs == 0, np.iinfo(np.int64).max, costs.astype(np.int64))
+
+
+def _known_cost(ranks: np.ndarray) -> np.ndarray:
+    return np.where(ranks == np.iinfo(np.int64).max, 0, ranks).astype(np.uint32)
+
+
+# bucket widths in days tried, in order, until the chart fits
+_BUCKET_DAYS = [1, 2, 7, 14, 30, 61, 91, 182, 365]
+
+
+def _merge_lists(values: np.ndarray) -> str:
+    # merges comma separated lists such as airlines or partners
+    merged = set()
+    for value in set(values.tolist()):
+        merged.update(split_airlines(value))
+    return ", ".join(sorted(merged))
+
+
+def downsample_route_df(
+    route_df: pd.DataFrame, max_points: int = 5000
+) -> Tuple[pd.DataFrame, int, int]:
+    """Collapse ``route_df`` to at most ``max_points`` points for charting.
+
+    Points are bucketed by (route, fare, date), with dates floored to the
+    narrowest bucket width that fits, and their airlines, partners, direct flags,
+    freshness, lowest known mileage cost and most remaining seats merged. If
+    even the widest buckets do not fit, trailing routes are dropped. Returns
+    the chart frame, the bucket width in days and the number of routes dropped.
+    """
+    with metrics.span("downsample"):
+        return _downsample_route_df(route_df, max_points)
+
+
+def _downsample_route_df(
+    route_df: pd.DataFrame, max_points: int
+) -> Tuple[pd.DataFrame, int, int]:
+    if len(route_df) == 0:
+        return route_df.assign(points=np.zeros(0, dtype=np.int64)), 1, 0
+    routes, route_labels = pd.factorize(route_df["route"])
+    fare_codes = pd.Categorical(route_df["fare"], categories=fares).codes
+    days = route_df["date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+    # (route, fare) of every point, with room for the bucket in the low bits
+    series = (routes.astype(np.int64) * len(fares) + fare_codes) << 20
+
+    def points(width: int) -> np.ndarray:
+        return np.unique(series + days // width)
+
+    width = next(
+        (w for w in _BUCKET_DAYS if len(points(w)) <= max_points), _BUCKET_DAYS[-1]
+    )
+    per_route = np.bincount(
+        (points(width) >> 20) // len(fares), minlength=len(route_labels)
+    )
+    kept = len(route_labels)
+    if per_route.sum() > max_points:
+        kept = max(int(np.searchsorted(np.cumsum(per_route), max_points, "right")), 1)
+
+    keep = np.flatnonzero(routes < kept)
+    keys = series[keep] + days[keep] // width
+    order = keep[np.argsort(keys, kind="stable")]
+    keys = np.sort(keys)
+    starts = np.flatnonzero(np.diff(keys, prepend=-1))
+    sizes = np.diff(np.append(starts, len(keys)))
+
+    merged = {}
+    for name in ["airlines", "partner"]:
+        values = route_df[name].to_numpy()[order]
+        merged[name] = values[starts].astype(object)
+        for group in np.flatnonzero(sizes > 1).tolist():
+            start = starts[group]
+            merged[name][group] = _merge_lists(values[start : start + sizes[group]])
+    freshness = route_df["freshness"].to_numpy()[order]
+    direct = route_df["direct"].to_numpy()[order]
+    cost = _cost_rank(route_df["mileage_cost"].to_numpy()[order])
+    seats = route_df["remaining_seats"].to_numpy()[order]
+    series_codes, buckets = np.divmod(keys[starts], 1 << 20)
+    route_codes, fare_codes = np.divmod(series_codes, len(fares))
+    chart_df = pd.DataFrame(
+        {
+            "date": (buckets * width).astype("datetime64[D]").astype("datetime64[ns]"),
+            "route": np.asarray(route_labels)[route_codes],
+            "airlines": merged["airlines"],
+            "fare": np.array(fares)[fare_codes],
+            "freshness": np.maximum.reduceat(freshness, starts),
+            "direct": np.logical_or.reduceat(direct, starts),
+            "partner": merged["partner"],
+            "mileage_cost": _known_cost(np.minimum.reduceat(cost, starts)),
+            "remaining_seats": np.maximum.reduceat(seats, starts),
+            "points": sizes,
+        }
+    )
+    return chart_df, width, len(route_labels) - kept
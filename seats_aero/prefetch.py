@@ -0,0 +1,202 @@
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from seats_aero.table import AvailabilityTable
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[
+    [str, Optional[AvailabilityTable], timedelta], Tuple[AvailabilityTable, datetime]
+]
+
+
+class PrefetchScheduler:
+    """Keeps the availabilities of a set of partners warm in the background.
+
+    Partners are refreshed on a thread pool of at most ``max_workers`` some time
+    within ``lead`` before their TTL runs out, with the exact moment jittered per
+    partner so refreshes do not line up. Readers are always served the last
+    loaded table (stale-while-revalidate); they only block on a partner's very
+    first load.
+
+    ``load`` is called with the partner, the table it is replacing, if any, and
+    the age up to which a stored snapshot may be served instead of fetching.
+
+    ``get_all`` combines the loaded partners into one table, built on the first
+    such call and then kept up to date by swapping in the rows of the partners
+    refreshed since, rather than rebuilt.
+    """
+
+    def __init__(
+        self,
+        load: Loader,
+        ttl: timedelta,
+        partners: Iterable[str] = (),
+        max_workers: int = 2,
+        lead: timedelta = timedelta(minutes=3),
+        interval: float = 10,
+    ):
+        self.load = load
+        self.ttl = ttl
+        self.lead = lead
+        self.interval = interval
+        self._tracked: List[str] = list(partners)
+        self._entries: Dict[str, Tuple[AvailabilityTable, datetime]] = {}
+        self._due: Dict[str, datetime] = {}
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        # the combined table, and the table and rows of each partner in it
+        self._combined: Optional[AvailabilityTable] = None
+        self._parts: Dict[str, Tuple[AvailabilityTable, int, int]] = {}
+        self._combine_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="prefetch")
+
+    def _refresh(
+        self, partner: str, future: Future
+    ) -> Tuple[AvailabilityTable, datetime]:
+        previous = self._entries.get(partner)
+        # refreshing a loaded partner must not pick up the snapshot it came from
+        max_age = self.ttl - self.lead if previous else self.ttl
+        try:
+            entry = self.load(partner, previous[0] if previous else None, max_age)
+        except Exception:
+            logger.exception("Failed to load availabilities for %s", partner)
+            with self._lock:
+                self._due[partner] = datetime.now() + timedelta(seconds=60)
+                self._unpend(partner, future)
+            raise
+        jitter = self.lead * random.random()
+        with self._lock:
+            self._entries[partner] = entry
+            self._due[partner] = entry[1] + self.ttl - self.lead + jitter
+            self._unpend(partner, future)
+        return entry
+
+    def _unpend(self, partner: str, future: Future) -> None:
+        if self._pending.get(partner) is future:
+            del self._pending[partner]
+
+    def _run(self, partner: str, future: Future) -> None:
+        # a queued refresh is run by whoever claims it first, a pool worker or a
+        # reader that cannot wait for the pool; everyone else waits on ``future``
+        with self._lock:
+            if future.running() or future.done():
+                return
+            future.set_running_or_notify_cancel()
+        try:
+            entry = self._refresh(partner, future)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(entry)
+
+    def _submit(self, partner: str) -> Future:
+        with self._lock:
+            future = self._pending.get(partner)
+            if future is None:
+                future = self._pending[partner] = Future()
+                self._executor.submit(self._run, partner, future)
+            return future
+
+    def get(self, partner: str) -> Tuple[AvailabilityTable, datetime]:
+        with self._lock:
+            if partner not in self._tracked:
+                self._tracked.append(partner)
+            entry = self._entries.get(partner)
+        if entry is not None:
+            if datetime.now() - entry[1] >= self.ttl:
+                self._submit(partner)
+            return entry
+        future = self._submit(partner)
+        # still queued behind other partners, load it on the caller instead
+        self._run(partner, future)
+        return future.result()
+
+    def get_all(
+        self, partner_names: Iterable[str]
+    ) -> Tuple[AvailabilityTable, datetime]:
+        """Return one table holding the availabilities of every partner, loading
+        the partners that are not loaded yet, and when the newest of them was
+        fetched."""
+        names = list(partner_names)
+        with self._lock:
+            self._tracked.extend(p for p in names if p not in self._tracked)
+            missing = [p for p in names if p not in self._entries]
+        for future in [self._submit(p) for p in missing]:
+            future.result()
+        with self._lock:
+            entries = {p: self._entries[p] for p in names}
+        with self._combine_lock:
+            if self._combined is None or set(self._parts) != set(names):
+                self._combine(names, entries)
+            else:
+                self._update_combined(entries)
+            combined = self._combined
+        assert combined is not None
+        return combined, max(fetched_at for _, fetched_at in entries.values())
+
+    def _combine(
+        self, names: List[str], entries: Dict[str, Tuple[AvailabilityTable, datetime]]
+    ) -> None:
+        tables = [entries[p][0] for p in names]
+        combined = AvailabilityTable.concat(tables)
+        # build the indexes once, they are carried over as partners are swapped
+        combined.leg_index.destinations
+        combined.airline_vocabulary
+        stops = np.cumsum([len(table) for table in tables]).tolist()
+        self._parts = {
+            partner: (table, stop - len(table), stop)
+            for partner, table, stop in zip(names, tables, stops)
+        }
+        self._combined = combined
+
+    def _update_combined(
+        self, entries: Dict[str, Tuple[AvailabilityTable, datetime]]
+    ) -> None:
+        # swap the rows of every partner refreshed since into the combined table;
+        # the rows of each partner stay contiguous, a refreshed one moves last
+        for partner, (table, _) in entries.items():
+            previous, start, stop = self._parts[partner]
+            if table is previous:
+                continue
+            assert self._combined is not None
+            self._combined = self._combined.replace_rows(start, stop, table)
+            removed = stop - start
+            self._parts = {
+                other: (part, a - removed, b - removed) if a >= stop else (part, a, b)
+                for other, (part, a, b) in self._parts.items()
+            }
+            total = len(self._combined)
+            self._parts[partner] = (table, total - len(table), total)
+
+    def tick(self) -> None:
+        """Submit every tracked partner that is due for a refresh."""
+        now = datetime.now()
+        with self._lock:
+            due = [
+                partner
+                for partner in self._tracked
+                if partner not in self._pending and self._due.get(partner, now) <= now
+            ]
+        for partner in due:
+            self._submit(partner)
+
+    def start(self) -> threading.Thread:
+        def run() -> None:
+            while True:
+                try:
+                    self.tick()
+                except Exception:
+                    logger.exception("Failed to schedule availability prefetch")
+                time.sleep(self.interval)
+
+        thread = threading.Thread(target=run, name="prefetch-scheduler", daemon=True)
+        thread.start()
+        return thread
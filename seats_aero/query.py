@@ -0,0 +1,162 @@
+import functools
+from dataclasses import dataclass
+from typing import AbstractSet, Dict, Iterable, List, Mapping, Tuple
+
+import numpy as np
+
+from seats_aero.airport import city_expansion_dict, country_expansion_dict
+
+
+@functools.lru_cache(maxsize=1 << 10)
+def expand_code(code: str, expand_country: bool, expand_city: bool) -> Tuple[str, ...]:
+    if expand_country and code in country_expansion_dict():
+        return tuple(country_expansion_dict()[code])
+    if expand_city and code in city_expansion_dict():
+        return tuple(city_expansion_dict()[code])
+    return (code,)
+
+
+@dataclass(frozen=True)
+class QueryLeg:
+    """One leg of a route query with both ends expanded to airports."""
+
+    origins: Tuple[str, ...]
+    destinations: Tuple[str, ...]
+    origin_rank: Dict[str, int]
+    destination_rank: Dict[str, int]
+
+    @staticmethod
+    def expand(
+        org: str, dest: str, expand_country: bool, expand_city: bool
+    ) -> "QueryLeg":
+        origins = expand_code(org, expand_country, expand_city)
+        destinations = expand_code(dest, expand_country, expand_city)
+        return QueryLeg(
+            origins=origins,
+            destinations=destinations,
+            origin_rank={o: i for i, o in enumerate(origins)},
+            destination_rank={d: i for i, d in enumerate(destinations)},
+        )
+
+    @property
+    def candidate_count(self) -> int:
+        return len(self.origins) * len(self.destinations)
+
+    def positions(self, legs: Iterable[Tuple[str, str]]) -> np.ndarray:
+        """Return the sorted positions of ``legs`` in the product of origins and
+        destinations, ignoring legs outside of it."""
+        width = len(self.destinations)
+        found = {
+            self.origin_rank[org] * width + self.destination_rank[dest]
+            for org, dest in legs
+            if org in self.origin_rank and dest in self.destination_rank
+        }
+        return np.array(sorted(found), dtype=np.int64)
+
+    def missing(
+        self, present: AbstractSet[Tuple[str, str]], start: int, stop: int
+    ) -> List[Tuple[str, str]]:
+        """Return the ``start:stop`` slice of the candidates not in ``present``.
+
+        The i-th taken position is preceded by ``taken[i] - i`` missing ones, so
+        the rank of every missing candidate is found by binary search without
+        walking the product.
+        """
+        taken = self.positions(present)
+        ranks = np.arange(start, stop)
+        positions = ranks + np.searchsorted(
+            taken - np.arange(len(taken)), ranks, side="right"
+        )
+        width = len(self.destinations)
+        return [
+            (self.origins[i // width], self.destinations[i % width])
+            for i in positions.tolist()
+        ]
+
+    def match(
+        self, served_from: Mapping[str, AbstractSet[str]]
+    ) -> List[Tuple[str, str]]:
+        res = []
+        for origin in self.origins:
+            served = served_from.get(origin)
+            if not served:
+                continue
+            if len(served) < len(self.destinations):
+                rank = self.destination_rank
+                hits = sorted((d for d in served if d in rank), key=rank.__getitem__)
+            else:
+                hits = [d for d in self.destinations if d in served]
+            res.extend((origin, dest) for dest in hits)
+        return res
+
+
+@dataclass(frozen=True)
+class RouteQuery:
+    """A parsed route such as ``"US - LHR - NYC, CA - HKG"``.
+
+    Each comma separated segment is a sequence of consecutive legs. The legs are
+    kept as (origins, destinations) pairs rather than as their product, which
+    for country codes easily runs into the hundreds of thousands.
+    """
+
+    segments: Tuple[Tuple[QueryLeg, ...], ...]
+
+    @property
+    def legs(self) -> List[QueryLeg]:
+        return [leg for segment in self.segments for leg in segment]
+
+    def candidate_count(self) -> int:
+        return sum(leg.candidate_count for leg in self.legs)
+
+    def missing_count(self, present: AbstractSet[Tuple[str, str]]) -> int:
+        return sum(
+            leg.candidate_count - len(leg.positions(present)) for leg in self.legs
+        )
+
+    def missing(
+        self, present: AbstractSet[Tuple[str, str]], start: int, stop: int
+    ) -> List[Tuple[str, str]]:
+        """Return the ``start:stop`` slice of the candidates not in ``present``,
+        in candidate order, computing only the legs the slice falls into."""
+        res = []
+        offset = 0
+        for leg in self.legs:
+            count = leg.candidate_count - len(leg.positions(present))
+            lo, hi = max(start - offset, 0), min(stop - offset, count)
+            if lo < hi:
+                res.extend(leg.missing(present, lo, hi))
+            offset += count
+            if offset >= stop:
+                break
+        return res
+
+    def match(
+        self, served_from: Mapping[str, AbstractSet[str]]
+    ) -> List[Tuple[str, str]]:
+        """Return the candidates that are actual legs, in candidate order.
+
+        ``served_from`` maps each origin to the destinations served from it, so
+        only origins with data are visited and each costs at most the number of
+        its destinations.
+        """
+        res = []
+        for leg in self.legs:
+            res.extend(leg.match(served_from))
+        return res
+
+
+@functools.lru_cache(maxsize=1 << 8)
+def parse_route(
+    route: str, expand_country: bool = False, expand_city: bool = False
+) -> RouteQuery:
+    route = route.upper().replace(" ", "").replace("->", "-")
+    segments = []
+    for seg in route.split(","):
+        stops = seg.split("-")
+        segments.append(
+            tuple(
+                QueryLeg.expand(org, dest, expand_country, expand_city)
+                for org, dest in zip(stops[:-1], stops[1:])
+            )
+        )
+    return RouteQuery(tuple(segments))
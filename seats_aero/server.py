@@ -0,0 +1,245 @@
+"""Headless JSON API over the same query engine as the Streamlit app.
+
+python -m seats_aero.server --port 8080
+curl 'localhost:8080/api/routes?partner=aeroplan&route=US-LHR&fares=J'
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+from seats_aero import metrics
+from seats_aero.api import RouteCache, fares, partners
+from seats_aero.client import SeatsAeroClient
+from seats_aero.engine import ALL_PARTNERS, AvailabilitySource, query_routes
+from seats_aero.prefetch import PrefetchScheduler
+from seats_aero.snapshot import SnapshotStore
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+logger = logging.getLogger(__name__)
+
+
+def _split(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    return [item.strip().upper() for item in value.split(",") if item.strip()]
+
+
+def _flag(value: Optional[str], default: bool) -> bool:
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+def _count(params: Mapping[str, str], name: str, default: int) -> int:
+    value = int(params.get(name, default))
+    if value < 0:
+        raise ValueError(f"{name} must not be negative")
+    return value
+
+
+def _date(value: Optional[str]) -> Optional[np.datetime64]:
+    return np.datetime64(value, "D") if value else None
+
+
+class QueryService:
+    """Answers route queries from datasets shared by all requests.
+
+    Responses are cached per partner dataset generation, so repeated queries are
+    served without touching the table until the partner is refreshed.
+    """
+
+    def __init__(self, availabilities: PrefetchScheduler, cache_size: int = 256):
+        self.availabilities = availabilities
+        self.cache_size = cache_size
+        self._cache: OrderedDict[Tuple, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def routes(self, params: Mapping[str, str]) -> bytes:
+        partner = params.get("partner", "aeroplan")
+        if partner not in partners and partner != ALL_PARTNERS:
+            raise ValueError(f"Unknown partner {partner!r}")
+        route = params.get("route", "").upper()
+        if not route:
+            raise ValueError("Missing route")
+        airlines = _split(params.get("airlines"))
+        class_code = _split(params.get("fares"))
+        if any(code not in fares for code in class_code):
+            raise ValueError(f"Fares must be among {', '.join(fares)}")
+        expand_country = _flag(params.get("expand_country"), True)
+        expand_city = _flag(params.get("expand_city"), True)
+        start_date = _date(params.get("start"))
+        end_date = _date(params.get("end"))
+        min_seats = _count(params, "min_seats", 0)
+        cheapest = _flag(params.get("cheapest"), False)
+        offset = _count(params, "offset", 0)
+        limit = _count(params, "limit", 10_000)
+
+        if partner == ALL_PARTNERS:
+            table, fetched_at = self.availabilities.get_all(partners)
+        else:
+            table, fetched_at = self.availabilities.get(partner)
+        key = (
+            partner,
+            fetched_at,
+            route,
+            tuple(airlines),
+            tuple(class_code),
+            expand_country,
+            expand_city,
+            start_date,
+            end_date,
+            min_seats,
+            cheapest,
+            offset,
+            limit,
+        )
+        with self._lock:
+            body = self._cache.get(key)
+            if body is not None:
+                self._cache.move_to_end(key)
+                metrics.count("cache_hits", cache="api")
+                return body
+        metrics.count("cache_misses", cache="api")
+
+        _, legs, route_df = query_routes(
+            table,
+            route,
+            airlines,
+            class_code,
+            expand_country,
+            expand_city,
+            start_date,
+            end_date,
+            min_seats,
+            cheapest,
+        )
+        page = route_df.iloc[offset : offset + limit]
+        page = page.assign(
+            date=np.datetime_as_string(page["date"].to_numpy(), "D"),
+            freshness=np.datetime_as_string(page["freshness"].to_numpy(), "s"),
+        )
+        body = _dumps(
+            {
+                "partner": partner,
+                "fetched_at": fetched_at.isoformat(),
+                "legs": [f"{org} -> {dest}" for org, dest in legs],
+                "total": len(route_df),
+                "offset": offset,
+                "rows": page.to_dict("records"),
+            }
+        )
+        with self._lock:
+            self._cache[key] = body
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return body
+
+
+def make_handler(service: QueryService) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(
+            self,
+            status: HTTPStatus,
+            body: bytes,
+            content_type: str = "application/json",
+        ) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            params: Dict[str, str] = dict(parse_qsl(url.query))
+            try:
+                if url.path == "/healthz":
+                    self._send(HTTPStatus.OK, b'{"status":"ok"}')
+                elif url.path == "/api/routes":
+                    self._send(HTTPStatus.OK, service.routes(params))
+                elif url.path == "/metrics":
+                    self._send(
+                        HTTPStatus.OK,
+                        metrics.to_prometheus().encode(),
+                        "text/plain; version=0.0.4",
+                    )
+                else:
+                    self._send(HTTPStatus.NOT_FOUND, _dumps({"error": "Not found"}))
+            except ValueError as e:
+                self._send(HTTPStatus.BAD_REQUEST, _dumps({"error": str(e)}))
+            except Exception:
+                logger.exception("Failed to answer %s", self.path)
+                self._send(
+                    HTTPStatus.INTERNAL_SERVER_ERROR,
+                    _dumps({"error": "Internal error"}),
+                )
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.info(format, *args)
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--base-url", help="defaults to SEATS_AERO_BASE_URL")
+    parser.add_argument("--ttl-minutes", type=float, default=15)
+    parser.add_argument(
+        "--partners", default="", help="comma separated partners to keep warm"
+    )
+    parser.add_argument(
+        "--metrics", action="store_true", help="collect metrics served on /metrics"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if args.metrics:
+        metrics.enable()
+
+    ttl = timedelta(minutes=args.ttl_minutes)
+    client = SeatsAeroClient(base_url=args.base_url)
+    snapshot_dir = os.environ.get("SEATS_AERO_SNAPSHOT_DIR")
+    source = AvailabilitySource(
+        RouteCache(),
+        ttl,
+        SnapshotStore(snapshot_dir) if snapshot_dir else None,
+        client,
+    )
+    scheduler = PrefetchScheduler(
+        source.load, ttl, [p for p in args.partners.split(",") if p]
+    )
+    scheduler.start()
+    server = ThreadingHTTPServer(
+        (args.host, args.port), make_handler(QueryService(scheduler))
+    )
+    logger.info("Serving on http://%s:%d", args.host, args.port)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
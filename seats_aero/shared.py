@@ -0,0 +1,171 @@
+import contextlib
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from seats_aero.engine import ALL_PARTNERS
+from seats_aero.snapshot import SnapshotStore
+from seats_aero.table import AvailabilityTable
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class SharedAvailabilityStore:
+    """Shares availability snapshots between worker processes on one host.
+
+    The first worker that finds a partner missing or stale fetches it and publishes
+    a new generation to the snapshot store while holding a per-partner file lock;
+    every worker attaches to the newest generation through read-only memory maps,
+    so the data is held once by the page cache rather than once per process.
+    """
+
+    def __init__(
+        self,
+        snapshots: SnapshotStore,
+        fetch: Callable[[str], AvailabilityTable],
+        ttl: timedelta,
+    ):
+        self.snapshots = snapshots
+        self.fetch = fetch
+        self.ttl = ttl
+        self._attached: Dict[str, Tuple[Path, AvailabilityTable, datetime]] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _publish_lock(self, partner: str, blocking: bool = True) -> Iterator[bool]:
+        partner_dir = self.snapshots.root / partner
+        partner_dir.mkdir(parents=True, exist_ok=True)
+        with open(partner_dir / ".lock", "w") as f:
+            acquired = True
+            if fcntl is not None:
+                flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+                try:
+                    fcntl.flock(f, flags)
+                except BlockingIOError:
+                    acquired = False
+            try:
+                yield acquired
+            finally:
+                if acquired and fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _is_fresh(self, fetched_at: datetime, lead: timedelta = timedelta()) -> bool:
+        return datetime.now() - fetched_at < self.ttl - lead
+
+    def _newest(self, partner: str) -> Optional[Tuple[datetime, Path]]:
+        generations = self.snapshots.snapshots(partner)
+        return generations[0] if generations else None
+
+    def publish(self, partner: str) -> None:
+        """Fetch ``partner`` and publish it as a new generation."""
+        table = self.fetch(partner)
+        self.snapshots.save(partner, table, datetime.now())
+
+    def get(self, partner: str) -> Tuple[AvailabilityTable, datetime]:
+        newest = self._newest(partner)
+        if newest is None or not self._is_fresh(newest[0]):
+            with self._publish_lock(partner):
+                # another worker may have published while we waited for the lock
+                newest = self._newest(partner)
+                if newest is None or not self._is_fresh(newest[0]):
+                    self.publish(partner)
+                    newest = self._newest(partner)
+        if newest is None:
+            raise RuntimeError(f"No snapshot published for {partner}")
+        try:
+            return self._attach(partner, *newest)
+        except OSError:
+            # the generation was pruned between listing and attaching
+            newest = self._newest(partner)
+            if newest is None:
+                raise
+            return self._attach(partner, *newest)
+
+    def get_all(
+        self, partner_names: Iterable[str]
+    ) -> Tuple[AvailabilityTable, datetime]:
+        """Return the generations of ``partner_names`` combined into one table.
+
+        The combined table is published as a generation of its own, named after
+        ``ALL_PARTNERS`` and stamped with the newest partner generation in it, so
+        one worker builds it and every worker memory-maps it. It is rebuilt once
+        any partner has a newer generation.
+        """
+        entries = [self.get(partner) for partner in partner_names]
+        fetched_at = max(fetched_at for _, fetched_at in entries)
+        newest = self._newest(ALL_PARTNERS)
+        if newest is None or newest[0] < fetched_at:
+            with self._publish_lock(ALL_PARTNERS):
+                newest = self._newest(ALL_PARTNERS)
+                if newest is None or newest[0] < fetched_at:
+                    combined = AvailabilityTable.concat([table for table, _ in entries])
+                    self.snapshots.save(ALL_PARTNERS, combined, fetched_at)
+                    newest = self._newest(ALL_PARTNERS)
+        if newest is None:
+            raise RuntimeError("No combined snapshot published")
+        try:
+            return self._attach(ALL_PARTNERS, *newest)
+        except OSError:
+            # the generation was pruned between listing and attaching
+            newest = self._newest(ALL_PARTNERS)
+            if newest is None:
+                raise
+            return self._attach(ALL_PARTNERS, *newest)
+
+    def _attach(
+        self, partner: str, fetched_at: datetime, path: Path
+    ) -> Tuple[AvailabilityTable, datetime]:
+        with self._lock:
+            attached = self._attached.get(partner)
+            if attached is not None and attached[0] == path:
+                return attached[1], attached[2]
+        table = self.snapshots.load(path)
+        table.airline_vocabulary
+        with self._lock:
+            self._attached[partner] = (path, table, fetched_at)
+        return table, fetched_at
+
+    def refresh_due(self, lead: timedelta) -> None:
+        """Publish a new generation for every attached partner that expires
+        within ``lead``, unless another worker is already doing so."""
+        with self._lock:
+            # the combined generation is republished by ``get_all``
+            partners = [p for p in self._attached if p != ALL_PARTNERS]
+        for partner in partners:
+            newest = self._newest(partner)
+            if newest is not None and self._is_fresh(newest[0], lead):
+                continue
+            with self._publish_lock(partner, blocking=False) as acquired:
+                if not acquired:
+                    continue
+                newest = self._newest(partner)
+                if newest is None or not self._is_fresh(newest[0], lead):
+                    self.publish(partner)
+
+    def start_refresher(
+        self, lead: timedelta = timedelta(minutes=2), interval: float = 30
+    ) -> threading.Thread:
+        """Refresh attached partners ahead of expiry from a daemon thread, so
+        requests keep being served from the current generation meanwhile."""
+
+        def run() -> None:
+            while True:
+                try:
+                    self.refresh_due(lead)
+                except Exception:
+                    logger.exception("Failed to refresh shared availabilities")
+                time.sleep(interval)
+
+        thread = threading.Thread(
+            target=run, name="availability-refresher", daemon=True
+        )
+        thread.start()
+        return thread
@@ -0,0 +1,136 @@
+import dataclasses
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from seats_aero.table import AvailabilityTable, LegIndex
+
+_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S%f"
+# bumped whenever the stored columns change, older snapshots are ignored
+_FORMAT_VERSION = 2
+_LEG_INDEX_ARRAYS = ["keys", "offsets", "rows", "date_keys"]
+
+
+def _load_array(path: Path) -> np.ndarray:
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+
+def _format_version(path: Path) -> Optional[int]:
+    try:
+        with open(path / "meta.json") as f:
+            return json.load(f).get("version", 1)
+    except (OSError, ValueError):
+        return None
+
+
+class SnapshotStore:
+    """Persists AvailabilityTables on disk, one directory per partner and fetch.
+
+    Every column is written as its own ``.npy`` file, so loading a snapshot
+    memory-maps the columns instead of reading and parsing them. The leg index is
+    stored alongside so that processes attaching to a snapshot share it as well.
+    """
+
+    def __init__(self, root: Union[str, Path], keep: int = 2):
+        self.root = Path(root)
+        self.keep = keep
+
+    def _partner_dir(self, partner: str) -> Path:
+        return self.root / partner
+
+    def snapshots(self, partner: str) -> List[Tuple[datetime, Path]]:
+        """Return the complete snapshots of ``partner``, newest first."""
+        partner_dir = self._partner_dir(partner)
+        if not partner_dir.is_dir():
+            return []
+        res = []
+        for path in partner_dir.iterdir():
+            if path.name.startswith("."):
+                continue
+            if _format_version(path) != _FORMAT_VERSION:
+                continue
+            try:
+                fetched_at = datetime.strptime(path.name, _TIMESTAMP_FORMAT)
+            except ValueError:
+                continue
+            res.append((fetched_at, path))
+        return sorted(res, reverse=True)
+
+    def save(
+        self, partner: str, table: AvailabilityTable, fetched_at: datetime
+    ) -> Path:
+        partner_dir = self._partner_dir(partner)
+        partner_dir.mkdir(parents=True, exist_ok=True)
+        target = partner_dir / fetched_at.strftime(_TIMESTAMP_FORMAT)
+        # write into a hidden directory and rename it so readers never observe a
+        # partially written snapshot
+        staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=partner_dir))
+        try:
+            for field in dataclasses.fields(table):
+                np.save(staging / f"{field.name}.npy", getattr(table, field.name))
+            for name in _LEG_INDEX_ARRAYS:
+                np.save(
+                    staging / f"leg_index.{name}.npy", getattr(table.leg_index, name)
+                )
+            with open(staging / "meta.json", "w") as f:
+                json.dump(
+                    {
+                        "fetched_at": fetched_at.isoformat(),
+                        "rows": len(table),
+                        "version": _FORMAT_VERSION,
+                    },
+                    f,
+                )
+            os.rename(staging, target)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        self.prune(partner)
+        return target
+
+    def load(self, path: Union[str, Path]) -> AvailabilityTable:
+        path = Path(path)
+        table = AvailabilityTable(
+            **{
+                field.name: _load_array(path / f"{field.name}.npy")
+                for field in dataclasses.fields(AvailabilityTable)
+            }
+        )
+        if all(
+            (path / f"leg_index.{name}.npy").is_file() for name in _LEG_INDEX_ARRAYS
+        ):
+            # seed the cached property rather than rebuilding the index
+            table.__dict__["leg_index"] = LegIndex(
+                **{
+                    name: _load_array(path / f"leg_index.{name}.npy")
+                    for name in _LEG_INDEX_ARRAYS
+                },
+                airports=table.airports,
+                airport_index={a: i for i, a in enumerate(table.airports.tolist())},
+            )
+        return table
+
+    def latest(
+        self, partner: str, max_age: Optional[timedelta] = None
+    ) -> Optional[Tuple[AvailabilityTable, datetime]]:
+        """Return the newest snapshot of ``partner`` that is younger than
+        ``max_age``, if any."""
+        for fetched_at, path in self.snapshots(partner):
+            if max_age is not None and datetime.now() - fetched_at > max_age:
+                return None
+            try:
+                return self.load(path), fetched_at
+            except (OSError, ValueError):
+                # removed by a concurrent prune or written by an older version
+                continue
+        return None
+
+    def prune(self, partner: str) -> None:
+        for _, path in self.snapshots(partner)[self.keep :]:
+            shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,109 @@
+"""Deterministic synthetic payloads shaped like the seats.aero partner API."""
+
+import json
+import random
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List
+
+AIRPORTS = [
+    "ATL", "BOS", "DEN", "DFW", "EWR", "IAD", "IAH", "JFK", "LAX", "LGA", "MIA",
+    "ORD", "SEA", "SFO", "YUL", "YVR", "YYC", "YYZ", "MEX", "GRU", "EZE", "LHR",
+    "LGW", "CDG", "AMS", "FRA", "MUC", "ZRH", "MAD", "FCO", "IST", "DXB", "DOH",
+    "AUH", "DEL", "BOM", "SIN", "HKG", "TPE", "ICN", "NRT", "HND", "KIX", "PVG",
+    "PEK", "BKK", "SYD", "MEL", "AKL", "JNB",
+]  # fmt: skip
+
+# roughly ordered by how often they show up in partner results
+AIRLINES = [
+    "AC", "UA", "LH", "NH", "AA", "BA", "DL", "AF", "KL", "LX", "OS", "SQ", "CX",
+    "TK", "EK", "QR", "QF", "NZ", "JL", "OZ", "BR", "TP", "SK", "AV", "CM", "ET",
+    "MS", "SA", "AI", "TG",
+]  # fmt: skip
+
+# share of rows with availability in each fare
+FARE_AVAILABILITY = {"Y": 0.6, "W": 0.2, "J": 0.35, "F": 0.08}
+FARE_COST = {"Y": 12500, "W": 25000, "J": 55000, "F": 90000}
+
+
+def generate_routes(n: int, seed: int = 0, source: str = "aeroplan") -> List[Dict]:
+    rng = random.Random(seed)
+    routes: List[Dict] = []
+    seen = set()
+    while len(routes) < n:
+        origin, destination = rng.sample(AIRPORTS, 2)
+        if (origin, destination) in seen and len(seen) < len(AIRPORTS) ** 2 // 2:
+            continue
+        seen.add((origin, destination))
+        routes.append(
+            {
+                "ID": f"R{seed:02d}{len(routes):08d}",
+                "OriginAirport": origin,
+                "OriginRegion": "North America",
+                "DestinationAirport": destination,
+                "DestinationRegion": "Europe",
+                "NumDaysOut": 330,
+                "Distance": rng.randint(300, 9000),
+                "Source": source,
+            }
+        )
+    return routes
+
+
+def generate_availabilities(
+    routes: List[Dict],
+    n: int,
+    seed: int = 0,
+    source: str = "aeroplan",
+    start: date = date(2024, 1, 1),
+    days: int = 330,
+) -> Iterator[Dict]:
+    rng = random.Random(seed)
+    weights = [1 / (i + 1) for i in range(len(AIRLINES))]
+    last_seen = datetime(2024, 1, 1)
+    for i in range(n):
+        route = rng.choice(routes)
+        day = start + timedelta(days=rng.randrange(days))
+        seen = last_seen - timedelta(seconds=rng.randrange(86400))
+        raw = {
+            "ID": f"A{seed:02d}{i:010d}",
+            "RouteID": route["ID"],
+            "Date": day.isoformat(),
+            "ParsedDate": f"{day.isoformat()}T00:00:00Z",
+        }
+        for fare, share in FARE_AVAILABILITY.items():
+            available = rng.random() < share
+            airlines = (
+                ", ".join(
+                    sorted(set(rng.choices(AIRLINES, weights, k=rng.randint(1, 3))))
+                )
+                if available
+                else ""
+            )
+            raw[f"{fare}Available"] = available
+            raw[f"{fare}MileageCost"] = (
+                str(FARE_COST[fare] * rng.randint(1, 4) // 2) if available else "0"
+            )
+            raw[f"{fare}RemainingSeats"] = rng.randint(0, 9) if available else 0
+            raw[f"{fare}Airlines"] = airlines
+            raw[f"{fare}Direct"] = available and rng.random() < 0.4
+        raw["Source"] = source
+        raw["ComputedLastSeen"] = seen.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        yield raw
+
+
+def encode_payload(
+    records: Iterable[Dict], chunk_size: int = 1 << 16
+) -> Iterator[bytes]:
+    """Encode ``records`` as the JSON array body of /api/routes or
+    /api/availability, cut into ``chunk_size`` byte chunks like a streamed
+    response, so chunk boundaries fall inside records."""
+    buf = bytearray(b"[")
+    for i, record in enumerate(records):
+        if i > 0:
+            buf += b","
+        buf += json.dumps(record).encode()
+        while len(buf) >= chunk_size:
+            yield bytes(buf[:chunk_size])
+            del buf[:chunk_size]
+    buf += b"]"
+    yield bytes(buf)
@@ -0,0 +1,742 @@
+import functools
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+
+from seats_aero import metrics
+from seats_aero.api import Availability, Route, fares, split_airlines
+
+logger = logging.getLogger(__name__)
+
+
+class Vocabulary:
+    """Interns strings into dense integer codes."""
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.index: Dict[str, int] = {}
+        self.values: List[str] = []
+        for value in values:
+            self.code(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def code(self, value: str) -> int:
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def to_array(self) -> np.ndarray:
+        return np.array(self.values, dtype=np.str_)
+
+
+def _extend_vocabulary(
+    values: np.ndarray, other: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Append the values of ``other`` missing from ``values``; returns the extended
+    vocabulary and the new code of each value of ``other``."""
+    vocabulary = Vocabulary(values.tolist())
+    codes = np.array([vocabulary.code(v) for v in other.tolist()], dtype=np.int64)
+    return vocabulary.to_array(), codes
+
+
+def leg_key(origin: np.ndarray, destination: np.ndarray) -> np.ndarray:
+    # airport codes stay below 2**16 (there are 26**3 IATA codes), so keys do
+    # not depend on the vocabulary size and survive merges
+    return (origin.astype(np.int64) << 16) + destination
+
+
+# days since the epoch stay below 2**20 (year 4840), so a day packs into the low
+# bits of an int64 key
+_DAY_BITS = 20
+_DAY_MASK = (1 << _DAY_BITS) - 1
+
+
+def _parse_timestamps(values: List[str], unit: str) -> np.ndarray:
+    # numpy parses ISO 8601 natively but rejects the trailing UTC designator
+    return np.array([v.rstrip("Z") for v in values], dtype=f"datetime64[{unit}]")
+
+
+def _parse_cost(raw: object) -> int:
+    digits = str(raw).replace(",", "").strip()
+    return int(digits) if digits.isdigit() else 0
+
+
+def _parse_costs(costs: Sequence[Sequence]) -> np.ndarray:
+    """Parse per-fare mileage costs, which the API sends as decimal strings;
+    missing or malformed costs become 0."""
+    flat = [c for row in costs for c in row]
+    try:
+        values = [int(c) if c else 0 for c in flat]
+    except ValueError:
+        values = [_parse_cost(c) for c in flat]
+    return np.array(values, dtype=np.uint32).reshape(len(costs), len(fares))
+
+
+_ROW_COLUMNS = [
+    "id",
+    "route",
+    "origin",
+    "destination",
+    "date",
+    "available",
+    "direct",
+    "remaining_seats",
+    "mileage_cost",
+    "airlines",
+    "source",
+    "computed_last_seen",
+]
+_PER_FARE_COLUMNS = [
+    "available",
+    "direct",
+    "remaining_seats",
+    "mileage_cost",
+    "airlines",
+]
+# row columns holding codes into a vocabulary array
+_CODED_COLUMNS = {
+    "route": "route_ids",
+    "origin": "airports",
+    "destination": "airports",
+    "airlines": "airline_strings",
+    "source": "sources",
+}
+
+
+@dataclass
+class AvailabilityTable:
+    """Columnar store of availabilities for a single fetch.
+
+    Per-fare columns are 2-d arrays whose second axis follows ``fares``. Routes,
+    airports, airline strings and sources are stored as codes into the vocabulary
+    arrays.
+    """
+
+    id: np.ndarray  # bytes (n,)
+    route: np.ndarray  # int32 (n,) -> route_ids
+    origin: np.ndarray  # int32 (n,) -> airports
+    destination: np.ndarray  # int32 (n,) -> airports
+    date: np.ndarray  # datetime64[D] (n,)
+    available: np.ndarray  # bool (n, fares)
+    direct: np.ndarray  # bool (n, fares)
+    remaining_seats: np.ndarray  # uint32 (n, fares)
+    mileage_cost: np.ndarray  # uint32 (n, fares), 0 when unknown
+    airlines: np.ndarray  # int32 (n, fares) -> airline_strings
+    source: np.ndarray  # int16 (n,) -> sources
+    computed_last_seen: np.ndarray  # datetime64[s] (n,)
+
+    route_ids: np.ndarray
+    airports: np.ndarray
+    airline_strings: np.ndarray
+    sources: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            getattr(self, name).nbytes for name in self.__dataclass_fields__.keys()
+        )
+
+    def leg_keys(self) -> np.ndarray:
+        return leg_key(self.origin, self.destination)
+
+    @functools.cached_property
+    def leg_index(self) -> "LegIndex":
+        with metrics.span("leg_index"):
+            return LegIndex.build(self)
+
+    def legs(self) -> Set[Tuple[str, str]]:
+        return self.leg_index.legs()
+
+    @functools.cached_property
+    def airline_vocabulary(self) -> "AirlineVocabulary":
+        with metrics.span("airline_vocabulary"):
+            return AirlineVocabulary.build(self.airline_strings.tolist())
+
+    def all_airlines(self) -> Set[str]:
+        return set(self.airline_vocabulary.airlines)
+
+    def fare_mask(
+        self,
+        rows: np.ndarray,
+        airlines: List[str] = [],
+        class_code: List[str] = [],
+        min_seats: int = 0,
+    ) -> np.ndarray:
+        """Return, per row and fare, whether the fare is available and matches the
+        selected airlines, fare codes and minimum remaining seats. Empty
+        selections match everything."""
+        mask = self.available[rows]
+        if len(class_code) > 0:
+            mask = mask & np.isin(fares, class_code)
+        if len(airlines) > 0:
+            matches = self.airline_vocabulary.matches(airlines)
+            mask = mask & matches[self.airlines[rows]]
+        if min_seats > 0:
+            mask = mask & (self.remaining_seats[rows] >= min_seats)
+        return mask
+
+    @functools.cached_property
+    def id_order(self) -> np.ndarray:
+        return np.argsort(self.id, kind="stable")
+
+    def find(self, ids: np.ndarray) -> np.ndarray:
+        """Return the row holding each of ``ids``, or -1 where there is none."""
+        if len(self) == 0:
+            return np.full(len(ids), -1, dtype=np.int64)
+        pos = np.searchsorted(self.id, ids, sorter=self.id_order)
+        rows = self.id_order[np.minimum(pos, len(self) - 1)]
+        return np.where(self.id[rows] == ids, rows, -1)
+
+    def merge(
+        self,
+        update: "AvailabilityTable",
+        remove_missing: bool = False,
+        expire_before: Optional[np.datetime64] = None,
+    ) -> "AvailabilityTable":
+        """Apply ``update`` on top of this table, matching rows by ID.
+
+        Rows of ``update`` that are new or whose ``computed_last_seen`` changed
+        replace the existing ones; unchanged rows are kept as they are. With
+        ``remove_missing`` rows absent from ``update`` are dropped, and rows last
+        seen before ``expire_before`` are expired. Indexes that were already built
+        on this table are carried over incrementally.
+        """
+        existing = self.find(update.id)
+        matched = existing >= 0
+        changed = ~matched
+        changed[matched] = (
+            self.computed_last_seen[existing[matched]]
+            != update.computed_last_seen[matched]
+        )
+        keep = np.ones(len(self), dtype=np.bool_)
+        keep[existing[matched & changed]] = False
+        if remove_missing:
+            present = np.zeros(len(self), dtype=np.bool_)
+            present[existing[matched]] = True
+            keep &= present
+        if expire_before is not None:
+            keep &= self.computed_last_seen >= expire_before
+            changed &= update.computed_last_seen >= expire_before
+        added = np.flatnonzero(changed)
+        if keep.all() and len(added) == 0:
+            return self
+        return self._splice(keep, update, added)
+
+    def replace_rows(
+        self, start: int, stop: int, update: "AvailabilityTable"
+    ) -> "AvailabilityTable":
+        """Return this table with rows ``start:stop`` dropped and all rows of
+        ``update`` appended, e.g. to swap in a refreshed partner. Codes of this
+        table are kept and indexes already built are carried over."""
+        keep = np.ones(len(self), dtype=np.bool_)
+        keep[start:stop] = False
+        return self._splice(keep, update, np.arange(len(update)))
+
+    def _splice(
+        self, keep: np.ndarray, update: "AvailabilityTable", added: np.ndarray
+    ) -> "AvailabilityTable":
+        # the rows of this table selected by ``keep`` followed by the ``added`` rows
+        # of ``update``, recoded into vocabularies extending this table's
+        route_ids, route_codes = _extend_vocabulary(self.route_ids, update.route_ids)
+        airports, airport_codes = _extend_vocabulary(self.airports, update.airports)
+        airline_strings, airline_codes = _extend_vocabulary(
+            self.airline_strings, update.airline_strings
+        )
+        sources, source_codes = _extend_vocabulary(self.sources, update.sources)
+        recoded = {
+            "route": route_codes[update.route[added]].astype(np.int32),
+            "origin": airport_codes[update.origin[added]].astype(np.int32),
+            "destination": airport_codes[update.destination[added]].astype(np.int32),
+            "airlines": airline_codes[update.airlines[added]].astype(np.int32),
+            "source": source_codes[update.source[added]].astype(np.int16),
+        }
+        merged = AvailabilityTable(
+            **{
+                name: np.concatenate(
+                    [
+                        getattr(self, name)[keep],
+                        recoded[name]
+                        if name in recoded
+                        else getattr(update, name)[added],
+                    ]
+                )
+                for name in _ROW_COLUMNS
+            },
+            route_ids=route_ids,
+            airports=airports,
+            airline_strings=airline_strings,
+            sources=sources,
+        )
+        if "leg_index" in self.__dict__:
+            merged.leg_index = self.leg_index.updated(merged, keep)
+        if "airline_vocabulary" in self.__dict__:
+            merged.airline_vocabulary = self.airline_vocabulary.extend(
+                airline_strings[len(self.airline_strings) :].tolist()
+            )
+        return merged
+
+    @staticmethod
+    def concat(tables: Sequence["AvailabilityTable"]) -> "AvailabilityTable":
+        """Stack ``tables``, typically of different partners, into one table.
+
+        Their vocabularies are merged, so routes, airports and airline strings
+        shared between the tables are stored once; ``source`` tells the rows of
+        each table apart.
+        """
+        if len(tables) == 0:
+            return AvailabilityTableBuilder().build()
+        vocabularies = {name: Vocabulary() for name in _CODED_COLUMNS.values()}
+        columns: Dict[str, List[np.ndarray]] = {name: [] for name in _ROW_COLUMNS}
+        for table in tables:
+            codes = {
+                name: np.array(
+                    [vocabulary.code(v) for v in getattr(table, name).tolist()],
+                    dtype=np.int64,
+                )
+                for name, vocabulary in vocabularies.items()
+            }
+            for name in _ROW_COLUMNS:
+                column = getattr(table, name)
+                if name in _CODED_COLUMNS:
+                    column = codes[_CODED_COLUMNS[name]][column].astype(column.dtype)
+                columns[name].append(column)
+        return AvailabilityTable(
+            **{name: np.concatenate(parts) for name, parts in columns.items()},
+            **{
+                name: vocabulary.to_array() for name, vocabulary in vocabularies.items()
+            },
+        )
+
+    @staticmethod
+    def from_availabilities(
+        availabilities: Iterable[Availability], batch_size: int = 1 << 16
+    ) -> "AvailabilityTable":
+        builder = AvailabilityTableBuilder(batch_size)
+        builder.extend(availabilities)
+        return builder.build()
+
+    @staticmethod
+    def from_dicts(
+        records: Iterable[Dict],
+        route_map: Mapping[str, Route],
+        batch_size: int = 1 << 16,
+        refresh_routes: Optional[Callable[[], Mapping[str, Route]]] = None,
+    ) -> "AvailabilityTable":
+        """Build a table straight from raw API records, without going through
+        Availability objects. ``refresh_routes`` is called once for a newer
+        route map if a record refers to an unknown route."""
+        builder = AvailabilityTableBuilder(batch_size, route_map, refresh_routes)
+        builder.extend_dicts(records)
+        return builder.build()
+
+    def row(self, i: int, route_map: Mapping[str, Route]) -> Availability:
+        """Materialise row ``i`` as an Availability."""
+        route_id = str(self.route_ids[self.route[i]])
+        per_fare = {
+            "available": self.available[i].tolist(),
+            "mileage_cost": [str(c) for c in self.mileage_cost[i].tolist()],
+            "remaining_seats": self.remaining_seats[i].tolist(),
+            "airlines": self.airline_strings[self.airlines[i]].tolist(),
+            "direct": self.direct[i].tolist(),
+        }
+        parsed_date = self.date[i].astype("datetime64[s]").item()
+        last_seen = self.computed_last_seen[i].astype("datetime64[s]").item()
+        return Availability(
+            id=self.id[i].decode(),
+            route_id=route_id,
+            route=route_map[route_id],
+            date=parsed_date.strftime("%Y-%m-%d"),
+            parsed_date=parsed_date,
+            **{
+                f"{fare.lower()}_{name}": values[j]
+                for name, values in per_fare.items()
+                for j, fare in enumerate(fares)
+            },
+            source=str(self.sources[self.source[i]]),
+            computed_last_seen=last_seen.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        )
+
+
+@dataclass
+class AirlineVocabulary:
+    """Airline codes interned from the airline strings of a table.
+
+    ``bits[code]`` is the set of airlines in ``airline_strings[code]`` as a bitset
+    over ``airlines``, so matching an airline selection is a bitwise AND.
+    """
+
+    airlines: List[str]  # sorted
+    index: Dict[str, int]  # airline -> bit, in order of first appearance
+    bits: np.ndarray  # uint64 (airline strings, words)
+
+    @staticmethod
+    def build(airline_strings: List[str]) -> "AirlineVocabulary":
+        empty = AirlineVocabulary(
+            airlines=[], index={}, bits=np.zeros((0, 1), dtype=np.uint64)
+        )
+        return empty.extend(airline_strings)
+
+    def extend(self, airline_strings: List[str]) -> "AirlineVocabulary":
+        """Return the vocabulary with ``airline_strings`` appended as new codes.
+
+        Existing airlines keep their bits, so only the new strings are parsed.
+        """
+        parsed = [split_airlines(s) for s in airline_strings]
+        index = dict(self.index)
+        for members in parsed:
+            for airline in sorted(members):
+                index.setdefault(airline, len(index))
+        words = len(index) // 64 + 1
+        bits = np.zeros((len(self.bits) + len(parsed), words), dtype=np.uint64)
+        bits[: len(self.bits), : self.bits.shape[1]] = self.bits
+        for code, members in enumerate(parsed, start=len(self.bits)):
+            for airline in members:
+                i = index[airline]
+                bits[code, i // 64] |= np.uint64(1 << (i % 64))
+        return AirlineVocabulary(airlines=sorted(index), index=index, bits=bits)
+
+    def mask(self, airlines: Iterable[str]) -> np.ndarray:
+        res = np.zeros(self.bits.shape[1], dtype=np.uint64)
+        for airline in airlines:
+            i = self.index.get(airline)
+            if i is not None:
+                res[i // 64] |= np.uint64(1 << (i % 64))
+        return res
+
+    def matches(self, airlines: Iterable[str]) -> np.ndarray:
+        """Return, per airline string code, whether it contains any of
+        ``airlines``."""
+        return (self.bits & self.mask(airlines)).any(axis=1)
+
+
+@dataclass
+class LegIndex:
+    """Rows of an AvailabilityTable grouped by (origin, destination).
+
+    ``rows[offsets[i]:offsets[i + 1]]`` are the rows of leg ``keys[i]``, sorted by
+    date. ``date_keys`` packs (leg position, day) of every entry of ``rows`` into
+    one sorted integer, so date ranges of any number of legs are found by binary
+    search.
+    """
+
+    keys: np.ndarray  # int64 (legs,), sorted
+    offsets: np.ndarray  # int64 (legs + 1,)
+    rows: np.ndarray  # int64 (n,)
+    date_keys: np.ndarray  # int64 (n,), sorted
+    airports: np.ndarray
+    airport_index: Dict[str, int]
+
+    @staticmethod
+    def build(table: AvailabilityTable) -> "LegIndex":
+        return LegIndex.from_sorted_rows(
+            table, np.lexsort((table.date, table.leg_keys()))
+        )
+
+    @staticmethod
+    def from_sorted_rows(table: AvailabilityTable, rows: np.ndarray) -> "LegIndex":
+        sorted_keys = table.leg_keys()[rows]
+        starts = np.flatnonzero(np.diff(sorted_keys)) + 1
+        if len(rows) > 0:
+            starts = np.concatenate([[0], starts])
+        offsets = np.append(starts, len(rows)).astype(np.int64)
+        positions = np.repeat(np.arange(len(starts)), np.diff(offsets))
+        return LegIndex(
+            keys=sorted_keys[starts],
+            offsets=offsets,
+            rows=rows,
+            date_keys=(positions << _DAY_BITS) + table.date[rows].astype(np.int64),
+            airports=table.airports,
+            airport_index={a: i for i, a in enumerate(table.airports.tolist())},
+        )
+
+    def updated(self, table: AvailabilityTable, keep: np.ndarray) -> "LegIndex":
+        """Return the index of ``table``, whose leading rows are the rows of the
+        indexed table selected by ``keep`` and whose remaining rows are new.
+
+        The kept rows are already in order, so only the new rows are sorted and
+        then inserted at their positions.
+        """
+        n_kept = int(keep.sum())
+        renumbered = np.cumsum(keep) - 1
+        rows = renumbered[self.rows[keep[self.rows]]]
+        leg_keys = table.leg_keys()
+        new_rows = n_kept + np.lexsort((table.date[n_kept:], leg_keys[n_kept:]))
+        # (leg, day) packed into one sortable integer
+        order = (leg_keys << _DAY_BITS) + table.date.astype(np.int64)
+        positions = np.searchsorted(order[rows], order[new_rows], side="right")
+        return LegIndex.from_sorted_rows(table, np.insert(rows, positions, new_rows))
+
+    def legs(self) -> Set[Tuple[str, str]]:
+        origins, destinations = np.divmod(self.keys, 1 << 16)
+        return set(
+            zip(
+                self.airports[origins].tolist(),
+                self.airports[destinations].tolist(),
+            )
+        )
+
+    @functools.cached_property
+    def destinations(self) -> Dict[str, FrozenSet[str]]:
+        """Destinations served from each origin."""
+        origins, destinations = np.divmod(self.keys, 1 << 16)
+        res: Dict[str, Set[str]] = {}
+        for origin, destination in zip(
+            self.airports[origins].tolist(), self.airports[destinations].tolist()
+        ):
+            res.setdefault(origin, set()).add(destination)
+        return {origin: frozenset(served) for origin, served in res.items()}
+
+    def lookup(self, legs: List[Tuple[str, str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the distinct known legs in request order as (leg positions,
+        positions into ``legs``)."""
+        requested: Dict[int, int] = {}
+        for i, (org, dest) in enumerate(legs):
+            if org in self.airport_index and dest in self.airport_index:
+                key = (self.airport_index[org] << 16) + self.airport_index[dest]
+                requested.setdefault(key, i)
+        wanted = np.fromiter(requested.keys(), dtype=np.int64, count=len(requested))
+        origin = np.fromiter(requested.values(), dtype=np.int64, count=len(requested))
+        found = np.searchsorted(self.keys, wanted)
+        found = np.minimum(found, max(len(self.keys) - 1, 0))
+        hit = (
+            self.keys[found] == wanted
+            if len(self.keys) > 0
+            else np.zeros(len(wanted), np.bool_)
+        )
+        return found[hit], origin[hit]
+
+    @staticmethod
+    def _date_key(leg_positions: np.ndarray, date: np.datetime64) -> np.ndarray:
+        # clamped so that a day outside the packable range cannot reach into the
+        # keys of a neighbouring leg
+        day = np.clip(np.datetime64(date, "D").astype(np.int64), -1, _DAY_MASK)
+        return (leg_positions.astype(np.int64) << _DAY_BITS) + day
+
+    def take(
+        self,
+        leg_positions: np.ndarray,
+        start: Optional[np.datetime64] = None,
+        end: Optional[np.datetime64] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the rows of the given legs dated between ``start`` and ``end``
+        (inclusive, either may be None) and, for each row, the index into
+        ``leg_positions`` it came from."""
+        starts = self.offsets[leg_positions]
+        stops = self.offsets[leg_positions + 1]
+        if start is not None:
+            starts = np.searchsorted(
+                self.date_keys, self._date_key(leg_positions, start), side="left"
+            )
+        if end is not None:
+            stops = np.searchsorted(
+                self.date_keys, self._date_key(leg_positions, end), side="right"
+            )
+        lengths = np.maximum(stops - starts, 0)
+        owner = np.repeat(np.arange(len(leg_positions)), lengths)
+        within = np.arange(lengths.sum()) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+        return self.rows[np.repeat(starts, lengths) + within], owner
+
+
+class AvailabilityTableBuilder:
+    """Accumulates availabilities into an AvailabilityTable.
+
+    Rows are converted to arrays every ``batch_size`` appends, so only one batch
+    of Python objects is alive at a time. Raw API records can be appended with
+    ``append_dict`` when a ``route_map`` is given; they are decoded column by
+    column for the whole batch at once.
+
+    The first record of a route missing from ``route_map`` calls
+    ``refresh_routes`` once for a newer catalog. Records whose route is still
+    unknown are skipped and counted in ``skipped``.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 1 << 16,
+        route_map: Optional[Mapping[str, Route]] = None,
+        refresh_routes: Optional[Callable[[], Mapping[str, Route]]] = None,
+    ):
+        self.batch_size = batch_size
+        self.route_map = route_map
+        self.refresh_routes = refresh_routes
+        self.skipped = 0
+        self._route_codes: Dict[str, Tuple[int, int, int]] = {}
+        self._dicts: List[Dict] = []
+        self.route_ids = Vocabulary()
+        self.airports = Vocabulary()
+        self.airline_strings = Vocabulary()
+        self.sources = Vocabulary()
+        self._batches: List[Dict[str, np.ndarray]] = []
+        self._reset()
+
+    def _reset(self) -> None:
+        self._rows: Dict[str, list] = {name: [] for name in _ROW_COLUMNS}
+
+    def append(self, availability: Availability) -> None:
+        a = availability
+        rows = self._rows
+        rows["id"].append(a.id)
+        rows["route"].append(self.route_ids.code(a.route_id))
+        rows["origin"].append(self.airports.code(a.route.origin_airport))
+        rows["destination"].append(self.airports.code(a.route.destination_airport))
+        rows["date"].append(a.parsed_date)
+        rows["available"].append([a.available(fare) for fare in fares])
+        rows["direct"].append([a.direct(fare) for fare in fares])
+        rows["remaining_seats"].append([a.remaining_seats(fare) for fare in fares])
+        rows["mileage_cost"].append([a.mileage_cost(fare) for fare in fares])
+        rows["airlines"].append(
+            [self.airline_strings.code(a.airlines(fare)) for fare in fares]
+        )
+        rows["source"].append(self.sources.code(a.source))
+        rows["computed_last_seen"].append(a.computed_last_seen)
+        if len(rows["id"]) >= self.batch_size:
+            self._flush()
+
+    def extend(self, availabilities: Iterable[Availability]) -> None:
+        for availability in availabilities:
+            self.append(availability)
+
+    def append_dict(self, raw: Dict) -> None:
+        self._dicts.append(raw)
+        if len(self._dicts) >= self.batch_size:
+            self._flush()
+
+    def extend_dicts(self, records: Iterable[Dict]) -> None:
+        for raw in records:
+            self.append_dict(raw)
+
+    def _route_code(self, route_id: str) -> Optional[Tuple[int, int, int]]:
+        codes = self._route_codes.get(route_id)
+        if codes is None:
+            if self.route_map is None:
+                raise ValueError("A route_map is required to append raw records")
+            if route_id not in self.route_map and self.refresh_routes is not None:
+                # routes added since the catalog was fetched
+                self.route_map = self.refresh_routes()
+                self.refresh_routes = None
+            route = self.route_map.get(route_id)
+            if route is None:
+                return None
+            codes = self._route_codes[route_id] = (
+                self.route_ids.code(route_id),
+                self.airports.code(route.origin_airport),
+                self.airports.code(route.destination_airport),
+            )
+        return codes
+
+    def _dicts_to_columns(self, batch: List[Dict]) -> Dict[str, np.ndarray]:
+        def per_fare(attribute: str) -> List[tuple]:
+            get = itemgetter(*(f"{fare}{attribute}" for fare in fares))
+            return [get(raw) for raw in batch]
+
+        codes = [self._route_code(raw["RouteID"]) for raw in batch]
+        if None in codes:
+            known = [raw for raw, code in zip(batch, codes) if code is not None]
+            self.skipped += len(batch) - len(known)
+            metrics.count("rows_skipped", len(batch) - len(known), reason="route")
+            batch, codes = known, [code for code in codes if code is not None]
+        route_codes = np.array(codes, dtype=np.int32).reshape(-1, 3)
+        airline_code = self.airline_strings.code
+        source_code = self.sources.code
+        columns = {
+            "id": np.array([raw["ID"] for raw in batch], dtype=np.bytes_),
+            "route": route_codes[:, 0],
+            "origin": route_codes[:, 1],
+            "destination": route_codes[:, 2],
+            # "2023-05-24T00:00:00Z", numpy parses the date part in bulk
+            "date": np.array(
+                [raw["ParsedDate"][:10] for raw in batch], dtype="datetime64[D]"
+            ),
+            "available": np.array(per_fare("Available"), dtype=np.bool_),
+            "direct": np.array(per_fare("Direct"), dtype=np.bool_),
+            "remaining_seats": np.array(
+                [[n or 0 for n in seats] for seats in per_fare("RemainingSeats")],
+                dtype=np.uint32,
+            ),
+            "mileage_cost": _parse_costs(per_fare("MileageCost")),
+            "airlines": np.array(
+                [[airline_code(a or "") for a in row] for row in per_fare("Airlines")],
+                dtype=np.int32,
+            ),
+            "source": np.array(
+                [source_code(raw["Source"]) for raw in batch], dtype=np.int16
+            ),
+            "computed_last_seen": _parse_timestamps(
+                [raw["ComputedLastSeen"] for raw in batch], "s"
+            ),
+        }
+        for name in _PER_FARE_COLUMNS:
+            columns[name] = columns[name].reshape(-1, len(fares))
+        return columns
+
+    def _flush(self) -> None:
+        if len(self._rows["id"]) > 0:
+            metrics.count("rows_parsed", len(self._rows["id"]))
+            with metrics.span("parse"):
+                self._batches.append(_to_columns(self._rows))
+            self._reset()
+        if len(self._dicts) > 0:
+            metrics.count("rows_parsed", len(self._dicts))
+            with metrics.span("parse"):
+                self._batches.append(self._dicts_to_columns(self._dicts))
+            self._dicts = []
+
+    def build(self) -> AvailabilityTable:
+        self._flush()
+        if self.skipped > 0:
+            logger.warning("Skipped %d records of unknown routes", self.skipped)
+        if len(self._batches) == 0:
+            self._batches.append(_to_columns(self._rows))
+        columns = {
+            name: np.concatenate([batch[name] for batch in self._batches])
+            for name in self._batches[0].keys()
+        }
+        return AvailabilityTable(
+            **columns,
+            route_ids=self.route_ids.to_array(),
+            airports=self.airports.to_array(),
+            airline_strings=self.airline_strings.to_array(),
+            sources=self.sources.to_array(),
+        )
+
+
+def _to_columns(rows: Dict[str, list]) -> Dict[str, np.ndarray]:
+    columns = {
+        "id": np.array(rows["id"], dtype=np.bytes_),
+        "route": np.array(rows["route"], dtype=np.int32),
+        "origin": np.array(rows["origin"], dtype=np.int32),
+        "destination": np.array(rows["destination"], dtype=np.int32),
+        "date": np.array(rows["date"], dtype="datetime64[D]"),
+        "available": np.array(rows["available"], dtype=np.bool_),
+        "direct": np.array(rows["direct"], dtype=np.bool_),
+        "remaining_seats": np.array(rows["remaining_seats"], dtype=np.uint32),
+        "mileage_cost": _parse_costs(rows["mileage_cost"]),
+        "airlines": np.array(rows["airlines"], dtype=np.int32),
+        "source": np.array(rows["source"], dtype=np.int16),
+        "computed_last_seen": _parse_timestamps(rows["computed_last_seen"], "s"),
+    }
+    for name in _PER_FARE_COLUMNS:
+        columns[name] = columns[name].reshape(-1, len(fares))
+    return columns
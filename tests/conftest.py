@@ -0,0 +1,24 @@
+from typing import Dict, List
+
+import pytest
+
+from seats_aero.api import Route, RouteCatalog
+from seats_aero.synthetic import generate_availabilities, generate_routes
+from seats_aero.table import AvailabilityTable
+
+
+@pytest.fixture(scope="session")
+def raw_routes() -> List[Dict]:
+    return generate_routes(300)
+
+
+@pytest.fixture(scope="session")
+def route_map(raw_routes: List[Dict]) -> RouteCatalog:
+    return RouteCatalog.from_routes([Route.from_dict(r) for r in raw_routes])
+
+
+@pytest.fixture(scope="session")
+def table(raw_routes: List[Dict], route_map: RouteCatalog) -> AvailabilityTable:
+    return AvailabilityTable.from_dicts(
+        generate_availabilities(raw_routes, 5000), route_map
+    )
@@ -0,0 +1,102 @@
+import threading
+import types
+from http.server import ThreadingHTTPServer
+from typing import Iterator, Tuple
+
+import pytest
+import requests
+
+from seats_aero import metrics
+from seats_aero.client import SeatsAeroClient, _count_chunked_bytes
+from seats_aero.mockserver import NetworkProfile, Payloads, make_handler
+
+
+@pytest.fixture
+def mock_server() -> Iterator[Tuple[str, Payloads, NetworkProfile]]:
+    payloads = Payloads(rows=2000, routes=100)
+    network = NetworkProfile(chunk_size=1 << 12)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(payloads, network))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", payloads, network
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def make_client(base_url: str) -> SeatsAeroClient:
+    return SeatsAeroClient(base_url, api_key=lambda: "key", backoff_factor=0)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("compressed", [False, True])
+@pytest.mark.parametrize("chunked", [False, True])
+def test_counts_wire_bytes(
+    mock_server: Tuple[str, Payloads, NetworkProfile],
+    chunked: bool,
+    compressed: bool,
+    stream: bool,
+) -> None:
+    base_url, payloads, network = mock_server
+    network.chunked = chunked
+    network.gzip = compressed
+    client = make_client(base_url)
+    with client.get(
+        "/api/availability", {"source": "united"}, stream=stream
+    ) as response:
+        assert response.status_code == 200
+        body = b"".join(response.iter_content(1 << 16))
+    payload = payloads.get("united", compressed)
+    decoded = payloads.get("united", False)
+    assert payload is not None and decoded is not None
+    assert body == decoded[0]
+    assert client.metrics.requests == 1
+    assert client.metrics.retries == 0
+    assert client.metrics.errors == 0
+    assert client.metrics.bytes_received == len(payload[0])
+
+
+def test_counts_retries(mock_server: Tuple[str, Payloads, NetworkProfile]) -> None:
+    base_url, _, network = mock_server
+    network.error_rate = 1.0
+    client = make_client(base_url)
+    with client.get("/api/routes") as response:
+        assert response.status_code == 503
+    assert client.metrics.requests == 1
+    assert client.metrics.retries == 3
+    assert client.metrics.errors == 1
+
+
+def test_exports_counts(
+    mock_server: Tuple[str, Payloads, NetworkProfile], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    base_url, payloads, network = mock_server
+    network.chunked = network.gzip = True
+    monkeypatch.setattr(metrics, "enabled", True)
+    metrics.reset()
+    client = make_client(base_url)
+    with client.get("/api/availability", {"source": "united"}) as response:
+        assert response.status_code == 200
+    network.error_rate = 1.0
+    with client.get("/api/routes"):
+        pass
+
+    counters = metrics.counters()
+    availability = (("endpoint", "availability"),)
+    routes = (("endpoint", "routes"),)
+    assert counters[("bytes_received", availability)] == client.metrics.bytes_received
+    assert counters[("requests", availability)] == 1
+    assert counters[("requests", routes)] == 1
+    assert counters[("retries", routes)] == 3
+    assert counters[("request_errors", routes)] == 1
+    assert counters[("request_errors", availability)] == 0
+    assert metrics.spans()["request"].count == 2
+    assert "seats_aero_bytes_received_total" in metrics.to_prometheus()
+    metrics.reset()
+
+
+def test_skips_counting_without_urllib3_internals() -> None:
+    response = requests.Response()
+    response.raw = types.SimpleNamespace(chunked=True)
+    assert _count_chunked_bytes(response) is response
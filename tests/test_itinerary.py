@@ -0,0 +1,125 @@
+import tracemalloc
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+import pytest
+
+from seats_aero import itinerary
+from seats_aero.api import RouteCatalog
+from seats_aero.itinerary import find_itineraries
+from seats_aero.query import parse_route
+from seats_aero.synthetic import generate_availabilities
+from seats_aero.table import AvailabilityTable
+
+
+@pytest.fixture(scope="module")
+def table(raw_routes: List[Dict], route_map: RouteCatalog) -> AvailabilityTable:
+    # a month of dates, so that most legs connect within a few days
+    return AvailabilityTable.from_dicts(
+        generate_availabilities(raw_routes, 20000, days=30), route_map
+    )
+
+
+def brute_force(
+    table: AvailabilityTable,
+    route: str,
+    airlines: List[str],
+    class_code: List[str],
+    min_days: int,
+    max_days: int,
+) -> Set[Tuple[int, ...]]:
+    legs = parse_route(route, True, True).segments[0]
+    origins = table.airports[table.origin]
+    destinations = table.airports[table.destination]
+    matching = table.fare_mask(np.arange(len(table)), airlines, class_code).any(axis=1)
+    per_leg = []
+    for leg in legs:
+        served = set(leg.match(table.leg_index.destinations))
+        per_leg.append(
+            [
+                r
+                for r in np.flatnonzero(matching).tolist()
+                if (origins[r], destinations[r]) in served
+            ]
+        )
+
+    paths = {(r,) for r in per_leg[0]}
+    for rows in per_leg[1:]:
+        departing: Dict[int, List[int]] = {}
+        for r in rows:
+            departing.setdefault(int(table.origin[r]), []).append(r)
+        paths = {
+            (*path, r)
+            for path in paths
+            for r in departing.get(int(table.destination[path[-1]]), [])
+            if min_days
+            <= (table.date[r] - table.date[path[-1]]).astype(int)
+            <= max_days
+        }
+    return paths
+
+
+@pytest.mark.parametrize(
+    "route, airlines, class_code",
+    [
+        ("US-GB-US", [], []),
+        ("US-GB-US", ["AC"], ["J"]),
+        ("US-DE-US", [], ["J"]),
+        ("US-GB-US-JP", [], []),
+    ],
+)
+def test_find_itineraries_matches_brute_force(
+    table: AvailabilityTable, route: str, airlines: List[str], class_code: List[str]
+) -> None:
+    legs = parse_route(route, True, True).segments[0]
+    paths, path_fares, truncated = find_itineraries(
+        table, legs, airlines, class_code, 0, 3, limit=1 << 30
+    )
+    assert not truncated
+    expected = brute_force(table, route, airlines, class_code, 0, 3)
+    assert len(expected) > 0
+    assert len(paths) == len(expected)
+    assert set(map(tuple, paths.tolist())) == expected
+
+    # the best fare of each leg is the highest matching cabin
+    mask = table.fare_mask(paths.ravel(), airlines, class_code)
+    best = mask.shape[1] - 1 - np.argmax(mask[:, ::-1], axis=1)
+    np.testing.assert_array_equal(path_fares.ravel(), best)
+
+
+def test_find_itineraries_limit(table: AvailabilityTable) -> None:
+    legs = parse_route("US-GB-US", True, True).segments[0]
+    paths, _, _ = find_itineraries(table, legs, limit=1 << 30)
+    limited, _, truncated = find_itineraries(table, legs, limit=len(paths))
+    assert not truncated
+    np.testing.assert_array_equal(limited, paths)
+    limited, _, truncated = find_itineraries(table, legs, limit=10)
+    assert truncated
+    np.testing.assert_array_equal(limited, paths[:10])
+
+
+@pytest.mark.parametrize("route", ["US-GB-US-GB-US", "US-GB-US-JP"])
+def test_find_itineraries_prunes_partial_paths(
+    table: AvailabilityTable, route: str
+) -> None:
+    # unpruned, US-GB-US-GB-US joins into about 2M itineraries and 300MB
+    legs = parse_route(route, True, True).segments[0]
+    tracemalloc.start()
+    try:
+        paths, path_fares, truncated = find_itineraries(
+            table, legs, max_connection_days=14, limit=100
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert truncated
+    assert len(paths) == 100
+    assert peak < 8 << 20
+
+    # ranked, and every itinerary connects
+    order = itinerary._rank(table, paths, path_fares)
+    np.testing.assert_array_equal(order, np.arange(len(paths)))
+    for path in paths.tolist():
+        for prev, row in zip(path, path[1:]):
+            assert table.destination[prev] == table.origin[row]
+            assert 0 <= (table.date[row] - table.date[prev]).astype(int) <= 14
@@ -0,0 +1,83 @@
+import json
+from typing import Iterator, List
+
+import pytest
+
+from seats_aero import decode
+from seats_aero.jsonstream import iter_json_array
+
+DOCUMENT = """ [
+  {"ID": "a", "Route": {"OriginAirport": "SFO"}, "Cost": -12.5e3},
+  {"ID": "b}\\"]", "Note": "escaped \\\\ \\" \\u00e9 \\ud83d\\ude00 and café ✈"},
+  {"ID": "c", "Nested": [[], {}, [1, {"x": "}"}]], "Seats": 1234567890},
+  12.75, -3, true, false, null, "plain", "with } and ] inside",
+  {"ID": "d"}\t,\r\n {"ID": "e", "Empty": ""}
+]
+"""
+
+
+@pytest.fixture(params=["msgspec", "orjson", "json"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    name = request.param
+    if name not in decode._BACKENDS:
+        pytest.skip(f"{name} is not installed")
+    monkeypatch.setattr(decode, "loads", decode._BACKENDS[name])
+    return name
+
+
+def split(data: bytes, *cuts: int) -> Iterator[bytes]:
+    start = 0
+    for cut in cuts:
+        yield data[start:cut]
+        start = cut
+    yield data[start:]
+
+
+def parse(chunks: Iterator[bytes]) -> List:
+    return list(iter_json_array(chunks))
+
+
+def test_every_split(backend: str) -> None:
+    data = DOCUMENT.encode()
+    expected = json.loads(data)
+    for cut in range(len(data) + 1):
+        assert parse(split(data, cut)) == expected, cut
+
+
+def test_two_splits_and_single_bytes(backend: str) -> None:
+    data = DOCUMENT.encode()
+    expected = json.loads(data)
+    for first in range(0, len(data), 7):
+        for second in range(first, len(data), 5):
+            assert parse(split(data, first, second)) == expected, (first, second)
+    assert parse(iter([data[i : i + 1] for i in range(len(data))])) == expected
+
+
+@pytest.mark.parametrize("text", ["[]", " [ ] ", "\n[\n]\n", "[\t\r\n]"])
+def test_empty_array(backend: str, text: str) -> None:
+    data = text.encode()
+    assert parse(iter([data])) == []
+    assert parse(iter([data[i : i + 1] for i in range(len(data))])) == []
+    assert parse(iter([b"", data, b""])) == []
+
+
+def test_large_chunks(backend: str) -> None:
+    records = [
+        {"ID": str(i), "Note": "}" * (i % 3), "Cost": i * 0.5} for i in range(500)
+    ]
+    data = json.dumps(records).encode()
+    for size in [1 << 10, 1 << 12, len(data)]:
+        chunks = [data[i : i + size] for i in range(0, len(data), size)]
+        assert parse(iter(chunks)) == records
+
+
+@pytest.mark.parametrize("text", ['{"ID": "a"}', '"a"', ""])
+def test_rejects_non_arrays(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse(iter([text.encode()]))
+
+
+@pytest.mark.parametrize("text", ['[{"ID": "a"}', '[{"ID": "a"}, {"ID"', "[1, 2"])
+def test_rejects_truncated_arrays(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse(iter([text.encode()]))
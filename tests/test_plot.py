@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from seats_aero.api import split_airlines
+from seats_aero.plot import downsample_route_df, get_route_df
+from seats_aero.query import parse_route
+from seats_aero.table import AvailabilityTable
+
+
+@pytest.fixture(scope="module")
+def route_df(table: AvailabilityTable) -> pd.DataFrame:
+    query = parse_route("US - GB, CA - JP, US - FR, DE - US", True, True)
+    return get_route_df(table, query.match(table.leg_index.destinations))
+
+
+def merge_lists(values: pd.Series) -> str:
+    return ", ".join(sorted(set().union(*map(split_airlines, values))))
+
+
+def reference(route_df: pd.DataFrame, width: int) -> pd.DataFrame:
+    days = route_df["date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+    bucketed = route_df.assign(
+        date=(days // width * width).astype("datetime64[D]").astype("datetime64[ns]"),
+        mileage_cost=route_df["mileage_cost"].where(route_df["mileage_cost"] > 0),
+    )
+    res = pd.DataFrame(
+        bucketed.groupby(["route", "fare", "date"]).agg(
+            airlines=("airlines", merge_lists),
+            freshness=("freshness", "max"),
+            direct=("direct", "any"),
+            partner=("partner", merge_lists),
+            mileage_cost=("mileage_cost", "min"),
+            remaining_seats=("remaining_seats", "max"),
+            points=("direct", "size"),
+        )
+    ).reset_index()
+    return res.assign(mileage_cost=res["mileage_cost"].fillna(0))
+
+
+@pytest.mark.parametrize("max_points", [1 << 30, 5000, 1000, 50])
+def test_downsample_matches_groupby(route_df: pd.DataFrame, max_points: int) -> None:
+    chart_df, width, dropped = downsample_route_df(route_df, max_points)
+    routes = route_df["route"].unique().tolist()
+    assert dropped == len(routes) - chart_df["route"].nunique()
+    # routes are dropped from the end, and only when even the widest buckets
+    # do not fit
+    kept = route_df.loc[route_df["route"].isin(routes[: len(routes) - dropped])]
+    assert len(chart_df) <= max_points or len(routes) - dropped == 1
+
+    expected = reference(kept, width)
+    columns = list(expected.columns)
+    got = chart_df.sort_values(["route", "fare", "date"]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        got[columns], expected[columns], check_dtype=False, check_categorical=False
+    )
+
+
+def test_downsample_empty(route_df: pd.DataFrame) -> None:
+    chart_df, width, dropped = downsample_route_df(route_df.iloc[:0], 100)
+    assert len(chart_df) == 0 and width == 1 and dropped == 0
+    assert "points" in chart_df.columns
@@ -0,0 +1,167 @@
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from seats_aero.api import RouteCache, RouteCatalog
+from seats_aero.engine import AvailabilitySource
+from seats_aero.plot import get_route_df
+from seats_aero.prefetch import PrefetchScheduler
+from seats_aero.snapshot import SnapshotStore
+from seats_aero.synthetic import generate_availabilities
+from seats_aero.table import AvailabilityTable
+
+from .test_table import assert_same_index, assert_same_rows
+
+PARTNERS = ["aeroplan", "united", "flyingblue"]
+
+
+class Loader:
+    """Serves synthetic partners, merged into the previous table like
+    AvailabilitySource.load, and counts the loads."""
+
+    def __init__(self, raw_routes: List[Dict], route_map: RouteCatalog):
+        self.raw_routes = raw_routes
+        self.route_map = route_map
+        self.generation: Dict[str, int] = {}
+        self.loads: List[str] = []
+        # loads of the partners in here wait until it is set
+        self.gates: Dict[str, threading.Event] = {}
+
+    def fetch(self, partner: str) -> AvailabilityTable:
+        seed = PARTNERS.index(partner) * 10 + self.generation.get(partner, 0)
+        records = generate_availabilities(
+            self.raw_routes, 1000, seed=seed, source=partner
+        )
+        return AvailabilityTable.from_dicts(records, self.route_map)
+
+    def __call__(
+        self,
+        partner: str,
+        previous: Optional[AvailabilityTable],
+        max_age: timedelta,
+    ) -> Tuple[AvailabilityTable, datetime]:
+        self.loads.append(partner)
+        if partner in self.gates:
+            self.gates[partner].wait(10)
+        table = self.fetch(partner)
+        if previous is not None:
+            table = previous.merge(table, remove_missing=True)
+        table.leg_index
+        table.airline_vocabulary
+        return table, datetime.now()
+
+
+def test_all_partners_combines_the_loaded_tables(
+    raw_routes: List[Dict], route_map: RouteCatalog
+) -> None:
+    loader = Loader(raw_routes, route_map)
+    scheduler = PrefetchScheduler(loader, timedelta(hours=1))
+    for partner in PARTNERS[:2]:
+        scheduler.get(partner)
+
+    combined, _ = scheduler.get_all(PARTNERS)
+    assert sorted(loader.loads) == sorted(PARTNERS)
+    assert_same_rows(
+        combined, AvailabilityTable.concat([loader.fetch(p) for p in PARTNERS])
+    )
+    assert scheduler.get_all(PARTNERS)[0] is combined
+
+    loader.generation["united"] = 1
+    scheduler._submit("united").result()
+    refreshed, _ = scheduler.get_all(PARTNERS)
+    assert loader.loads.count("united") == 2
+    assert refreshed is not combined
+    assert_same_rows(
+        refreshed, AvailabilityTable.concat([loader.fetch(p) for p in PARTNERS])
+    )
+    assert_same_index(refreshed.leg_index, refreshed)
+    assert refreshed.all_airlines() == set().union(
+        *(loader.fetch(p).all_airlines() for p in PARTNERS)
+    )
+
+    legs = sorted(refreshed.legs())
+    total = 0
+    for partner in PARTNERS:
+        table, _ = scheduler.get(partner)
+        # every partner keeps its own table and vocabularies
+        assert not np.shares_memory(table.id, refreshed.id)
+        assert_same_rows(table, loader.fetch(partner))
+        assert table.sources.tolist() == [partner]
+        assert table.all_airlines() == loader.fetch(partner).all_airlines()
+        total += len(get_route_df(table, legs))
+    assert total == len(get_route_df(refreshed, legs))
+
+
+def test_concurrent_cold_loads_share_one_refresh(
+    raw_routes: List[Dict], route_map: RouteCatalog
+) -> None:
+    loader = Loader(raw_routes, route_map)
+    loader.gates["aeroplan"] = threading.Event()
+    scheduler = PrefetchScheduler(loader, timedelta(hours=1), max_workers=1)
+    # keep the only pool worker busy so that united stays queued
+    busy = scheduler._submit("aeroplan")
+
+    readers = 8
+    barrier = threading.Barrier(readers)
+    results: List[object] = [None] * readers
+
+    def read(i: int) -> None:
+        barrier.wait()
+        try:
+            if i % 2:
+                results[i] = scheduler.get_all(["united"])[0]
+            else:
+                results[i] = scheduler.get("united")[0]
+        except BaseException as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    loader.gates["aeroplan"].set()
+    busy.result()
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    assert errors == []
+    assert loader.loads.count("united") == 1
+    expected = loader.fetch("united")
+    for result in results:
+        assert isinstance(result, AvailabilityTable)
+        assert_same_rows(result, expected)
+    assert not scheduler._pending
+
+
+class Source(AvailabilitySource):
+    def __init__(self, loader: Loader, ttl: timedelta, snapshots: SnapshotStore):
+        super().__init__(RouteCache(), ttl, snapshots)
+        self.loader = loader
+
+    def fetch(self, partner: str) -> AvailabilityTable:
+        self.loader.loads.append(partner)
+        return self.loader.fetch(partner)
+
+
+def test_refresh_skips_the_snapshot_it_replaces(
+    raw_routes: List[Dict], route_map: RouteCatalog, tmp_path: Path
+) -> None:
+    loader = Loader(raw_routes, route_map)
+    ttl = timedelta(hours=1)
+    source = Source(loader, ttl, SnapshotStore(tmp_path))
+    # a refresh is due from ttl - lead on, here right away
+    scheduler = PrefetchScheduler(source.load, ttl, lead=ttl)
+    _, first = scheduler.get("united")
+    _, second = scheduler._submit("united").result()
+    assert loader.loads == ["united", "united"]
+    assert second > first
+
+    # a cold load is still served from the snapshot
+    restarted = PrefetchScheduler(source.load, ttl, lead=ttl)
+    table, fetched_at = restarted.get("united")
+    assert loader.loads == ["united", "united"]
+    assert fetched_at == second
+    assert_same_rows(table, loader.fetch("united"))
@@ -0,0 +1,86 @@
+import random
+from itertools import product
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from seats_aero.api import RouteCatalog
+from seats_aero.engine import query_routes
+from seats_aero.query import parse_route
+from seats_aero.synthetic import generate_availabilities
+from seats_aero.table import AvailabilityTable
+
+
+@pytest.mark.parametrize(
+    "route",
+    ["US - GB, CA - JP", "US - LHR - NYC, CA - HKG", "JFK-LHR", "NYC-LON-PAR"],
+)
+def test_missing_matches_full_product(route: str) -> None:
+    query = parse_route(route, True, True)
+    candidates = [leg for q in query.legs for leg in product(q.origins, q.destinations)]
+    rng = random.Random(0)
+    present = set(rng.sample(candidates, len(candidates) // 2)) | {("XXX", "YYY")}
+    expected = [leg for leg in candidates if leg not in present]
+
+    assert query.missing_count(present) == len(expected)
+    n = len(expected)
+    for start, stop in [(0, 100), (n // 2, n // 2 + 37), (n - 5, n), (0, n), (n, n)]:
+        assert query.missing(present, start, stop) == expected[start:stop]
+    assert query.missing(present, n - 3, n + 10) == expected[n - 3 :]
+
+
+@pytest.fixture(scope="module")
+def partner_table(raw_routes: List[Dict], route_map: RouteCatalog) -> AvailabilityTable:
+    # two partners on one table, a month of dates so routes repeat per day
+    return AvailabilityTable.concat(
+        [
+            AvailabilityTable.from_dicts(
+                generate_availabilities(
+                    raw_routes, 10000, seed=seed, days=30, source=source
+                ),
+                route_map,
+            )
+            for seed, source in enumerate(["aeroplan", "united"])
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "route, class_code, min_seats",
+    [("US-GB-US", [], 0), ("US-GB, CA-JP", ["J", "F"], 0), ("US-DE", [], 2)],
+)
+def test_cheapest_matches_groupby(
+    partner_table: AvailabilityTable,
+    route: str,
+    class_code: List[str],
+    min_seats: int,
+) -> None:
+    keys = ["route", "date", "fare", "partner"]
+    _, _, route_df = query_routes(
+        partner_table, route, class_code=class_code, min_seats=min_seats
+    )
+    _, _, cheapest = query_routes(
+        partner_table, route, class_code=class_code, min_seats=min_seats, cheapest=True
+    )
+    assert route_df["partner"].nunique() == 2
+    assert len(cheapest) < len(route_df)
+
+    # unknown costs (0) only win when a group has nothing else
+    known = route_df.assign(
+        cost=route_df["mileage_cost"].where(route_df["mileage_cost"] > 0, np.inf)
+    )
+    expected = known.groupby(keys)["cost"].min()
+    expected = expected.where(np.isfinite(expected), 0).astype(np.int64)
+
+    actual = cheapest.set_index(keys)["mileage_cost"].astype(np.int64)
+    assert actual.index.is_unique
+    pd.testing.assert_series_equal(
+        actual.sort_index(), expected.sort_index(), check_names=False
+    )
+    # the rows kept are rows of the unfiltered result, in its order
+    columns = [*keys, "airlines", "mileage_cost", "remaining_seats"]
+    positions = route_df[columns].reset_index().merge(cheapest[columns])["index"]
+    assert len(positions) >= len(cheapest)
+    assert positions.is_monotonic_increasing
@@ -0,0 +1,122 @@
+import threading
+from datetime import timedelta
+from http.server import ThreadingHTTPServer
+from typing import Dict, Iterator, List
+
+import pytest
+import requests
+
+from seats_aero import metrics
+from seats_aero.api import RouteCatalog
+from seats_aero.engine import query_routes
+from seats_aero.prefetch import PrefetchScheduler
+from seats_aero.server import QueryService, make_handler
+
+from .test_prefetch import Loader
+
+
+@pytest.fixture
+def loader(raw_routes: List[Dict], route_map: RouteCatalog) -> Loader:
+    return Loader(raw_routes, route_map)
+
+
+@pytest.fixture
+def base_url(loader: Loader, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    monkeypatch.setattr(metrics, "enabled", True)
+    metrics.reset()
+    service = QueryService(PrefetchScheduler(loader, timedelta(hours=1)), 2)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(service))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        metrics.reset()
+
+
+ROUTE = "US-GB-US-JP"
+
+
+def get(base_url: str, **params: str) -> requests.Response:
+    return requests.get(f"{base_url}/api/routes", params=params, timeout=30)
+
+
+def api_cache(name: str) -> float:
+    return metrics.counters().get((name, (("cache", "api"),)), 0)
+
+
+def test_pages_match_the_query(base_url: str, loader: Loader) -> None:
+    table = loader.fetch("united")
+    _, legs, route_df = query_routes(table, ROUTE)
+    assert len(route_df) > 25
+
+    rows = []
+    for offset in range(0, len(route_df), 10):
+        response = get(
+            base_url, partner="united", route=ROUTE, offset=str(offset), limit="10"
+        )
+        assert response.status_code == 200
+        page = response.json()
+        assert page["partner"] == "united"
+        assert page["total"] == len(route_df)
+        assert page["offset"] == offset
+        assert page["legs"] == [f"{org} -> {dest}" for org, dest in legs]
+        assert len(page["rows"]) == min(10, len(route_df) - offset)
+        rows.extend(page["rows"])
+    columns = ["route", "fare", "airlines", "partner", "mileage_cost"]
+    assert [[row[c] for c in columns] for row in rows] == route_df[
+        columns
+    ].values.tolist()
+    assert (
+        get(base_url, partner="united", route=ROUTE, offset="100000").json()["rows"]
+        == []
+    )
+    assert loader.loads == ["united"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"offset": "-1"},
+        {"limit": "-1"},
+        {"min_seats": "-1"},
+        {"offset": "x"},
+        {"fares": "Q"},
+        {"partner": "nope"},
+        {"route": ""},
+    ],
+)
+def test_rejects_bad_parameters(base_url: str, params: Dict[str, str]) -> None:
+    response = get(base_url, **{"partner": "united", "route": ROUTE, **params})
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+def test_caches_responses(base_url: str) -> None:
+    first = get(base_url, partner="united", route=ROUTE, limit="5")
+    assert (api_cache("cache_hits"), api_cache("cache_misses")) == (0, 1)
+    again = get(base_url, partner="united", route=ROUTE, limit="5")
+    assert (api_cache("cache_hits"), api_cache("cache_misses")) == (1, 1)
+    assert again.content == first.content
+
+    # the cache holds two responses, least recently used goes first
+    get(base_url, partner="united", route=ROUTE, limit="6")
+    get(base_url, partner="united", route=ROUTE, limit="5")
+    get(base_url, partner="united", route=ROUTE, limit="7")
+    assert (api_cache("cache_hits"), api_cache("cache_misses")) == (2, 3)
+    get(base_url, partner="united", route=ROUTE, limit="6")
+    assert (api_cache("cache_hits"), api_cache("cache_misses")) == (2, 4)
+
+
+def test_serves_metrics(base_url: str) -> None:
+    get(base_url, partner="united", route=ROUTE)
+    response = requests.get(f"{base_url}/metrics", timeout=30)
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain")
+    assert 'seats_aero_cache_misses_total{cache="api"} 1' in response.text
+    assert 'seats_aero_span_seconds_count{span="route_df"}' in response.text
+
+    assert requests.get(f"{base_url}/healthz", timeout=30).json() == {"status": "ok"}
+    assert requests.get(f"{base_url}/nope", timeout=30).status_code == 404
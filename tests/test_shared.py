@@ -0,0 +1,61 @@
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from seats_aero.api import RouteCatalog
+from seats_aero.engine import ALL_PARTNERS
+from seats_aero.shared import SharedAvailabilityStore
+from seats_aero.snapshot import SnapshotStore
+from seats_aero.table import AvailabilityTable
+
+from .test_prefetch import PARTNERS, Loader
+from .test_table import assert_same_rows
+
+
+def test_all_partners_is_published_once_and_memory_mapped(
+    raw_routes: List[Dict], route_map: RouteCatalog, tmp_path: Path
+) -> None:
+    loader = Loader(raw_routes, route_map)
+    fetches: List[str] = []
+
+    def fetch(partner: str) -> AvailabilityTable:
+        fetches.append(partner)
+        return loader.fetch(partner)
+
+    snapshots = SnapshotStore(tmp_path)
+    ttl = timedelta(hours=1)
+    # two workers sharing one snapshot directory
+    first = SharedAvailabilityStore(snapshots, fetch, ttl)
+    second = SharedAvailabilityStore(snapshots, fetch, ttl)
+
+    combined, fetched_at = first.get_all(PARTNERS)
+    assert isinstance(combined.id, np.memmap)
+    assert "leg_index" in combined.__dict__
+    assert_same_rows(
+        combined, AvailabilityTable.concat([loader.fetch(p) for p in PARTNERS])
+    )
+    assert first.get_all(PARTNERS)[0] is combined
+
+    attached, attached_at = second.get_all(PARTNERS)
+    assert isinstance(attached.id, np.memmap)
+    assert attached_at == fetched_at
+    assert sorted(fetches) == sorted(PARTNERS)
+    assert len(snapshots.snapshots(ALL_PARTNERS)) == 1
+
+    # a new partner generation republishes the combined one, once
+    loader.generation["united"] = 1
+    first.publish("united")
+    refreshed, refreshed_at = second.get_all(PARTNERS)
+    assert refreshed_at > fetched_at
+    assert_same_rows(
+        refreshed, AvailabilityTable.concat([loader.fetch(p) for p in PARTNERS])
+    )
+    assert first.get_all(PARTNERS)[1] == refreshed_at
+    assert len(snapshots.snapshots(ALL_PARTNERS)) == 2
+
+    # the refresher leaves the combined generation to get_all
+    first.refresh_due(lead=ttl)
+    assert fetches.count("united") == 3
+    assert len(snapshots.snapshots(ALL_PARTNERS)) == 2
@@ -0,0 +1,123 @@
+import copy
+import random
+from typing import Dict, List
+
+import numpy as np
+
+from seats_aero.api import Route, RouteCatalog
+from seats_aero.synthetic import generate_availabilities
+from seats_aero.table import (
+    _CODED_COLUMNS,
+    _ROW_COLUMNS,
+    AirlineVocabulary,
+    AvailabilityTable,
+    LegIndex,
+)
+
+
+def decoded(table: AvailabilityTable) -> Dict[str, np.ndarray]:
+    """Columns in ID order with codes replaced by their values."""
+    order = np.argsort(table.id, kind="stable")
+    columns = {}
+    for name in _ROW_COLUMNS:
+        column = getattr(table, name)[order]
+        if name in _CODED_COLUMNS:
+            column = getattr(table, _CODED_COLUMNS[name])[column]
+        columns[name] = column
+    return columns
+
+
+def assert_same_rows(a: AvailabilityTable, b: AvailabilityTable) -> None:
+    expected = decoded(b)
+    for name, column in decoded(a).items():
+        np.testing.assert_array_equal(column, expected[name], err_msg=name)
+
+
+def assert_same_index(index: LegIndex, table: AvailabilityTable) -> None:
+    rebuilt = LegIndex.build(table)
+    np.testing.assert_array_equal(index.keys, rebuilt.keys)
+    np.testing.assert_array_equal(index.offsets, rebuilt.offsets)
+    np.testing.assert_array_equal(index.date_keys, rebuilt.date_keys)
+    # rows of the same leg and day may come in any order
+    np.testing.assert_array_equal(np.sort(index.rows), np.arange(len(table)))
+    leg_keys = table.leg_keys()
+    np.testing.assert_array_equal(leg_keys[index.rows], leg_keys[rebuilt.rows])
+    np.testing.assert_array_equal(table.date[index.rows], table.date[rebuilt.rows])
+
+
+def refreshed(records: List[Dict], raw_routes: List[Dict]) -> List[Dict]:
+    """A later fetch of ``records``: some rows gone, some changed, some new, on a
+    route with airports and airlines the first fetch did not have."""
+    rng = random.Random(1)
+    update = [copy.copy(r) for r in records if rng.random() > 0.1]
+    for raw in update[:200]:
+        raw["ComputedLastSeen"] = "2024-02-01T00:00:00Z"
+        raw["JAvailable"] = True
+        raw["JAirlines"] = "QQ, UA"
+    added = list(generate_availabilities(raw_routes, 300, seed=9))
+    for i, raw in enumerate(added):
+        raw["ID"] = f"N{i:05d}"
+    added[0]["RouteID"] = "RNEW"
+    added[0]["YAvailable"] = True
+    added[0]["YAirlines"] = "ZZ"
+    return update + added
+
+
+def test_merge_matches_rebuild(raw_routes: List[Dict]) -> None:
+    new_route = dict(raw_routes[0], ID="RNEW", OriginAirport="ZZZ")
+    route_map = RouteCatalog.from_routes(
+        [Route.from_dict(r) for r in [*raw_routes, new_route]]
+    )
+    records = list(generate_availabilities(raw_routes, 3000, seed=1))
+    update = refreshed(records, raw_routes)
+
+    previous = AvailabilityTable.from_dicts(records, route_map)
+    previous.leg_index
+    previous.airline_vocabulary
+    merged = previous.merge(
+        AvailabilityTable.from_dicts(update, route_map), remove_missing=True
+    )
+    rebuilt = AvailabilityTable.from_dicts(update, route_map)
+
+    assert_same_rows(merged, rebuilt)
+    assert "leg_index" in merged.__dict__
+    assert_same_index(merged.leg_index, merged)
+    assert merged.legs() == rebuilt.legs()
+    vocabulary = merged.__dict__["airline_vocabulary"]
+    expected = AirlineVocabulary.build(merged.airline_strings.tolist())
+    assert vocabulary.airlines == expected.airlines
+    for airlines in [["QQ"], ["ZZ"], ["UA", "AC"]]:
+        np.testing.assert_array_equal(
+            vocabulary.matches(airlines), expected.matches(airlines)
+        )
+
+
+def test_merge_expires_rows(table: AvailabilityTable) -> None:
+    assert table.merge(table) is table
+
+    half = table.merge(table, expire_before=np.datetime64("2023-12-31T12:00:00"))
+    expected = table.computed_last_seen >= np.datetime64("2023-12-31T12:00:00")
+    assert len(half) == expected.sum()
+
+
+def test_unknown_routes_refresh_catalog(
+    raw_routes: List[Dict], route_map: RouteCatalog
+) -> None:
+    records = list(generate_availabilities(raw_routes, 2000, seed=2))
+    stale = RouteCatalog.from_routes([Route.from_dict(r) for r in raw_routes[:-10]])
+    refreshes = []
+
+    def refresh() -> RouteCatalog:
+        refreshes.append(True)
+        return route_map
+
+    refreshed = AvailabilityTable.from_dicts(records, stale, refresh_routes=refresh)
+    assert len(refreshes) == 1
+    assert_same_rows(refreshed, AvailabilityTable.from_dicts(records, route_map))
+
+    # routes still unknown after the refresh are skipped instead of failing
+    unknown = {r["ID"] for r in raw_routes[-10:]}
+    skipped = AvailabilityTable.from_dicts(records, stale, refresh_routes=lambda: stale)
+    expected = [r for r in records if r["RouteID"] not in unknown]
+    assert len(expected) < len(records)
+    assert_same_rows(skipped, AvailabilityTable.from_dicts(expected, stale))